@@ -0,0 +1,171 @@
+"""
+注入抖动基准测试
+在突发的 /api/touchpad 请求负载下，比较单进程与多进程注入模式的注入帧间隔抖动
+
+服务在独立进程中运行（使用空输入设备），负载由本进程的多个长连接客户端产生。
+注入帧间隔为相邻两次光标写入的时间差，理想值为 1 / INJECTION_FRAME_RATE；
+抖动为帧间隔与理想值之差的绝对值。
+
+用法:
+    python benchmarks/bench_injection_jitter.py [--clients 8] [--duration 3]
+"""
+
+import argparse
+import http.client
+import json
+import logging
+import multiprocessing
+import threading
+import time
+
+from common import install_null_controllers, summarize
+
+HOST = "127.0.0.1"
+
+# 超过该间隔（秒）的两次写入之间视为没有负载，不计入帧间隔
+IDLE_GAP = 0.05
+
+
+def serve(mode, port, ready, stop, results):
+    """在子进程中以指定注入模式运行服务，停止后回传注入时刻和调度统计"""
+    from bench_server_modes import start_werkzeug
+    from core.config import Config
+
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    Config.INJECTION_MODE = mode
+
+    injector = None
+    if mode == "process":
+        from services.injector_process import start_injector_process
+
+        injector = start_injector_process(input_backend="null", report_call_times=True)
+    else:
+        install_null_controllers()
+
+    from core.app import create_app
+
+    stop_server = start_werkzeug(create_app(), port)
+    ready.set()
+    stop.wait()
+    stop_server()
+
+    if injector is not None:
+        report = injector.stop(timeout=30)
+        call_times = report["call_times"]["mouse"]
+        injection_stats = report["injection_stats"]
+    else:
+        from handlers.touchpad import touchpad_service
+
+        touchpad_service.shutdown()
+        touchpad_service.injector.wait_idle()
+        call_times = list(touchpad_service.mouse_controller.call_times)
+        injection_stats = touchpad_service.input_scheduler.get_stats()
+
+    results.put({"call_times": call_times, "injection_stats": injection_stats})
+
+
+def run_client(port, client_id, deadline, burst, pause, counts):
+    conn = http.client.HTTPConnection(HOST, port)
+    headers = {"Content-Type": "application/json"}
+    touch = {"touch_id": f"bench_{client_id}", "touch_count": 1}
+    sent = 0
+
+    def post(payload):
+        conn.request("POST", "/api/touchpad", json.dumps(payload), headers)
+        conn.getresponse().read()
+
+    post({**touch, "action": "touch_start", "touches": [{"id": 0, "x": 0, "y": 0}]})
+    x = 0
+    while time.perf_counter() < deadline:
+        # 突发: 连续发送一组移动，然后短暂停顿
+        for _ in range(burst):
+            x = (x + 7) % 400
+            post(
+                {
+                    **touch,
+                    "action": "touch_move",
+                    "touches": [{"id": 0, "x": x, "y": x // 2}],
+                }
+            )
+            sent += 1
+        time.sleep(pause)
+    post({**touch, "action": "touch_end"})
+    conn.close()
+    counts.append(sent)
+
+
+def run_mode(mode, port, args):
+    context = multiprocessing.get_context("spawn")
+    ready, stop = context.Event(), context.Event()
+    results = context.Queue()
+    server = context.Process(target=serve, args=(mode, port, ready, stop, results))
+    server.start()
+    if not ready.wait(60):
+        server.terminate()
+        raise RuntimeError(f"{mode} 模式服务启动超时")
+
+    counts = []
+    deadline = time.perf_counter() + args.duration
+    clients = [
+        threading.Thread(
+            target=run_client,
+            args=(port, i, deadline, args.burst, args.pause / 1000, counts),
+        )
+        for i in range(args.clients)
+    ]
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+
+    stop.set()
+    result = results.get(timeout=60)
+    server.join(30)
+
+    stats = result["injection_stats"]
+    frame = stats["frame_interval_ms"] / 1000
+    times = result["call_times"]
+    intervals = [b - a for a, b in zip(times, times[1:]) if b - a <= IDLE_GAP]
+    jitter = [abs(interval - frame) for interval in intervals]
+
+    return {
+        "moves_sent": sum(counts),
+        "injections": len(times),
+        "frame_ms": round(frame * 1000, 3),
+        "interval_ms": summarize(intervals),
+        "jitter_ms": summarize(jitter),
+        "pending_latency_avg_ms": round(stats["avg_latency_ms"], 3),
+        "pending_latency_max_ms": round(stats["max_latency_ms"], 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, default=8, help="并发客户端数量")
+    parser.add_argument(
+        "--duration", type=float, default=3.0, help="每种模式的负载时长（秒）"
+    )
+    parser.add_argument("--burst", type=int, default=20, help="每次突发的移动事件数")
+    parser.add_argument("--pause", type=float, default=5.0, help="突发之间的停顿（毫秒）")
+    parser.add_argument("--port", type=int, default=18188, help="起始端口")
+    args = parser.parse_args()
+
+    results = {}
+    for offset, mode in enumerate(("thread", "process")):
+        results[mode] = run_mode(mode, args.port + offset, args)
+
+    print(
+        f"{'mode':<10}{'moves':>8}{'frames':>8}{'interval p50':>14}"
+        f"{'jitter p50':>12}{'jitter p99':>12}{'jitter max':>12}{'pending max':>13}"
+    )
+    for mode, result in results.items():
+        print(
+            f"{mode:<10}{result['moves_sent']:>8}{result['injections']:>8}"
+            f"{result['interval_ms']['p50']:>14}{result['jitter_ms']['p50']:>12}"
+            f"{result['jitter_ms']['p99']:>12}{result['jitter_ms']['max']:>12}"
+            f"{result['pending_latency_max_ms']:>13}"
+        )
+
+
+if __name__ == "__main__":
+    main()
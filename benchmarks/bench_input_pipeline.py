@@ -0,0 +1,295 @@
+"""
+输入管线延迟基准测试
+把录制的触摸板和键盘事件流经不同传输方式回放到空输入设备，统计各阶段延迟、吞吐量和内存分配
+
+阶段划分（毫秒）:
+    transport  请求发出到进入处理函数（请求解析、路由、解码）
+    dispatch   处理函数内的服务逻辑
+    response   处理函数返回到请求结束（响应序列化）
+    inject     进入处理函数到设备控制器被调用（注入队列和按帧合并），
+               只统计会直接产生注入的事件
+
+用法:
+    python benchmarks/bench_input_pipeline.py [--speed 0] [--repeat 3] [--output PATH]
+"""
+
+import argparse
+import bisect
+import glob
+import json
+import os
+import time
+import tracemalloc
+from unittest.mock import patch
+
+from common import (
+    BENCHMARKS_DIR,
+    install_null_controllers,
+    load_trace,
+    summarize,
+    write_results,
+)
+
+TRACES_DIR = os.path.join(BENCHMARKS_DIR, "traces")
+DEFAULT_OUTPUT = os.path.join(BENCHMARKS_DIR, "results", "input_pipeline.json")
+
+# 会直接产生设备注入的操作，只有这些事件统计 inject 阶段
+INJECTING_ACTIONS = {"touch_move", "scroll", "press", "release", "type", "hotkey"}
+
+# batch 传输按浏览器动画帧（约 16ms）分组
+FRAME_MS = 16
+
+
+class Probe:
+    """按事件顺序记录各阶段时间点"""
+
+    def __init__(self):
+        self.records = []
+        self._next = 0
+
+    def begin(self, events):
+        now = time.perf_counter()
+        records = [{"action": e["action"], "request_start": now} for e in events]
+        self.records.extend(records)
+        return records
+
+    def end(self, records):
+        now = time.perf_counter()
+        for record in records:
+            record["request_end"] = now
+
+    def instrument(self, dispatch):
+        def wrapper(data):
+            record = self.records[self._next]
+            self._next += 1
+            record["dispatch_start"] = time.perf_counter()
+            try:
+                return dispatch(data)
+            finally:
+                record["dispatch_end"] = time.perf_counter()
+
+        return wrapper
+
+
+def to_payload(event, keep_channel=True):
+    payload = {k: v for k, v in event.items() if k != "t"}
+    payload["timestamp"] = event["t"]
+    if not keep_channel:
+        payload.pop("channel", None)
+    return payload
+
+
+def send_http(client, events):
+    for event in events:
+        client.post(f"/api/{event['channel']}", json=to_payload(event, False))
+
+
+def send_batch(client, events):
+    client.post("/api/batch", json={"events": [to_payload(e) for e in events]})
+
+
+def send_stream_text(client, events):
+    from handlers.stream import process_stream_message
+
+    for event in events:
+        process_stream_message(json.dumps(to_payload(event)))
+
+
+def send_stream_binary(client, events):
+    from handlers.stream import process_stream_message
+    from utils.wire_format import encode_packet
+
+    for event in events:
+        process_stream_message(encode_packet([to_payload(event)]))
+
+
+# 传输方式名称 -> (发送函数, 是否按帧分组)
+TRANSPORTS = {
+    "http": (send_http, False),
+    "batch": (send_batch, True),
+    "stream_text": (send_stream_text, False),
+    "stream_binary": (send_stream_binary, False),
+}
+
+
+def group_events(events, by_frame):
+    if not by_frame:
+        return [[event] for event in events]
+
+    groups = []
+    current_frame = None
+    for event in events:
+        frame = event["t"] // FRAME_MS
+        if frame != current_frame:
+            groups.append([])
+            current_frame = frame
+        groups[-1].append(event)
+    return groups
+
+
+def settle():
+    """等待定时注入和注入队列全部执行完毕"""
+    from utils.input_worker import get_input_worker
+
+    # 最后一帧和插值中的位移由定时器线程注入
+    time.sleep(0.2)
+    get_input_worker().wait_idle(2.0)
+
+
+def replay(client, events, transport, speed, probe=None):
+    """
+    回放一次事件流
+
+    Args:
+        client: Flask 测试客户端
+        events: 录制的事件列表
+        transport: 传输方式名称
+        speed: 回放倍速，0 表示不等待尽快发送
+        probe: 阶段计时探针，为None时不计时
+
+    Returns:
+        float: 发送全部事件耗时（秒）
+    """
+    send, by_frame = TRANSPORTS[transport]
+    start = time.perf_counter()
+
+    for group in group_events(events, by_frame):
+        if speed > 0:
+            delay = start + group[0]["t"] / 1000.0 / speed - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+        records = probe.begin(group) if probe else None
+        send(client, group)
+        if probe:
+            probe.end(records)
+
+    return time.perf_counter() - start
+
+
+def collect_stages(records, call_times):
+    stages = {"transport": [], "dispatch": [], "response": [], "inject": []}
+
+    for record in records:
+        if "dispatch_start" not in record:
+            continue
+        stages["transport"].append(record["dispatch_start"] - record["request_start"])
+        stages["dispatch"].append(record["dispatch_end"] - record["dispatch_start"])
+        stages["response"].append(record["request_end"] - record["dispatch_end"])
+
+        if record["action"] in INJECTING_ACTIONS:
+            index = bisect.bisect_left(call_times, record["dispatch_start"])
+            if index < len(call_times):
+                stages["inject"].append(call_times[index] - record["dispatch_start"])
+
+    return {name: summarize(samples) for name, samples in stages.items()}
+
+
+def run_transport(client, controllers, events, transport, speed, repeat):
+    import handlers.keyboard as keyboard_handler
+    import handlers.touchpad as touchpad_handler
+    from handlers.batch import BATCH_DISPATCHERS
+    from handlers.stream import STREAM_DISPATCHERS
+
+    probe = Probe()
+    dispatchers = {
+        "touchpad": probe.instrument(touchpad_handler.dispatch_touchpad_action),
+        "keyboard": probe.instrument(keyboard_handler.dispatch_keyboard_action),
+    }
+    for controller in controllers:
+        controller.call_times.clear()
+
+    elapsed = 0.0
+    with patch.object(
+        touchpad_handler, "dispatch_touchpad_action", dispatchers["touchpad"]
+    ), patch.object(
+        keyboard_handler, "dispatch_keyboard_action", dispatchers["keyboard"]
+    ), patch.dict(BATCH_DISPATCHERS, dispatchers), patch.dict(
+        STREAM_DISPATCHERS, dispatchers
+    ):
+        for _ in range(repeat):
+            elapsed += replay(client, events, transport, speed, probe)
+            settle()
+
+    call_times = sorted(t for c in controllers for t in c.call_times)
+    processed = repeat * len(events)
+
+    # 内存分配单独回放一次统计，避免 tracemalloc 的开销影响计时
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    replay(client, events, transport, speed)
+    settle()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+
+    return {
+        "events": processed,
+        "events_per_sec": int(processed / elapsed) if elapsed else 0,
+        "controller_calls": len(call_times),
+        "stages_ms": collect_stages(probe.records, call_times),
+        "alloc": {
+            "peak_kib": round(peak / 1024, 1),
+            "retained_blocks": retained,
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--speed", type=float, default=0, help="回放倍速，0 表示不等待尽快发送"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="每条事件流的回放次数")
+    parser.add_argument(
+        "--transport",
+        action="append",
+        choices=sorted(TRANSPORTS),
+        help="只测试指定传输方式，可重复",
+    )
+    parser.add_argument("--trace", action="append", help="事件流文件，默认 traces/*.jsonl")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="结果文件路径")
+    args = parser.parse_args()
+
+    controllers = install_null_controllers()
+    from core.app import create_app
+    from core.config import TOUCHPAD_CONFIG
+
+    client = create_app().test_client()
+    traces = args.trace or sorted(glob.glob(os.path.join(TRACES_DIR, "*.jsonl")))
+    transports = args.transport or list(TRANSPORTS)
+
+    results = {
+        "config": {
+            "speed": args.speed,
+            "repeat": args.repeat,
+            "injection_frame_rate": TOUCHPAD_CONFIG["INJECTION_FRAME_RATE"],
+        },
+        "traces": {},
+    }
+
+    for path in traces:
+        name = os.path.splitext(os.path.basename(path))[0]
+        events = load_trace(path)
+        results["traces"][name] = {}
+        for transport in transports:
+            result = run_transport(
+                client, controllers, events, transport, args.speed, args.repeat
+            )
+            results["traces"][name][transport] = result
+            stages = result["stages_ms"]
+            print(
+                f"{name:<18}{transport:<15}{result['events_per_sec']:>9} ev/s"
+                f"  dispatch p99 {stages['dispatch']['p99']:>7.3f}ms"
+                f"  inject p99 {stages['inject']['p99']:>7.3f}ms"
+                f"  retained {result['alloc']['retained_blocks']:>6}"
+            )
+
+    write_results(args.output, results)
+    print(f"结果已写入 {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+服务模式基准测试
+比较 Werkzeug 开发服务器与 ASGI (uvicorn) 模式下 /api/touchpad 的吞吐量和延迟
+
+用法:
+    python benchmarks/bench_server_modes.py [--clients 8] [--requests 500]
+"""
+
+import argparse
+import http.client
+import json
+import logging
+import threading
+import time
+
+from common import install_null_controllers, percentile
+
+HOST = "127.0.0.1"
+
+
+def start_werkzeug(app, port):
+    from werkzeug.serving import WSGIRequestHandler, make_server
+
+    # 与 app.run(threaded=True) 一致，但启用 HTTP/1.1 以便比较长连接
+    WSGIRequestHandler.protocol_version = "HTTP/1.1"
+    server = make_server(HOST, port, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    def stop():
+        server.shutdown()
+        thread.join()
+
+    return stop
+
+
+def start_asgi(app, port):
+    import uvicorn
+
+    from core.asgi import create_asgi_app
+    from core.config import Config
+
+    config = uvicorn.Config(
+        create_asgi_app(app),
+        host=HOST,
+        port=port,
+        log_level="warning",
+        timeout_keep_alive=Config.KEEP_ALIVE_TIMEOUT,
+    )
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+
+    def stop():
+        server.should_exit = True
+        thread.join()
+
+    return stop
+
+
+def run_client(port, client_id, requests, latencies):
+    conn = http.client.HTTPConnection(HOST, port)
+    headers = {"Content-Type": "application/json"}
+    touch_id = f"bench_{client_id}"
+
+    def post(payload):
+        body = json.dumps(payload)
+        start = time.perf_counter()
+        conn.request("POST", "/api/touchpad", body, headers)
+        response = conn.getresponse()
+        response.read()
+        return time.perf_counter() - start
+
+    post(
+        {
+            "action": "touch_start",
+            "touch_id": touch_id,
+            "touch_count": 1,
+            "touches": [{"id": 0, "x": 0, "y": 0}],
+        }
+    )
+    for i in range(requests):
+        latencies.append(
+            post(
+                {
+                    "action": "touch_move",
+                    "touch_id": touch_id,
+                    "touch_count": 1,
+                    "touches": [{"id": 0, "x": i % 100, "y": i % 50}],
+                    "timestamp": i,
+                }
+            )
+        )
+    post({"action": "touch_end", "touch_id": touch_id, "touch_count": 1})
+    conn.close()
+
+
+def run_load(port, clients, requests):
+    latencies = []
+    threads = [
+        threading.Thread(target=run_client, args=(port, i, requests, latencies))
+        for i in range(clients)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "requests": len(latencies),
+        "requests_per_sec": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, default=8, help="并发客户端数量")
+    parser.add_argument("--requests", type=int, default=500, help="每个客户端的请求数")
+    parser.add_argument("--port", type=int, default=18088, help="起始端口")
+    args = parser.parse_args()
+
+    # 关闭逐请求访问日志，避免日志输出影响测量结果
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    install_null_controllers()
+    from core.app import create_app
+
+    app = create_app()
+    results = {}
+
+    for offset, (mode, starter) in enumerate(
+        [("werkzeug", start_werkzeug), ("asgi", start_asgi)]
+    ):
+        port = args.port + offset
+        stop = starter(app, port)
+        try:
+            results[mode] = run_load(port, args.clients, args.requests)
+        finally:
+            stop()
+
+    print(f"{'mode':<10}{'requests':>10}{'req/s':>12}{'p50 ms':>10}{'p99 ms':>10}")
+    for mode, result in results.items():
+        print(
+            f"{mode:<10}{result['requests']:>10}{result['requests_per_sec']:>12}"
+            f"{result['p50_ms']:>10}{result['p99_ms']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+基准测试公共模块
+提供事件流读写和统计工具，配合空输入设备控制器，基准测试无需图形界面即可运行
+"""
+
+import json
+import os
+import sys
+
+# 基准测试不注入真实输入，使用 pynput 的 dummy 后端以便在无显示环境下导入
+os.environ.setdefault("PYNPUT_BACKEND", "dummy")
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(BENCHMARKS_DIR, "..", "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from utils.null_controller import install_null_controllers  # noqa: E402,F401
+
+
+def percentile(samples, fraction):
+    """
+    计算分位数（最近秩法）
+
+    Args:
+        samples: 样本列表
+        fraction: 分位，0-1
+
+    Returns:
+        float: 分位数，没有样本时返回0
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+
+def summarize(samples, scale=1000.0):
+    """
+    汇总延迟样本
+
+    Args:
+        samples: 以秒为单位的样本列表
+        scale: 输出单位换算系数，默认换算为毫秒
+
+    Returns:
+        dict: 样本数、均值、p50、p99 和最大值
+    """
+    if not samples:
+        return {"count": 0, "mean": 0.0, "p50": 0.0, "p99": 0.0, "max": 0.0}
+    return {
+        "count": len(samples),
+        "mean": round(sum(samples) / len(samples) * scale, 4),
+        "p50": round(percentile(samples, 0.50) * scale, 4),
+        "p99": round(percentile(samples, 0.99) * scale, 4),
+        "max": round(max(samples) * scale, 4),
+    }
+
+
+def load_trace(path):
+    """
+    读取录制的事件流
+
+    每行一个 JSON 事件，"t" 为相对录制开始的毫秒数，
+    "channel" 选择 touchpad 或 keyboard，其余字段与对应接口的请求数据相同。
+
+    Args:
+        path: 事件流文件路径
+
+    Returns:
+        list: 事件列表
+    """
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def write_results(path, results):
+    """
+    以稳定格式写入结果（键排序、缩进），便于在代码评审中比较差异
+
+    Args:
+        path: 输出文件路径
+        results: 结果字典
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write("\n")
@@ -28,8 +28,11 @@ def create_app():
     CORS(app)
 
     # 注册蓝图
+    from handlers.batch import batch_bp
     from handlers.keyboard import keyboard_bp
     from handlers.main import main_bp
+    from handlers.metrics import metrics_bp
+    from handlers.stream import stream_bp
     from handlers.system import system_bp
     from handlers.touchpad import touchpad_bp
 
@@ -37,5 +40,14 @@ def create_app():
     app.register_blueprint(keyboard_bp)
     app.register_blueprint(touchpad_bp)
     app.register_blueprint(system_bp)
+    app.register_blueprint(stream_bp)
+    app.register_blueprint(batch_bp)
+    app.register_blueprint(metrics_bp)
+
+    # 录制输入会话
+    if Config.SESSION_RECORD_DIR:
+        from utils.session_log import start_session_recording
+
+        start_session_recording(Config.SESSION_RECORD_DIR)
 
     return app
@@ -0,0 +1,111 @@
+"""
+ASGI服务模块
+在异步事件循环上运行同一套蓝图和服务，并原生处理WebSocket输入流
+"""
+
+import asyncio
+import json
+import logging
+from urllib.parse import parse_qs
+
+from core.config import Config
+
+logger = logging.getLogger(__name__)
+
+INPUT_STREAM_PATH = "/ws/input"
+
+
+def create_asgi_app(flask_app):
+    """
+    将Flask应用包装为ASGI应用
+
+    HTTP请求经 a2wsgi 转交给线程池中的Flask蓝图处理；
+    /ws/input 的连接由事件循环维护，流消息在线程池中处理：服务加锁、会话录制写盘和
+    多进程模式下等待缓冲区都会阻塞，不能占用事件循环上的其他连接。
+    同一连接逐条等待处理完成，事件顺序不变。
+
+    Args:
+        flask_app: create_app() 创建的Flask应用
+
+    Returns:
+        callable: ASGI应用
+    """
+    from a2wsgi import WSGIMiddleware
+
+    from handlers.stream import process_stream_message, resolve_client_id
+
+    wsgi_app = WSGIMiddleware(flask_app, workers=Config.ASGI_WSGI_WORKERS)
+
+    async def input_stream(scope, receive, send):
+        message = await receive()
+        if message["type"] != "websocket.connect":
+            return
+        await send({"type": "websocket.accept"})
+
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        client_id = resolve_client_id(query.get("client", [None])[0])
+        logger.info(f"输入流连接已建立: {client_id}")
+
+        while True:
+            message = await receive()
+            if message["type"] == "websocket.disconnect":
+                break
+
+            data = message.get("bytes")
+            if data is None:
+                data = message.get("text")
+
+            response = await asyncio.get_running_loop().run_in_executor(
+                None, process_stream_message, data, client_id
+            )
+            if response is not None:
+                await send(
+                    {
+                        "type": "websocket.send",
+                        "text": json.dumps(response, ensure_ascii=False),
+                    }
+                )
+
+    async def app(scope, receive, send):
+        if scope["type"] == "websocket":
+            if scope["path"] == INPUT_STREAM_PATH:
+                await input_stream(scope, receive, send)
+            else:
+                await send({"type": "websocket.close", "code": 1000})
+        elif scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        else:
+            await wsgi_app(scope, receive, send)
+
+    return app
+
+
+def run_asgi_server(flask_app, host=None, port=None):
+    """
+    使用 uvicorn 启动ASGI服务
+
+    Args:
+        flask_app: Flask应用
+        host: 监听地址，默认为 Config.HOST
+        port: 监听端口，默认为 Config.PORT
+    """
+    try:
+        import uvicorn
+    except ImportError as e:
+        raise RuntimeError(
+            "ASGI模式需要安装可选依赖: pip install remote-controller[asgi]"
+        ) from e
+
+    uvicorn.run(
+        create_asgi_app(flask_app),
+        host=host or Config.HOST,
+        port=port or Config.PORT,
+        log_level=Config.ASGI_LOG_LEVEL,
+        timeout_keep_alive=Config.KEEP_ALIVE_TIMEOUT,
+    )
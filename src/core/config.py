@@ -18,20 +18,155 @@ class Config:
     PORT = 8088
     LOGGER_LEVEL = logging.INFO
 
+    # 服务模式: "werkzeug" 为Flask开发服务器，"asgi" 为uvicorn事件循环（需安装asgi可选依赖）
+    SERVER_MODE = "werkzeug"
+    ASGI_LOG_LEVEL = "warning"
+    KEEP_ALIVE_TIMEOUT = 30
+    # ASGI模式下执行Flask视图的线程数
+    ASGI_WSGI_WORKERS = 16
+
+    # /api/batch 单次请求允许的最大事件数
+    MAX_BATCH_EVENTS = 256
+
+    # 屏幕尺寸缓存有效期（秒），过期后重新检测
+    SCREEN_SIZE_CACHE_TTL = 60
+
+    # 是否采集运行指标（/metrics），关闭时热路径只多一次属性判断
+    METRICS_ENABLED = False
+
+    # 输入会话录制目录，设置后每次启动把收到的触摸板和键盘事件录制到新文件
+    SESSION_RECORD_DIR = None
+
+    # 输入后端: "pynput" 为默认后端，"uinput" 为 Linux 内核虚拟设备（需安装uinput可选依赖），
+    # "null"/"recording" 不产生真实输入，用于基准测试和调试
+    INPUT_BACKEND = "pynput"
+
+    # 注入模式: "thread" 在Web进程内注入，"process" 由独立进程注入，
+    # Web进程把事件写入共享内存环形缓冲区（字节数），缓冲区满时最多等待（秒）；
+    # 触摸结束、快捷键等需要结果的调用最多等待注入进程回传结果（秒）
+    INJECTION_MODE = "thread"
+    INJECTOR_RING_SIZE = 1 << 20
+    INJECTOR_SUBMIT_TIMEOUT = 0.05
+    INJECTOR_REPLY_TIMEOUT = 0.5
+
+
+# 各系统的三指轻扫快捷键：左右切换虚拟桌面，Windows 上为任务视图/显示桌面，
+# macOS 上为调度中心/应用程序窗口；Linux 桌面环境的快捷键各不相同，只绑定工作区切换
+SWIPE_HOTKEYS_BY_PLATFORM = {
+    "Windows": {
+        "left": ["ctrl", "win", "right"],
+        "right": ["ctrl", "win", "left"],
+        "up": ["win", "tab"],
+        "down": ["win", "d"],
+    },
+    "Darwin": {
+        "left": ["ctrl", "right"],
+        "right": ["ctrl", "left"],
+        "up": ["ctrl", "up"],
+        "down": ["ctrl", "down"],
+    },
+    "Linux": {
+        "left": ["ctrl", "alt", "right"],
+        "right": ["ctrl", "alt", "left"],
+    },
+}
 
 # 触摸板配置
 TOUCHPAD_CONFIG = {
-    "CLICK_DELAY": 0.15,
-    "DOUBLE_CLICK_TIME": 0.3,
+    # 按住不超过 TAP_MAX_DURATION 秒、移动不超过 MOVE_THRESHOLD 的触摸抬起时立即点击；
+    # 点击后 TAP_DRAG_WINDOW 秒内再次按下并移动为点击拖拽，0 为关闭
+    "TAP_MAX_DURATION": 0.3,
+    "TAP_DRAG_WINDOW": 0.2,
     "MOVE_THRESHOLD": 5,
     "CURSOR_SENSITIVITY": 2.0,
     "SCROLL_SENSITIVITY": 0.1,
+    "WHEEL_SENSITIVITY": 0.01,
+    # 每格滚动可细分的后端单位数，None 为按鼠标后端自动检测（Windows 为 120，其余为 1）
+    "SCROLL_RESOLUTION": None,
+    "INJECTION_FRAME_RATE": 120,
+    "CURSOR_RESYNC_INTERVAL": 0.5,
+    # 惯性滚动：松手后按抛掷速度继续滚动，速度按时间常数（秒）指数衰减
+    "KINETIC_SCROLL": True,
+    "KINETIC_TICK_RATE": 60,
+    "KINETIC_TIME_CONSTANT": 0.325,
+    # 速度单位为滚动单位/秒；松手前该时间窗口（秒）内的增量用于估计抛掷速度
+    "KINETIC_START_VELOCITY": 5.0,
+    "KINETIC_STOP_VELOCITY": 0.5,
+    "KINETIC_VELOCITY_WINDOW": 0.1,
+    # 客户端会话空闲超时（秒）和最多保留的会话数，超出后清理最久未使用的会话
+    "SESSION_IDLE_TIMEOUT": 300,
+    "MAX_SESSIONS": 32,
+    # 运动插值：客户端采样间隔（秒）超过 PASSTHROUGH 时按显示帧率插值注入，
+    # 超过 MAX 的间隔视为停顿不参与估计；速度经 One Euro 滤波（截止频率 Hz）
+    "MOTION_UPSAMPLING": True,
+    "UPSAMPLE_PASSTHROUGH_INTERVAL": 0.02,
+    "UPSAMPLE_MAX_INTERVAL": 0.1,
+    "UPSAMPLE_MIN_CUTOFF": 5.0,
+    "UPSAMPLE_BETA": 0.01,
+    # 多点手势：双指张开距离变化超过 PINCH_THRESHOLD（客户端像素）且大于质心位移时为缩放，
+    # 张开比例每变化 PINCH_ZOOM_STEP 倍注入一格 Ctrl+滚轮；三指质心位移超过 SWIPE_DISTANCE
+    # 为一次轻扫。THREE_FINGER_GESTURE 默认为 "drag"，三指按住左键拖拽；设为 "swipe" 时
+    # 三指轻扫执行 SWIPE_HOTKEYS 中的快捷键，默认按当前系统选择，没有绑定的方向不执行
+    "PINCH_THRESHOLD": 12,
+    "PINCH_ZOOM_STEP": 1.2,
+    "SWIPE_DISTANCE": 60,
+    "THREE_FINGER_GESTURE": "drag",
+    "SWIPE_HOTKEYS": SWIPE_HOTKEYS_BY_PLATFORM.get(platform.system(), {}),
+    # 默认指针加速配置，触摸开始事件可通过 acceleration 字段按名称或字典另行指定
+    "ACCELERATION_PROFILE": "linear",
+}
+
+# 指针加速配置，速度单位为客户端像素/秒，gain 为光标位移倍数
+POINTER_ACCELERATION_PROFILES = {
+    # 与速度无关的固定倍数
+    "linear": {"type": "flat", "gain": TOUCHPAD_CONFIG["CURSOR_SENSITIVITY"]},
+    # 超过阈值后倍数随速度线性增长
+    "adaptive": {
+        "type": "adaptive",
+        "base_gain": 1.5,
+        "max_gain": 6.0,
+        "threshold": 150,
+        "accel": 0.004,
+    },
+    # 类似桌面系统的分段加速曲线
+    "desktop": {
+        "type": "table",
+        "points": [(0, 1.0), (100, 1.5), (400, 2.5), (1200, 4.5), (3000, 7.0)],
+    },
 }
 
 # 键盘操作配置
 KEYBOARD_CONFIG = {
     "HOTKEY_PRESS_INTERVAL": 0.1,
     "HOTKEY_RELEASE_INTERVAL": 0.1,
+    "HOTKEY_DEFAULT_PROFILE": "default",
+}
+
+# 快捷键时序配置（秒），请求中可通过 profile 字段按名称选择
+HOTKEY_PROFILES = {
+    "default": {
+        "press_interval": KEYBOARD_CONFIG["HOTKEY_PRESS_INTERVAL"],
+        "release_interval": KEYBOARD_CONFIG["HOTKEY_RELEASE_INTERVAL"],
+    },
+    "fast": {"press_interval": 0.02, "release_interval": 0.02},
+    "instant": {"press_interval": 0, "release_interval": 0},
+}
+
+# 事件追踪配置
+TRACE_CONFIG = {
+    # 只记录不低于该级别的事件，默认关闭调试事件
+    "LEVEL": logging.WARNING,
+    # 高频事件（触摸移动、滚动）的采样率，1.0 为全部记录
+    "SAMPLE_RATE": 1.0,
+    # 环形缓冲区可保留的记录数
+    "CAPACITY": 8192,
+    # 导出文件路径，配置后在进程退出时自动导出
+    "DUMP_PATH": None,
+}
+
+# 输入注入线程配置
+INPUT_WORKER_CONFIG = {
+    "MAX_QUEUE_SIZE": 256,
 }
 
 # Windows系统键位映射
@@ -3,9 +3,21 @@
 包含所有API路由处理器
 """
 
+from .batch import batch_bp
 from .keyboard import keyboard_bp
 from .main import main_bp
+from .metrics import metrics_bp
+from .stream import stream_bp
 from .system import system_bp
 from .touchpad import touchpad_bp
 
-__all__ = ["main_bp", "keyboard_bp", "mouse_bp", "touchpad_bp", "system_bp"]
+__all__ = [
+    "main_bp",
+    "keyboard_bp",
+    "mouse_bp",
+    "touchpad_bp",
+    "system_bp",
+    "stream_bp",
+    "batch_bp",
+    "metrics_bp",
+]
@@ -0,0 +1,105 @@
+"""
+批量事件处理器模块
+在一个HTTP请求中按顺序执行多个键盘和触摸板操作
+"""
+
+from flask import Blueprint, jsonify, request
+
+from core.config import Config
+from handlers.keyboard import dispatch_keyboard_action
+from handlers.touchpad import coalesce_touch_moves, dispatch_touchpad_action
+
+batch_bp = Blueprint("batch", __name__)
+
+# 事件通道到处理函数的映射
+BATCH_DISPATCHERS = {
+    "touchpad": dispatch_touchpad_action,
+    "keyboard": dispatch_keyboard_action,
+}
+
+
+def process_batch(events):
+    """
+    按顺序执行一批事件
+
+    每个事件的 "channel" 字段选择 touchpad（默认）或 keyboard 通道，
+    其余字段（包括客户端 timestamp）原样交给对应的处理函数。
+    单个事件失败不会中断后续事件；响应只包含失败事件和携带 "seq" 字段的事件结果。
+    连续的同一触摸的移动事件合并后一次处理，合并的事件失败时按原事件数计入失败数，
+    错误的 index 为其中第一个事件的位置。
+
+    Args:
+        events: 事件列表
+
+    Returns:
+        dict: 汇总结果
+    """
+    results = []
+    errors = []
+    failed = 0
+    position = 0
+
+    for event, count in coalesce_touch_moves(events):
+        index = position
+        position += count
+
+        if not isinstance(event, dict):
+            errors.append({"index": index, "message": "无效的事件数据"})
+            failed += count
+            continue
+
+        dispatcher = BATCH_DISPATCHERS.get(event.get("channel", "touchpad"))
+        if dispatcher is None:
+            errors.append(
+                {"index": index, "message": f"不支持的通道: {event.get('channel')}"}
+            )
+            failed += count
+            continue
+
+        try:
+            result, _ = dispatcher(event)
+        except Exception as e:
+            result = {"status": "error", "message": f"批量事件处理失败: {str(e)}"}
+
+        if result.get("status") != "success":
+            errors.append({"index": index, "message": result.get("message")})
+            failed += count
+        elif "seq" in event:
+            results.append({"seq": event["seq"], **result})
+
+    response = {
+        "status": "success" if not errors else "partial",
+        "processed": len(events) - failed,
+        "failed": failed,
+    }
+    if errors:
+        response["errors"] = errors
+    if results:
+        response["results"] = results
+    return response
+
+
+@batch_bp.route("/api/batch", methods=["POST"])
+def handle_batch():
+    """处理批量事件请求"""
+    try:
+        data = request.get_json()
+        events = data.get("events") if isinstance(data, dict) else data
+        if not isinstance(events, list) or not events:
+            return jsonify({"status": "error", "message": "无效的请求数据"}), 400
+
+        if len(events) > Config.MAX_BATCH_EVENTS:
+            return (
+                jsonify(
+                    {
+                        "status": "error",
+                        "message": f"单次最多提交 {Config.MAX_BATCH_EVENTS} 个事件",
+                    }
+                ),
+                400,
+            )
+
+        return jsonify(process_batch(events))
+
+    except Exception as e:
+        return jsonify({"status": "error", "message": f"批量操作失败: {str(e)}"}), 500
@@ -5,62 +5,99 @@
 
 from flask import Blueprint, jsonify, request
 
+from core.config import Config
 from services.keyboard_service import KeyboardService
+from utils.metrics import instrument_dispatch
+from utils.session_log import record_events
 
 keyboard_bp = Blueprint("keyboard", __name__)
-keyboard_service = KeyboardService()
 
+if Config.INJECTION_MODE == "process":
+    from services.injector_process import RemoteKeyboardService, get_injector_process
 
-@keyboard_bp.route("/api/keyboard", methods=["POST"])
-def handle_keyboard():
-    """处理键盘操作请求"""
-    try:
-        data = request.get_json()
-        if not data:
-            return jsonify({"status": "error", "message": "无效的请求数据"}), 400
+    keyboard_service = RemoteKeyboardService(get_injector_process())
+else:
+    keyboard_service = KeyboardService()
+
+
+@instrument_dispatch(
+    "keyboard", ("press", "release", "type", "hotkey", "hotkey_status")
+)
+@record_events("keyboard")
+def dispatch_keyboard_action(data):
+    """
+    分发键盘操作，供HTTP接口和输入流共用
+
+    Args:
+        data: 键盘事件数据
+
+    Returns:
+        tuple: (响应数据, HTTP状态码)
+    """
+    action = data.get("action")
+
+    if action == "press":
+        key = data.get("key")
+        if not key:
+            return {"status": "error", "message": "缺少按键参数"}, 400
 
-        action = data.get("action")
+        keyboard_service.press_key(key)
+        return {"status": "success", "message": f"按键 {key} 已按下"}, 200
 
-        if action == "press":
-            key = data.get("key")
-            if not key:
-                return jsonify({"status": "error", "message": "缺少按键参数"}), 400
+    elif action == "release":
+        key = data.get("key")
+        if not key:
+            return {"status": "error", "message": "缺少按键参数"}, 400
 
-            keyboard_service.press_key(key)
-            return jsonify({"status": "success", "message": f"按键 {key} 已按下"})
+        keyboard_service.release_key(key)
+        return {"status": "success", "message": f"按键 {key} 已释放"}, 200
 
-        elif action == "release":
-            key = data.get("key")
-            if not key:
-                return jsonify({"status": "error", "message": "缺少按键参数"}), 400
+    elif action == "type":
+        text = data.get("text")
+        if not text:
+            return {"status": "error", "message": "缺少文本参数"}, 400
 
-            keyboard_service.release_key(key)
-            return jsonify({"status": "success", "message": f"按键 {key} 已释放"})
+        keyboard_service.type_text(text)
+        return {"status": "success", "message": f"文本已输入: {text}"}, 200
 
-        elif action == "type":
-            text = data.get("text")
-            if not text:
-                return jsonify({"status": "error", "message": "缺少文本参数"}), 400
+    elif action == "hotkey":
+        keys = data.get("keys")
+        if not keys or not isinstance(keys, list):
+            return {"status": "error", "message": "缺少或无效的按键组合参数"}, 400
 
-            keyboard_service.type_text(text)
-            return jsonify({"status": "success", "message": f"文本已输入: {text}"})
+        try:
+            job = keyboard_service.execute_hotkey(keys, data.get("profile"))
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}, 400
 
-        elif action == "hotkey":
-            keys = data.get("keys")
-            if not keys or not isinstance(keys, list):
-                return jsonify(
-                    {"status": "error", "message": "缺少或无效的按键组合参数"}
-                ), 400
+        return {
+            "status": "success",
+            "message": f"快捷键组合已提交: {keys}",
+            "job_id": job.job_id,
+        }, 200
 
-            keyboard_service.execute_hotkey(keys)
-            return jsonify(
-                {"status": "success", "message": f"快捷键组合已执行: {keys}"}
-            )
+    elif action == "hotkey_status":
+        job_id = data.get("job_id")
+        status = keyboard_service.get_hotkey_status(job_id)
+        if status is None:
+            return {"status": "error", "message": f"快捷键任务不存在: {job_id}"}, 404
+
+        return {"status": "success", "hotkey": status}, 200
+
+    else:
+        return {"status": "error", "message": f"不支持的操作: {action}"}, 400
+
+
+@keyboard_bp.route("/api/keyboard", methods=["POST"])
+def handle_keyboard():
+    """处理键盘操作请求"""
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({"status": "error", "message": "无效的请求数据"}), 400
 
-        else:
-            return jsonify(
-                {"status": "error", "message": f"不支持的操作: {action}"}
-            ), 400
+        result, status_code = dispatch_keyboard_action(data)
+        return jsonify(result), status_code
 
     except Exception as e:
         return jsonify({"status": "error", "message": f"键盘操作失败: {str(e)}"}), 500
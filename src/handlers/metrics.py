@@ -0,0 +1,67 @@
+"""
+运行指标处理器模块
+以 Prometheus 文本格式导出运行指标，并统计每个蓝图的HTTP请求
+"""
+
+import time
+
+from flask import Blueprint, Response, g, request
+
+from utils.input_worker import get_input_worker
+from utils.metrics import metrics
+from utils.timer_scheduler import get_timer_scheduler
+
+metrics_bp = Blueprint("metrics", __name__)
+
+
+def collect_queue_gauges():
+    """
+    抓取时读取注入队列和定时器的当前状态
+
+    Returns:
+        list: [(名称, 标签字典, 数值), ...]
+    """
+    worker_stats = get_input_worker().get_stats()
+    timer_stats = get_timer_scheduler().get_stats()
+    return [
+        ("remote_injection_queue_depth", {}, worker_stats["depth"]),
+        ("remote_injection_queue_max_depth", {}, worker_stats["max_depth"]),
+        ("remote_injection_dropped", {}, worker_stats["dropped"]),
+        ("remote_timer_pending", {}, timer_stats["pending"]),
+    ]
+
+
+metrics.register_collector(collect_queue_gauges)
+
+
+@metrics_bp.before_app_request
+def start_request_timer():
+    """记录请求开始时间"""
+    if metrics.enabled:
+        g.metrics_request_start = time.perf_counter()
+
+
+@metrics_bp.after_app_request
+def record_request(response):
+    """统计请求次数和耗时"""
+    start = g.pop("metrics_request_start", None)
+    if start is not None:
+        labels = {
+            "blueprint": request.blueprint or "none",
+            "endpoint": request.endpoint or "unknown",
+        }
+        metrics.observe(
+            "remote_http_request_duration_seconds",
+            time.perf_counter() - start,
+            **labels,
+        )
+        metrics.inc(
+            "remote_http_requests_total", code=str(response.status_code), **labels
+        )
+    return response
+
+
+@metrics_bp.route("/metrics")
+def handle_metrics():
+    """导出运行指标"""
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
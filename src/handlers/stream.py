@@ -0,0 +1,154 @@
+"""
+输入流处理器模块
+通过WebSocket长连接持续接收触摸板和键盘事件
+"""
+
+import json
+import logging
+import uuid
+
+from flask import Blueprint, request
+from flask_sock import Sock
+
+from handlers.keyboard import dispatch_keyboard_action
+from handlers.touchpad import coalesce_touch_moves, dispatch_touchpad_action
+from utils.wire_format import FLAG_ACK, WireFormatError, decode_packet
+
+logger = logging.getLogger(__name__)
+
+stream_bp = Blueprint("stream", __name__)
+sock = Sock()
+
+# 事件通道到处理函数的映射
+STREAM_DISPATCHERS = {
+    "touchpad": dispatch_touchpad_action,
+    "keyboard": dispatch_keyboard_action,
+}
+
+MAX_CLIENT_ID_LENGTH = 64
+
+
+def resolve_client_id(requested=None):
+    """
+    确定连接的客户端标识
+
+    Args:
+        requested: 客户端在连接参数中提供的标识
+
+    Returns:
+        str: 客户端提供的标识；缺失或过长时为本连接生成一个
+    """
+    if requested and len(requested) <= MAX_CLIENT_ID_LENGTH:
+        return requested
+    return f"ws-{uuid.uuid4().hex[:12]}"
+
+
+def process_stream_event(event, client_id=None):
+    """
+    处理单个流事件
+
+    Args:
+        event: 事件数据，"channel" 字段选择处理通道，默认为 "touchpad"
+        client_id: 连接的客户端标识，事件未携带 client_id 时使用
+
+    Returns:
+        dict: 处理结果
+    """
+    if not isinstance(event, dict):
+        return {"status": "error", "message": "无效的事件数据"}
+
+    if client_id is not None:
+        event.setdefault("client_id", client_id)
+
+    dispatcher = STREAM_DISPATCHERS.get(event.get("channel", "touchpad"))
+    if dispatcher is None:
+        return {"status": "error", "message": f"不支持的通道: {event.get('channel')}"}
+
+    try:
+        result, _ = dispatcher(event)
+        return result
+    except Exception as e:
+        return {"status": "error", "message": f"输入流事件处理失败: {str(e)}"}
+
+
+def process_binary_packet(packet, client_id=None):
+    """
+    处理一个二进制数据包
+
+    包内事件按顺序执行，连续的同一触摸的移动事件合并后一次处理；
+    只有包头带 FLAG_ACK 标志时才回包，回包包含包序号和每个原始事件的处理结果。
+
+    Args:
+        packet: 数据包字节
+        client_id: 连接的客户端标识
+
+    Returns:
+        dict: 合并后的响应，不需要回包时返回None
+    """
+    try:
+        header, events = decode_packet(packet)
+    except WireFormatError as e:
+        return {"status": "error", "message": f"无效的数据包: {str(e)}"}
+
+    results = []
+    for event, count in coalesce_touch_moves(events):
+        results.extend([process_stream_event(event, client_id)] * count)
+
+    if not header["flags"] & FLAG_ACK:
+        return None
+
+    return {"status": "success", "seq": header["seq"], "results": results}
+
+
+def process_stream_message(message, client_id=None):
+    """
+    处理一条流消息
+
+    二进制消息按 utils.wire_format 协议解码；文本消息可以是单个事件对象，
+    也可以是按顺序执行的事件数组。只有携带 "seq" 字段的事件才会产生响应，
+    同一条消息内的响应合并返回，其余事件不回包，避免每个触摸移动都产生一次下行数据。
+    连续的同一触摸的移动事件合并后一次处理。
+
+    Args:
+        message: 文本或二进制消息
+        client_id: 连接的客户端标识，用于隔离各设备的手势状态
+
+    Returns:
+        dict: 合并后的响应，没有需要响应的事件时返回None
+    """
+    if isinstance(message, (bytes, bytearray)):
+        return process_binary_packet(message, client_id)
+
+    try:
+        payload = json.loads(message)
+    except (TypeError, ValueError):
+        return {"status": "error", "message": "无效的消息格式"}
+
+    events = payload if isinstance(payload, list) else [payload]
+
+    results = []
+    for event, _ in coalesce_touch_moves(events):
+        result = process_stream_event(event, client_id)
+        if isinstance(event, dict) and "seq" in event:
+            results.append({"seq": event["seq"], **result})
+
+    if not results:
+        return None
+
+    return {"status": "success", "results": results}
+
+
+@sock.route("/ws/input", bp=stream_bp)
+def handle_input_stream(ws):
+    """处理输入事件流连接"""
+    client_id = resolve_client_id(request.args.get("client"))
+    logger.info(f"输入流连接已建立: {client_id}")
+
+    while True:
+        message = ws.receive()
+        if message is None:
+            break
+
+        response = process_stream_message(message, client_id)
+        if response is not None:
+            ws.send(json.dumps(response, ensure_ascii=False))
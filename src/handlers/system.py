@@ -6,11 +6,46 @@
 from flask import Blueprint, jsonify, request
 
 from services.system_service import SystemService
+from utils.metrics import instrument_dispatch
 
 system_bp = Blueprint("system", __name__)
 system_service = SystemService()
 
 
+@instrument_dispatch(
+    "system", ("lock", "shutdown", "restart", "status", "dump_trace")
+)
+def dispatch_system_action(data):
+    """
+    分发系统操作
+
+    Args:
+        data: 请求数据
+
+    Returns:
+        tuple: (响应数据, HTTP状态码)
+    """
+    action = data.get("action")
+
+    if action == "lock":
+        return system_service.lock_screen(), 200
+
+    elif action == "shutdown":
+        return system_service.shutdown_system(), 200
+
+    elif action == "restart":
+        return system_service.restart_system(), 200
+
+    elif action == "status":
+        return system_service.get_system_status(bool(data.get("refresh"))), 200
+
+    elif action == "dump_trace":
+        return system_service.dump_event_trace(), 200
+
+    else:
+        return {"status": "error", "message": f"不支持的操作: {action}"}, 400
+
+
 @system_bp.route("/api/system", methods=["POST"])
 def handle_system():
     """处理系统操作请求"""
@@ -19,28 +54,8 @@ def handle_system():
         if not data:
             return jsonify({"status": "error", "message": "无效的请求数据"}), 400
 
-        action = data.get("action")
-
-        if action == "lock":
-            result = system_service.lock_screen()
-            return jsonify(result)
-
-        elif action == "shutdown":
-            result = system_service.shutdown_system()
-            return jsonify(result)
-
-        elif action == "restart":
-            result = system_service.restart_system()
-            return jsonify(result)
-
-        elif action == "status":
-            result = system_service.get_system_status()
-            return jsonify(result)
-
-        else:
-            return jsonify(
-                {"status": "error", "message": f"不支持的操作: {action}"}
-            ), 400
+        result, status_code = dispatch_system_action(data)
+        return jsonify(result), status_code
 
     except Exception as e:
         return jsonify({"status": "error", "message": f"系统操作失败: {str(e)}"}), 500
@@ -5,10 +5,118 @@
 
 from flask import Blueprint, jsonify, request
 
+from core.config import Config
 from services.touchpad_service import TouchpadService
+from utils.metrics import instrument_dispatch
+from utils.session_log import record_events
 
 touchpad_bp = Blueprint("touchpad", __name__)
-touchpad_service = TouchpadService()
+
+if Config.INJECTION_MODE == "process":
+    from services.injector_process import RemoteTouchpadService, get_injector_process
+
+    touchpad_service = RemoteTouchpadService(get_injector_process())
+else:
+    touchpad_service = TouchpadService()
+
+
+@instrument_dispatch(
+    "touchpad", ("touch_start", "touch_move", "touch_end", "scroll", "status")
+)
+@record_events("touchpad")
+def dispatch_touchpad_action(data):
+    """
+    分发触摸板操作，供HTTP接口和输入流共用
+
+    Args:
+        data: 触摸板事件数据
+
+    Returns:
+        tuple: (响应数据, HTTP状态码)
+    """
+    action = data.get("action")
+
+    if action == "touch_start":
+        try:
+            return touchpad_service.handle_touch_start(data), 200
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}, 400
+
+    elif action == "touch_move":
+        try:
+            return touchpad_service.handle_touch_move(data), 200
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}, 400
+
+    elif action == "touch_end":
+        return touchpad_service.handle_touch_end(data), 200
+
+    elif action == "scroll":
+        return touchpad_service.handle_scroll(data), 200
+
+    elif action == "status":
+        status = touchpad_service.get_touchpad_status(data.get("client_id"))
+        return {"status": "success", "touchpad_status": status}, 200
+
+    else:
+        return {"status": "error", "message": f"不支持的操作: {action}"}, 400
+
+
+def _merge_key(event):
+    """可以合并的触摸移动事件的分组键，不能合并时返回None"""
+    if (
+        not isinstance(event, dict)
+        or event.get("channel", "touchpad") != "touchpad"
+        or event.get("action") != "touch_move"
+        or "seq" in event
+        or "frames" in event
+        or not event.get("touches")
+    ):
+        return None
+    return (event.get("client_id"), event.get("touch_id"), event.get("touch_count"))
+
+
+def coalesce_touch_moves(events):
+    """
+    合并一批事件中连续的同一触摸的移动事件
+
+    合并后的事件是最后一个移动事件的副本，"frames" 字段按顺序保存之前各帧的触摸点，
+    手势识别一次处理整批帧，光标位移按最后一帧的位置计算，总位移不变。
+    携带 "seq" 的事件需要单独的结果，不参与合并。
+
+    Args:
+        events: 事件列表
+
+    Returns:
+        list: [(事件, 合并的原始事件数), ...]，顺序与原事件一致
+    """
+    merged = []
+    run = []
+    run_key = None
+
+    def close_run():
+        if len(run) > 1:
+            last = dict(run[-1])
+            last["frames"] = [event["touches"] for event in run[:-1]]
+            merged.append((last, len(run)))
+        elif run:
+            merged.append((run[0], 1))
+
+    for event in events:
+        key = _merge_key(event)
+        if key is not None and key == run_key:
+            run.append(event)
+            continue
+
+        close_run()
+        if key is None:
+            merged.append((event, 1))
+            run, run_key = [], None
+        else:
+            run, run_key = [event], key
+
+    close_run()
+    return merged
 
 
 @touchpad_bp.route("/api/touchpad", methods=["POST"])
@@ -19,28 +127,8 @@ def handle_touchpad():
         if not data:
             return jsonify({"status": "error", "message": "无效的请求数据"}), 400
 
-        action = data.get("action")
-
-        if action == "touch_start":
-            result = touchpad_service.handle_touch_start(data)
-            return jsonify(result)
-
-        elif action == "touch_move":
-            result = touchpad_service.handle_touch_move(data)
-            return jsonify(result)
-
-        elif action == "touch_end":
-            result = touchpad_service.handle_touch_end(data)
-            return jsonify(result)
-
-        elif action == "status":
-            status = touchpad_service.get_touchpad_status()
-            return jsonify({"status": "success", "touchpad_status": status})
-
-        else:
-            return jsonify(
-                {"status": "error", "message": f"不支持的操作: {action}"}
-            ), 400
+        result, status_code = dispatch_touchpad_action(data)
+        return jsonify(result), status_code
 
     except Exception as e:
         return jsonify({"status": "error", "message": f"触摸板操作失败: {str(e)}"}), 500
@@ -0,0 +1,60 @@
+"""
+输入会话回放工具
+把 SESSION_RECORD_DIR 下录制的会话日志回放到真实或空输入设备
+
+用法:
+    python src/replay_session.py session-20250101-120000.rcs [--speed 1] [--null]
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def main():
+    """回放工具入口"""
+    parser = argparse.ArgumentParser(description="回放录制的输入会话")
+    parser.add_argument("path", help="会话日志文件")
+    parser.add_argument(
+        "--speed", type=float, default=1.0, help="回放倍速，1 为原速，0 为尽快回放"
+    )
+    parser.add_argument(
+        "--null", action="store_true", help="回放到空输入设备，不产生真实输入"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if args.null:
+        # 空设备回放不需要显示环境
+        os.environ.setdefault("PYNPUT_BACKEND", "dummy")
+        from utils.null_controller import install_null_controllers
+
+        install_null_controllers()
+
+    # 服务在导入处理器模块时创建，必须在替换控制器之后导入
+    from handlers.keyboard import dispatch_keyboard_action
+    from handlers.touchpad import dispatch_touchpad_action
+    from utils.input_worker import get_input_worker
+    from utils.session_log import SessionReader, replay_session
+
+    dispatchers = {
+        "touchpad": dispatch_touchpad_action,
+        "keyboard": dispatch_keyboard_action,
+    }
+
+    with SessionReader(args.path) as reader:
+        result = replay_session(reader, dispatchers, speed=args.speed)
+    get_input_worker().wait_idle(2.0)
+
+    print(
+        f"已回放 {result['events']} 个事件，失败 {result['failed']} 个，"
+        f"耗时 {result['elapsed']:.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
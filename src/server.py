@@ -4,10 +4,12 @@
 """
 
 import logging
+import multiprocessing
 import os
 import sys
 
 from core.app import create_app
+from core.asgi import run_asgi_server
 from core.config import Config
 from utils.system_utils import get_local_ip
 
@@ -33,8 +35,17 @@ def main():
     logger.info("远程控制器服务器启动中...")
     logger.info(f"本机访问地址: http://{Config.HOST}:{Config.PORT}")
     logger.info(f"远程访问地址: http://{get_local_ip()}:{Config.PORT}")
-    app.run(host=Config.HOST, port=Config.PORT, debug=False, threaded=True)
+    if Config.INJECTION_MODE == "process":
+        logger.info("注入模式: 独立注入进程")
+
+    if Config.SERVER_MODE == "asgi":
+        logger.info("服务模式: ASGI (uvicorn)")
+        run_asgi_server(app, Config.HOST, Config.PORT)
+    else:
+        app.run(host=Config.HOST, port=Config.PORT, debug=False, threaded=True)
 
 
 if __name__ == "__main__":
+    # 打包后的程序以 spawn 方式启动注入进程时需要
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,203 @@
+"""
+多点触控手势模块
+按帧处理完整的触摸点集合，由质心、张开距离和旋转角识别双指滚动、双指缩放和三指轻扫
+"""
+
+import math
+
+from core.config import TOUCHPAD_CONFIG
+
+# 手势类型
+GESTURE_SCROLL = "scroll"
+GESTURE_PINCH = "pinch"
+GESTURE_SWIPE = "swipe"
+
+
+def frame_features(frames):
+    """
+    批量计算触摸帧的几何特征
+
+    所有帧的坐标先展开成按列存放的列表，质心、张开距离和角度用 fsum/map 按列求出，
+    不逐个事件、逐个触摸点分支。没有使用 numpy 向量化：项目不依赖 numpy，
+    每帧只有两到五个触摸点，建数组的开销比这里的计算本身还大。
+
+    Args:
+        frames: 帧列表，每帧为非空的触摸点列表 [{"id": ..., "x": ..., "y": ...}, ...]
+
+    Returns:
+        list: 每帧的 (触摸点id元组, 质心x, 质心y, 平均张开距离, 各点相对质心的角度元组)
+    """
+    counts = [len(frame) for frame in frames]
+    ids = [point.get("id", i) for frame in frames for i, point in enumerate(frame)]
+    xs = [point.get("x", 0) for frame in frames for point in frame]
+    ys = [point.get("y", 0) for frame in frames for point in frame]
+
+    features = []
+    start = 0
+    for count in counts:
+        end = start + count
+        cx = math.fsum(xs[start:end]) / count
+        cy = math.fsum(ys[start:end]) / count
+        ox = [x - cx for x in xs[start:end]]
+        oy = [y - cy for y in ys[start:end]]
+        spread = math.fsum(map(math.hypot, ox, oy)) / count
+        angles = tuple(map(math.atan2, oy, ox))
+        features.append((tuple(ids[start:end]), cx, cy, spread, angles))
+        start = end
+    return features
+
+
+def _common_shift(before, after, ids):
+    """两帧中给定 id 的触摸点的质心位移"""
+    old = [p for i, p in enumerate(before) if p.get("id", i) in ids]
+    new = [p for i, p in enumerate(after) if p.get("id", i) in ids]
+    count = len(ids)
+    return (
+        (math.fsum(p.get("x", 0) for p in new) - math.fsum(p.get("x", 0) for p in old))
+        / count,
+        (math.fsum(p.get("y", 0) for p in new) - math.fsum(p.get("y", 0) for p in old))
+        / count,
+    )
+
+
+def _wrap_angle(angle):
+    """角度差归一化到 [-pi, pi)"""
+    return (angle + math.pi) % (2 * math.pi) - math.pi
+
+
+class GestureTracker:
+    """单个触摸的多点手势识别
+
+    触摸点相同的相邻帧之间比较质心、张开距离和旋转角；手指增减时只用两帧共有的触摸点
+    计算质心位移，并重新开始识别。双指手势在张开距离变化或质心位移先超过阈值时锁定为
+    缩放或滚动，三指手势在质心位移超过 swipe_distance 时按主轴方向锁定为一次轻扫；
+    锁定前的增量在锁定时一并输出。一批帧在处理完全部帧之后只判定一次。
+
+    客户端只发送第一个触摸点时按 fingers 参数识别，质心即为该点，不会识别出缩放。
+    """
+
+    def __init__(
+        self, scroll_threshold=None, pinch_threshold=None, swipe_distance=None
+    ):
+        """
+        Args:
+            scroll_threshold: 双指质心位移超过该距离锁定为滚动
+            pinch_threshold: 双指张开距离变化超过该距离锁定为缩放
+            swipe_distance: 三指质心位移超过该距离锁定为轻扫
+        """
+        config = TOUCHPAD_CONFIG
+        self.scroll_threshold = (
+            config["MOVE_THRESHOLD"] if scroll_threshold is None else scroll_threshold
+        )
+        self.pinch_threshold = (
+            config["PINCH_THRESHOLD"] if pinch_threshold is None else pinch_threshold
+        )
+        self.swipe_distance = (
+            config["SWIPE_DISTANCE"] if swipe_distance is None else swipe_distance
+        )
+        self.fingers = 0
+        self.gesture = None
+        self._frame = None
+        self._feature = None
+        self._restart()
+
+    def _restart(self):
+        self.gesture = None
+        # 尚未输出的质心位移、张开比值的对数和旋转角，锁定前即为累计量
+        self._dx = self._dy = self._zoom = self._rotation = 0.0
+        # 锁定前张开距离的累计变化，用于区分缩放和滚动
+        self._spread_change = 0.0
+
+    def update(self, frames, fingers=None):
+        """
+        处理一批帧
+
+        Args:
+            frames: 帧列表，每帧为触摸点列表
+            fingers: 手指数，默认为每帧的触摸点数
+
+        Returns:
+            dict: gesture 为锁定的手势（未锁定时为None）；dx/dy 为质心位移，
+                  zoom 为张开距离比值的自然对数，rotation 为旋转角（弧度），
+                  均在锁定后才输出；swipe 为本批锁定的轻扫方向
+        """
+        frames = [frame for frame in frames if frame]
+
+        for frame, feature in zip(frames, frame_features(frames)):
+            count = len(frame) if fingers is None else fingers
+            ids, cx, cy, spread, angles = feature
+            last = self._feature
+
+            if count != self.fingers:
+                self.fingers = count
+                self._restart()
+
+            if last is None:
+                pass
+            elif ids == last[0]:
+                _, lx, ly, last_spread, last_angles = last
+                self._dx += cx - lx
+                self._dy += cy - ly
+                if spread > 0 and last_spread > 0:
+                    self._zoom += math.log(spread / last_spread)
+                    self._spread_change += spread - last_spread
+                    self._rotation += math.fsum(
+                        _wrap_angle(a - b) for a, b in zip(angles, last_angles)
+                    ) / len(angles)
+            else:
+                # 手指增减：只有两帧共有的触摸点的位移有意义
+                common = set(ids) & set(last[0])
+                if common:
+                    dx, dy = _common_shift(self._frame, frame, common)
+                    self._dx += dx
+                    self._dy += dy
+
+            self._frame = frame
+            self._feature = feature
+
+        return self._classify()
+
+    def _lock(self):
+        travel = math.hypot(self._dx, self._dy)
+        if self.fingers == 2:
+            change = abs(self._spread_change)
+            if change >= self.pinch_threshold and change > travel:
+                return GESTURE_PINCH
+            if travel >= self.scroll_threshold:
+                return GESTURE_SCROLL
+        elif self.fingers >= 3 and travel >= self.swipe_distance:
+            return GESTURE_SWIPE
+        return None
+
+    def _classify(self):
+        result = {
+            "gesture": None,
+            "dx": 0.0,
+            "dy": 0.0,
+            "zoom": 0.0,
+            "rotation": 0.0,
+            "swipe": None,
+        }
+        swipe = None
+        if self.gesture is None:
+            self.gesture = self._lock()
+            if self.gesture is None:
+                return result
+            if self.gesture == GESTURE_SWIPE:
+                swipe = self._swipe_direction()
+
+        result.update(
+            gesture=self.gesture,
+            dx=self._dx,
+            dy=self._dy,
+            zoom=self._zoom,
+            rotation=self._rotation,
+            swipe=swipe,
+        )
+        self._dx = self._dy = self._zoom = self._rotation = 0.0
+        return result
+
+    def _swipe_direction(self):
+        if abs(self._dx) >= abs(self._dy):
+            return "right" if self._dx > 0 else "left"
+        return "down" if self._dy > 0 else "up"
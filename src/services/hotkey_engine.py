@@ -0,0 +1,200 @@
+"""
+快捷键引擎模块
+按时间线调度快捷键的按下和释放步骤，不阻塞请求线程
+"""
+
+import collections
+import itertools
+import threading
+import time
+
+from core.config import HOTKEY_PROFILES, KEYBOARD_CONFIG, WINDOWS_KEY_MAP
+from utils.input_worker import get_input_worker
+from utils.timer_scheduler import get_timer_scheduler
+
+# 保留最近的快捷键任务以供查询状态
+MAX_TRACKED_JOBS = 128
+
+
+class HotkeyJob:
+    """快捷键任务，提供类似 Future 的完成状态查询"""
+
+    def __init__(self, job_id, keys, mapped_keys, timing):
+        self.job_id = job_id
+        self.keys = list(keys)
+        self.mapped_keys = list(mapped_keys)
+        self.timing = timing
+        self.status = "pending"
+        self.error = None
+        self.created_at = time.time()
+        self.finished_at = None
+        self._done = threading.Event()
+
+    def done(self):
+        """是否已执行完毕（成功或失败）"""
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """
+        等待任务完成
+
+        Args:
+            timeout: 最长等待秒数
+
+        Returns:
+            bool: 是否在超时前完成
+        """
+        return self._done.wait(timeout)
+
+    def to_dict(self):
+        """
+        转换为响应数据
+
+        Returns:
+            dict: 任务状态信息
+        """
+        return {
+            "job_id": self.job_id,
+            "keys": self.keys,
+            "timing": self.timing,
+            "status": self.status,
+            "error": self.error,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
+
+    def _finish(self, status, error=None):
+        self.status = status
+        self.error = error
+        self.finished_at = time.time()
+        self._done.set()
+
+
+class HotkeyEngine:
+    """快捷键引擎
+
+    原实现在请求线程里逐个 time.sleep，Ctrl+Shift+Esc 要占用请求线程 400ms。
+    这里把每个按下/释放步骤按时间线交给定时器调度器，到点后提交给注入线程执行，
+    请求线程只负责创建任务并立即返回。
+    """
+
+    def __init__(
+        self, keyboard_controller, timer_scheduler=None, injector=None, key_map=None
+    ):
+        self.keyboard_controller = keyboard_controller
+        self.key_map = WINDOWS_KEY_MAP if key_map is None else key_map
+        self.timer_scheduler = timer_scheduler or get_timer_scheduler()
+        self.injector = injector or get_input_worker()
+
+        self._jobs = collections.OrderedDict()
+        self._jobs_lock = threading.Lock()
+        self._job_ids = itertools.count(1)
+
+    def resolve_timing(self, profile=None):
+        """
+        解析时序配置
+
+        Args:
+            profile: 配置名称或包含 press_interval/release_interval 的字典，
+                     默认为 KEYBOARD_CONFIG["HOTKEY_DEFAULT_PROFILE"]
+
+        Returns:
+            dict: press_interval 和 release_interval（秒）
+
+        Raises:
+            ValueError: 配置不存在或参数无效
+        """
+        if profile is None:
+            profile = KEYBOARD_CONFIG["HOTKEY_DEFAULT_PROFILE"]
+
+        if isinstance(profile, dict):
+            base = HOTKEY_PROFILES[KEYBOARD_CONFIG["HOTKEY_DEFAULT_PROFILE"]]
+            timing = {key: profile.get(key, base[key]) for key in base}
+        elif profile in HOTKEY_PROFILES:
+            timing = dict(HOTKEY_PROFILES[profile])
+        else:
+            raise ValueError(f"未知的快捷键时序配置: {profile}")
+
+        for key, value in timing.items():
+            # bool 是 int 的子类，True/False 不是有效的时长
+            if (
+                isinstance(value, bool)
+                or not isinstance(value, (int, float))
+                or value < 0
+            ):
+                raise ValueError(f"无效的时序参数: {key}={value}")
+        return timing
+
+    def execute(self, keys, profile=None):
+        """
+        调度执行快捷键组合
+
+        依次按下所有按键，每次按下后间隔 press_interval，
+        再等待 release_interval 后按相反顺序全部释放。
+
+        Args:
+            keys: 按键名称列表
+            profile: 时序配置名称或字典
+
+        Returns:
+            HotkeyJob: 快捷键任务
+        """
+        timing = self.resolve_timing(profile)
+        mapped_keys = [self.key_map.get(k, k) for k in keys]
+        job = HotkeyJob(next(self._job_ids), keys, mapped_keys, timing)
+        self._track(job)
+
+        press_interval = timing["press_interval"]
+        release_at = len(keys) * press_interval + timing["release_interval"]
+
+        for index, key in enumerate(mapped_keys):
+            self._schedule_step(index * press_interval, self._press, job, key)
+        self._schedule_step(release_at, self._release_all, job)
+
+        return job
+
+    def get_job(self, job_id):
+        """
+        查询快捷键任务
+
+        Args:
+            job_id: 任务ID
+
+        Returns:
+            HotkeyJob: 任务，不存在时返回None
+        """
+        with self._jobs_lock:
+            return self._jobs.get(job_id)
+
+    def _track(self, job):
+        with self._jobs_lock:
+            self._jobs[job.job_id] = job
+            while len(self._jobs) > MAX_TRACKED_JOBS:
+                self._jobs.popitem(last=False)
+
+    def _schedule_step(self, delay, step, *args):
+        # 步骤不带合并键，注入队列满时也会入队，释放不会丢失
+        if delay <= 0:
+            self.injector.submit(step, *args)
+        else:
+            self.timer_scheduler.call_later(delay, self.injector.submit, step, *args)
+
+    def _press(self, job, key):
+        if job.status == "pending":
+            job.status = "running"
+        if job.done():
+            return
+        self.keyboard_controller.press(key)
+
+    def _release_all(self, job):
+        errors = []
+        for key in reversed(job.mapped_keys):
+            try:
+                self.keyboard_controller.release(key)
+            except Exception as e:
+                errors.append(str(e))
+
+        if errors:
+            job._finish("failed", "; ".join(errors))
+        elif not job.done():
+            job._finish("done")
@@ -0,0 +1,460 @@
+"""
+注入进程服务模块
+多进程模式下由独立进程执行手势识别和设备注入，Web 进程只负责解析请求并转发事件
+"""
+
+import atexit
+import itertools
+import logging
+import marshal
+import multiprocessing
+import threading
+import time
+
+from core.config import Config
+from utils.shm_ring import ShmRingBuffer
+
+logger = logging.getLogger(__name__)
+
+# 转发到注入进程的服务方法，参数只能是 marshal 支持的基本类型
+FORWARDED_METHODS = {
+    "touchpad": (
+        "handle_touch_start",
+        "handle_touch_move",
+        "handle_touch_end",
+        "handle_scroll",
+    ),
+    "keyboard": (
+        "press_key",
+        "release_key",
+        "type_text",
+        "execute_hotkey",
+        "get_hotkey_status",
+    ),
+}
+
+# 需要回传结果的方法的返回值转换，结果经管道送回 Web 进程
+REPLY_CONVERTERS = {
+    "execute_hotkey": lambda job: job.job_id,
+}
+
+# 停止记录排在所有事件之后，注入进程处理完之前的事件才退出
+STOP_CHANNEL = "__stop__"
+
+# 注入进程空闲时每次阻塞等待的最长时间（秒），门铃丢失时也能及时发现新记录
+IDLE_WAIT = 0.05
+
+
+def run_injector(
+    ring, result_conn, reply_conn, input_backend=None, report_call_times=False
+):
+    """
+    注入进程入口：创建服务，按顺序执行环形缓冲区中的事件
+
+    Args:
+        ring: 共享内存环形缓冲区
+        result_conn: 退出时发送运行报告的管道
+        reply_conn: 回传调用结果的管道，只有带请求编号的事件才回传
+        input_backend: 输入后端名称，默认为 Config.INPUT_BACKEND
+        report_call_times: 报告中是否包含设备调用时刻（基准测试用）
+    """
+    logging.basicConfig(
+        level=Config.LOGGER_LEVEL,
+        format="%(asctime)s [%(levelname)-5s] %(name)s: %(message)s",
+        datefmt="%H:%M:%S",
+    )
+    from services.keyboard_service import KeyboardService
+    from services.touchpad_service import TouchpadService
+    from utils.input_backend import create_input_backend
+    from utils.security import install_input_backend
+
+    # 多进程模式下导入阶段创建的是空后端，创建服务之前换成真正注入的后端
+    Config.INJECTION_MODE = "thread"
+    install_input_backend(create_input_backend(input_backend))
+
+    services = {"touchpad": TouchpadService(), "keyboard": KeyboardService()}
+    targets = {
+        (channel, method): getattr(services[channel], method)
+        for channel, methods in FORWARDED_METHODS.items()
+        for method in methods
+    }
+    stats = {"processed": 0, "errors": 0}
+
+    while True:
+        record = ring.get()
+        if record is None:
+            ring.wait(IDLE_WAIT)
+            continue
+
+        channel, method, args, request_id = marshal.loads(record)
+        if channel == STOP_CHANNEL:
+            break
+        try:
+            result = targets[(channel, method)](*args)
+            stats["processed"] += 1
+            reply = (True, REPLY_CONVERTERS.get(method, _identity)(result))
+        except Exception as e:
+            stats["errors"] += 1
+            logger.error(f"注入进程事件处理失败 {channel}.{method}: {e}")
+            reply = (False, str(e))
+        if request_id:
+            reply_conn.send((request_id, *reply))
+
+    touchpad = services["touchpad"]
+    touchpad.shutdown()
+    touchpad.injector.wait_idle()
+
+    report = dict(stats)
+    report["ring"] = ring.get_stats()
+    report["input_backend"] = touchpad.input_backend.get_status()
+    report["injection_stats"] = touchpad.input_scheduler.get_stats()
+    if report_call_times:
+        report["call_times"] = {
+            "mouse": list(getattr(touchpad.mouse_controller, "call_times", ())),
+            "keyboard": list(getattr(touchpad.keyboard_controller, "call_times", ())),
+        }
+    result_conn.send(report)
+    result_conn.close()
+    reply_conn.close()
+    ring.close()
+
+
+def _identity(value):
+    return value
+
+
+class RemoteCallError(RuntimeError):
+    """注入进程中的调用抛出异常"""
+
+
+class InjectorProcess:
+    """注入进程
+
+    使用 spawn 方式启动，子进程重新导入模块，不继承 Web 进程的线程和设备控制器。
+    submit() 把服务方法调用写入共享内存环形缓冲区，缓冲区满时短暂等待消费者腾出空间。
+    call() 额外等待注入进程经回传管道送回调用结果，由后台线程接收并唤醒等待者；
+    只用于抬起、快捷键等需要结果的低频事件，移动事件仍然只写入不等待。
+    """
+
+    def __init__(
+        self,
+        ring_size=None,
+        submit_timeout=None,
+        input_backend=None,
+        report_call_times=False,
+        reply_timeout=None,
+    ):
+        """
+        Args:
+            ring_size: 环形缓冲区字节数，默认为 Config.INJECTOR_RING_SIZE
+            submit_timeout: 缓冲区满时最长等待时间（秒）
+            reply_timeout: call() 等待调用结果的最长时间（秒），
+                默认为 Config.INJECTOR_REPLY_TIMEOUT
+            input_backend: 注入进程使用的输入后端名称，默认为 Config.INPUT_BACKEND
+            report_call_times: 停止时的报告是否包含设备调用时刻
+        """
+        self.submit_timeout = (
+            Config.INJECTOR_SUBMIT_TIMEOUT if submit_timeout is None else submit_timeout
+        )
+        context = multiprocessing.get_context("spawn")
+        self.ring = ShmRingBuffer.create(
+            ring_size or Config.INJECTOR_RING_SIZE, context=context
+        )
+        self.reply_timeout = (
+            Config.INJECTOR_REPLY_TIMEOUT if reply_timeout is None else reply_timeout
+        )
+        self._result_conn, child_conn = context.Pipe(duplex=False)
+        self._reply_conn, child_reply_conn = context.Pipe(duplex=False)
+        self._process = context.Process(
+            target=run_injector,
+            args=(
+                self.ring,
+                child_conn,
+                child_reply_conn,
+                input_backend or Config.INPUT_BACKEND,
+                report_call_times,
+            ),
+            name="input-injector",
+            daemon=True,
+        )
+        self._stopped = False
+        self._request_ids = itertools.count(1)
+        # 请求编号 -> [事件, 结果]
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._reply_thread = threading.Thread(
+            target=self._receive_replies, name="injector-replies", daemon=True
+        )
+        self.stats = {"submitted": 0, "dropped": 0, "replies": 0, "reply_timeouts": 0}
+
+    @property
+    def alive(self):
+        """注入进程是否在运行"""
+        return self._process.is_alive()
+
+    def start(self):
+        """启动注入进程"""
+        self._process.start()
+        self._reply_thread.start()
+        logger.info(f"注入进程已启动: pid={self._process.pid}")
+
+    def submit(self, channel, method, *args):
+        """
+        把一次服务方法调用交给注入进程
+
+        Args:
+            channel: 服务通道，"touchpad" 或 "keyboard"
+            method: FORWARDED_METHODS 中的方法名
+            *args: 方法参数
+
+        Returns:
+            bool: 是否成功写入缓冲区
+        """
+        return self._put(marshal.dumps((channel, method, args, 0)))
+
+    def call(self, channel, method, *args):
+        """
+        把一次服务方法调用交给注入进程并等待结果
+
+        Args:
+            channel: 服务通道
+            method: FORWARDED_METHODS 中的方法名
+            *args: 方法参数
+
+        Returns:
+            tuple: (是否成功写入缓冲区, 是否在 reply_timeout 内收到结果, 返回值)
+
+        Raises:
+            RemoteCallError: 注入进程中的调用抛出异常
+        """
+        request_id = next(self._request_ids)
+        waiter = [threading.Event(), None]
+        with self._pending_lock:
+            self._pending[request_id] = waiter
+
+        try:
+            if not self._put(marshal.dumps((channel, method, args, request_id))):
+                return False, False, None
+            if not waiter[0].wait(self.reply_timeout):
+                self.stats["reply_timeouts"] += 1
+                return True, False, None
+        finally:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+
+        ok, value = waiter[1]
+        if not ok:
+            raise RemoteCallError(value)
+        return True, True, value
+
+    def _put(self, record):
+        if self.ring.put(record):
+            self.stats["submitted"] += 1
+            return True
+
+        deadline = time.monotonic() + self.submit_timeout
+        while time.monotonic() < deadline:
+            time.sleep(0.0005)
+            if self.ring.put(record):
+                self.stats["submitted"] += 1
+                return True
+
+        self.stats["dropped"] += 1
+        return False
+
+    def _receive_replies(self):
+        """后台线程：接收调用结果并唤醒对应的等待者"""
+        conn = self._reply_conn
+        while not self._stopped:
+            try:
+                if not conn.poll(IDLE_WAIT):
+                    continue
+                request_id, ok, value = conn.recv()
+            except (EOFError, OSError):
+                return
+            with self._pending_lock:
+                waiter = self._pending.get(request_id)
+            self.stats["replies"] += 1
+            if waiter is not None:
+                waiter[1] = (ok, value)
+                waiter[0].set()
+
+    def get_stats(self):
+        """
+        获取转发统计
+
+        Returns:
+            dict: 转发、丢弃次数，缓冲区状态和进程是否存活
+        """
+        stats = dict(self.stats)
+        stats["alive"] = self.alive
+        stats["pid"] = self._process.pid
+        stats["ring"] = self.ring.get_stats()
+        return stats
+
+    def stop(self, timeout=5.0):
+        """
+        处理完已提交的事件后停止注入进程
+
+        Args:
+            timeout: 等待进程退出的最长时间（秒）
+
+        Returns:
+            dict: 注入进程的运行报告，未能正常退出时返回None
+        """
+        if self._stopped:
+            return None
+        self._stopped = True
+
+        report = None
+        if self.alive and self.ring.put(marshal.dumps((STOP_CHANNEL, None, (), 0))):
+            if self._result_conn.poll(timeout):
+                report = self._result_conn.recv()
+            self._process.join(timeout)
+        if self.alive:
+            logger.warning("注入进程未按时退出，强制终止")
+            self._process.terminate()
+            self._process.join(timeout)
+
+        if self._reply_thread.is_alive():
+            self._reply_thread.join(timeout)
+        self._result_conn.close()
+        self._reply_conn.close()
+        self.ring.close()
+        return report
+
+
+class RemoteTouchpadService:
+    """转发到注入进程的触摸板服务
+
+    接口与 TouchpadService 一致。开始、移动和滚动事件写入缓冲区即返回成功，
+    数据校验和手势识别在注入进程中完成，错误只记录在注入进程的日志里；
+    触摸结束等待注入进程返回结果，客户端据此显示点击反馈。
+    """
+
+    def __init__(self, injector):
+        self.injector = injector
+
+    def handle_touch_start(self, touches_data):
+        return _forward(self.injector, "touchpad", "handle_touch_start", touches_data)
+
+    def handle_touch_move(self, touches_data):
+        return _forward(self.injector, "touchpad", "handle_touch_move", touches_data)
+
+    def handle_touch_end(self, touches_data):
+        submitted, replied, result = self.injector.call(
+            "touchpad", "handle_touch_end", touches_data
+        )
+        if not submitted:
+            return {"status": "error", "message": "注入队列已满"}
+        if not replied:
+            # 事件已交给注入进程，只是没有及时拿到点击结果
+            return {"status": "success"}
+        return result
+
+    def handle_scroll(self, scroll_data):
+        return _forward(self.injector, "touchpad", "handle_scroll", scroll_data)
+
+    def get_touchpad_status(self, client_id=None):
+        """
+        获取转发状态，手势状态保存在注入进程中
+
+        Returns:
+            dict: 注入模式和转发统计
+        """
+        return {"injection_mode": "process", "injector": self.injector.get_stats()}
+
+
+class QueuedHotkey:
+    """已转发的快捷键任务，任务编号由注入进程分配，未及时返回时为None"""
+
+    def __init__(self, job_id=None):
+        self.job_id = job_id
+
+
+class RemoteKeyboardService:
+    """转发到注入进程的键盘服务，接口与 KeyboardService 一致
+
+    快捷键和快捷键状态查询等待注入进程返回任务编号和状态。
+    """
+
+    def __init__(self, injector):
+        self.injector = injector
+
+    def press_key(self, key):
+        _submit(self.injector, "keyboard", "press_key", key)
+
+    def release_key(self, key):
+        _submit(self.injector, "keyboard", "release_key", key)
+
+    def type_text(self, text):
+        _submit(self.injector, "keyboard", "type_text", text)
+
+    def execute_hotkey(self, keys, profile=None):
+        try:
+            _, _, job_id = _call(
+                self.injector, "keyboard", "execute_hotkey", list(keys), profile
+            )
+        except RemoteCallError as e:
+            # 与本地服务一致，无效的按键或时序配置由分发函数返回 400
+            raise ValueError(str(e)) from e
+        return QueuedHotkey(job_id)
+
+    def get_hotkey_status(self, job_id):
+        _, replied, status = _call(
+            self.injector, "keyboard", "get_hotkey_status", job_id
+        )
+        if not replied:
+            raise RuntimeError("注入进程未及时返回快捷键状态")
+        return status
+
+
+def _submit(injector, channel, method, *args):
+    if not injector.submit(channel, method, *args):
+        raise RuntimeError("注入队列已满")
+
+
+def _call(injector, channel, method, *args):
+    result = injector.call(channel, method, *args)
+    if not result[0]:
+        raise RuntimeError("注入队列已满")
+    return result
+
+
+def _forward(injector, channel, method, data):
+    if not injector.submit(channel, method, data):
+        return {"status": "error", "message": "注入队列已满"}
+    return {"status": "success"}
+
+
+_injector_process = None
+_injector_process_lock = threading.Lock()
+
+
+def start_injector_process(**kwargs):
+    """
+    启动全局注入进程，需要自定义参数（如基准测试）时在创建应用之前调用
+
+    Args:
+        **kwargs: InjectorProcess 的参数
+
+    Returns:
+        InjectorProcess: 注入进程
+    """
+    global _injector_process
+    with _injector_process_lock:
+        if _injector_process is None:
+            _injector_process = InjectorProcess(**kwargs)
+            _injector_process.start()
+            atexit.register(_injector_process.stop)
+        return _injector_process
+
+
+def get_injector_process():
+    """
+    获取全局注入进程，首次调用时按默认配置启动
+
+    Returns:
+        InjectorProcess: 注入进程
+    """
+    return _injector_process or start_injector_process()
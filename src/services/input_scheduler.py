@@ -0,0 +1,264 @@
+"""
+输入调度服务模块
+在帧间隔内合并光标移动和滚动增量，按固定帧率交给注入线程统一注入
+"""
+
+import collections
+import contextlib
+import threading
+import time
+
+from core.config import TOUCHPAD_CONFIG
+from utils.input_worker import get_input_worker
+from utils.metrics import metrics
+from utils.scroll_accumulator import ScrollAccumulator, detect_scroll_resolution
+from utils.security import get_cursor_state
+from utils.timer_scheduler import get_timer_scheduler
+
+
+class InputScheduler:
+    """输入调度器
+
+    触摸移动的采样频率通常高于显示器刷新率，逐个注入只会浪费系统调用并累积延迟。
+    调度器把两帧之间收到的增量累加起来，每帧最多注入一次移动和一次滚动。
+
+    请求刷新时当前增量被截断为一段并编号，刷新任务只注入到该编号为止的各段。
+    请求之后才到达的增量属于下一段，不会被提前注入到之后提交的点击或按下之前。
+    """
+
+    def __init__(
+        self,
+        mouse_controller,
+        frame_rate=None,
+        timer_scheduler=None,
+        injector=None,
+        batch=None,
+    ):
+        """
+        Args:
+            mouse_controller: 鼠标控制器
+            frame_rate: 注入帧率，默认为 INJECTION_FRAME_RATE
+            timer_scheduler: 帧定时器使用的调度器
+            injector: 注入线程
+            batch: 返回批量写入上下文的函数（InputBackend.batch），默认不合并
+        """
+        self.mouse_controller = mouse_controller
+        self._batch = batch or contextlib.nullcontext
+        self.cursor_state = get_cursor_state(mouse_controller)
+        self.scroll_accumulator = ScrollAccumulator(
+            detect_scroll_resolution(mouse_controller)
+        )
+        self.timer_scheduler = timer_scheduler or get_timer_scheduler()
+        self.injector = injector or get_input_worker()
+        self.frame_interval = 1.0 / (
+            frame_rate or TOUCHPAD_CONFIG["INJECTION_FRAME_RATE"]
+        )
+
+        # 待注入的累计增量
+        self._move_dx = 0.0
+        self._move_dy = 0.0
+        self._scroll_dx = 0.0
+        self._scroll_dy = 0.0
+        self._pending_since = None
+
+        # 已请求刷新、尚未注入的各段：(编号, 移动dx, 移动dy, 滚动dx, 滚动dy, 开始时刻)
+        self._segments = collections.deque()
+        self._segment_seq = 0
+
+        self._state_lock = threading.Lock()
+        self._inject_lock = threading.Lock()
+        self._frame_timer = None
+        self._last_flush = 0.0
+
+        self.stats = {
+            "moves_received": 0,
+            "scrolls_received": 0,
+            "move_injections": 0,
+            "scroll_injections": 0,
+            "flushes": 0,
+            "total_latency": 0.0,
+            "max_latency": 0.0,
+        }
+
+    def add_move(self, dx, dy):
+        """
+        累加光标移动增量
+
+        Args:
+            dx: 水平移动量（像素）
+            dy: 垂直移动量（像素）
+        """
+        with self._state_lock:
+            self._move_dx += dx
+            self._move_dy += dy
+            self.stats["moves_received"] += 1
+            if self._pending_since is None:
+                self._pending_since = time.perf_counter()
+                self._schedule_frame()
+
+    def add_scroll(self, dx, dy):
+        """
+        累加滚动增量
+
+        Args:
+            dx: 水平滚动量
+            dy: 垂直滚动量
+        """
+        with self._state_lock:
+            self._scroll_dx += dx
+            self._scroll_dy += dy
+            self.stats["scrolls_received"] += 1
+            if self._pending_since is None:
+                self._pending_since = time.perf_counter()
+                self._schedule_frame()
+
+    def request_flush(self):
+        """
+        请求注入线程刷新待处理的增量
+
+        在提交点击、按下或释放按键之前调用：注入队列按顺序执行，刷新只注入本次请求之前的增量，
+        可保证这些操作发生在光标的最终位置。
+
+        Returns:
+            bool: 是否成功提交
+        """
+        with self._state_lock:
+            seq = self._close_segment()
+            if seq is None:
+                return True
+            # 队尾仍是本调度器的刷新时合并，刷新范围扩展到本段
+            return self.injector.submit(self._flush_through, seq, coalesce_key=self)
+
+    def submit_after_flush(self, func, *args):
+        """
+        提交在刷新之后执行的注入任务
+
+        刷新和任务放在同一个注入任务中，按下鼠标按键等操作发生在光标的最终位置，
+        之后到达的移动在下一帧注入。
+
+        Args:
+            func: 刷新后在注入线程上执行的函数
+            *args: 函数参数
+
+        Returns:
+            bool: 是否成功提交
+        """
+        with self._state_lock:
+            seq = self._close_segment()
+            return self.injector.submit(self._run_after_flush, seq, func, args)
+
+    def _run_after_flush(self, seq, func, args):
+        if seq is not None:
+            self._flush_through(seq)
+        func(*args)
+
+    def flush(self):
+        """立即注入所有待处理的增量，应在注入线程上调用"""
+        with self._state_lock:
+            seq = self._close_segment()
+        if seq is not None:
+            self._flush_through(seq)
+
+    def _close_segment(self):
+        """把当前累加的增量截断为一段，返回最后一段的编号（调用方持有 _state_lock）"""
+        if self._pending_since is not None:
+            self._segment_seq += 1
+            self._segments.append(
+                (
+                    self._segment_seq,
+                    self._move_dx,
+                    self._move_dy,
+                    self._scroll_dx,
+                    self._scroll_dy,
+                    self._pending_since,
+                )
+            )
+            self._move_dx = self._move_dy = 0.0
+            self._scroll_dx = self._scroll_dy = 0.0
+            self._pending_since = None
+            if self._frame_timer is not None:
+                self._frame_timer.cancel()
+                self._frame_timer = None
+        return self._segments[-1][0] if self._segments else None
+
+    def _flush_through(self, seq):
+        """注入编号不超过 seq 的各段增量"""
+        with self._inject_lock:
+            move_dx = move_dy = scroll_dx = scroll_dy = 0.0
+            pending_since = None
+            with self._state_lock:
+                while self._segments and self._segments[0][0] <= seq:
+                    _, mdx, mdy, sdx, sdy, since = self._segments.popleft()
+                    move_dx += mdx
+                    move_dy += mdy
+                    scroll_dx += sdx
+                    scroll_dy += sdy
+                    if pending_since is None:
+                        pending_since = since
+
+            if pending_since is None:
+                return
+
+            # 支持批量写入的后端（uinput）把本帧的移动和滚动合并为一次提交
+            with self._batch():
+                if (move_dx or move_dy) and self.cursor_state.move_by(move_dx, move_dy):
+                    self.stats["move_injections"] += 1
+
+                if scroll_dx or scroll_dy:
+                    self._inject_scroll(scroll_dx, scroll_dy)
+
+            now = time.perf_counter()
+            latency = now - pending_since
+            self._last_flush = now
+            self.stats["flushes"] += 1
+            self.stats["total_latency"] += latency
+            if latency > self.stats["max_latency"]:
+                self.stats["max_latency"] = latency
+
+    def _inject_scroll(self, scroll_dx, scroll_dy):
+        # 不足一个后端单位的滚动量留到下一帧，而不是被后端截断为0
+        scroll_dx, scroll_dy = self.scroll_accumulator.add(scroll_dx, scroll_dy)
+        if scroll_dx or scroll_dy:
+            self.mouse_controller.scroll(scroll_dx, scroll_dy)
+            self.stats["scroll_injections"] += 1
+        if metrics.enabled:
+            metrics.inc(
+                "remote_scroll_events_total",
+                result="emitted" if scroll_dx or scroll_dy else "deferred",
+            )
+
+    def get_stats(self):
+        """
+        获取调度统计信息
+
+        Returns:
+            dict: 接收事件数、实际注入次数和排队延迟（毫秒）
+        """
+        stats = dict(self.stats)
+        received = stats["moves_received"] + stats["scrolls_received"]
+        injections = stats["move_injections"] + stats["scroll_injections"]
+        flushes = stats.pop("flushes")
+        total_latency = stats.pop("total_latency")
+        stats["max_latency_ms"] = stats.pop("max_latency") * 1000
+        stats["avg_latency_ms"] = total_latency / flushes * 1000 if flushes else 0.0
+        stats["injections_saved"] = received - injections
+        stats["frame_interval_ms"] = self.frame_interval * 1000
+        stats["cursor"] = self.cursor_state.get_stats()
+        stats["scroll"] = self.scroll_accumulator.get_stats()
+        return stats
+
+    def stop(self):
+        """取消待执行的帧并注入剩余增量"""
+        self.request_flush()
+
+    def _schedule_frame(self):
+        # 对齐到帧边界，期间到达的增量会被合并到本帧
+        delay = max(0.0, self._last_flush + self.frame_interval - time.perf_counter())
+        self._frame_timer = self.timer_scheduler.call_later(delay, self._on_frame)
+
+    def _on_frame(self):
+        if not self.request_flush():
+            # 注入队列已满，下一帧重试，已截断的各段保留到下一次刷新，不会丢失
+            with self._state_lock:
+                if self._segments and self._pending_since is None:
+                    self._schedule_frame()
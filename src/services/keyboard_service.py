@@ -3,17 +3,31 @@
 处理所有键盘相关的操作逻辑
 """
 
-import time
+from core.config import WINDOWS_KEY_MAP
+from services.hotkey_engine import HotkeyEngine
+from utils.event_tracer import get_event_tracer
+from utils.input_worker import get_input_worker
+from utils.security import get_controllers, get_input_backend
 
-from core.config import KEYBOARD_CONFIG, WINDOWS_KEY_MAP
-from utils.security import get_controllers
+tracer = get_event_tracer()
+
+EV_KEY_PRESS = tracer.register("key_press", ("key",))
+EV_KEY_RELEASE = tracer.register("key_release", ("key",))
+EV_TYPE_TEXT = tracer.register("type_text", ("length",))
+EV_HOTKEY = tracer.register("hotkey", ("key_count", "job_id"))
 
 
 class KeyboardService:
     """键盘操作服务类"""
 
     def __init__(self):
+        self.input_backend = get_input_backend()
         self.mouse_controller, self.keyboard_controller = get_controllers()
+        # 所有设备注入都交给同一个注入线程执行
+        self.injector = get_input_worker()
+        self.hotkey_engine = HotkeyEngine(
+            self.keyboard_controller, injector=self.injector
+        )
 
     def press_key(self, key):
         """
@@ -22,10 +36,12 @@ class KeyboardService:
         Args:
             key: 按键名称
         """
+        if tracer.is_enabled(EV_KEY_PRESS):
+            tracer.record(EV_KEY_PRESS, tracer.intern(key))
         if key in WINDOWS_KEY_MAP:
-            self.keyboard_controller.press(WINDOWS_KEY_MAP[key])
+            self.injector.submit(self.keyboard_controller.press, WINDOWS_KEY_MAP[key])
         else:
-            self.keyboard_controller.press(key)
+            self.injector.submit(self.keyboard_controller.press, key)
 
     def release_key(self, key):
         """
@@ -34,10 +50,12 @@ class KeyboardService:
         Args:
             key: 按键名称
         """
+        if tracer.is_enabled(EV_KEY_RELEASE):
+            tracer.record(EV_KEY_RELEASE, tracer.intern(key))
         if key in WINDOWS_KEY_MAP:
-            self.keyboard_controller.release(WINDOWS_KEY_MAP[key])
+            self.injector.submit(self.keyboard_controller.release, WINDOWS_KEY_MAP[key])
         else:
-            self.keyboard_controller.release(key)
+            self.injector.submit(self.keyboard_controller.release, key)
 
     def type_text(self, text):
         """
@@ -46,26 +64,33 @@ class KeyboardService:
         Args:
             text: 要输入的文本
         """
-        self.keyboard_controller.type(text)
+        tracer.record(EV_TYPE_TEXT, len(text))
+        self.injector.submit(self.keyboard_controller.type, text)
 
-    def execute_hotkey(self, keys):
+    def execute_hotkey(self, keys, profile=None):
         """
-        执行快捷键组合
+        执行快捷键组合，按下和释放步骤由快捷键引擎异步调度
 
         Args:
             keys: 按键列表
+            profile: 时序配置名称或字典，默认使用默认配置
+
+        Returns:
+            HotkeyJob: 快捷键任务，可用于等待或查询完成状态
+        """
+        job = self.hotkey_engine.execute(keys, profile)
+        tracer.record(EV_HOTKEY, len(keys), job.job_id)
+        return job
+
+    def get_hotkey_status(self, job_id):
+        """
+        查询快捷键任务状态
+
+        Args:
+            job_id: 任务ID
+
+        Returns:
+            dict: 任务状态，不存在时返回None
         """
-        mapped_keys = []
-        for k in keys:
-            if k in WINDOWS_KEY_MAP:
-                mapped_keys.append(WINDOWS_KEY_MAP[k])
-            else:
-                mapped_keys.append(k)
-
-        for k in mapped_keys:
-            self.keyboard_controller.press(k)
-            time.sleep(KEYBOARD_CONFIG["HOTKEY_PRESS_INTERVAL"])
-
-        time.sleep(KEYBOARD_CONFIG["HOTKEY_RELEASE_INTERVAL"])
-        for k in reversed(mapped_keys):
-            self.keyboard_controller.release(k)
+        job = self.hotkey_engine.get_job(job_id)
+        return job.to_dict() if job else None
@@ -0,0 +1,169 @@
+"""
+惯性滚动模块
+双指滚动松手后按抛掷速度在服务端继续产生逐渐衰减的滚动，客户端不必持续发送事件
+"""
+
+import math
+import threading
+import time
+
+from core.config import TOUCHPAD_CONFIG
+from utils.timer_scheduler import get_timer_scheduler
+
+
+class KineticScroller:
+    """惯性滚动器
+
+    滚动过程中记录最近的滚动增量，松手时用最后一段时间窗口内的增量估计抛掷速度。
+    速度按时间常数指数衰减，每个节拍把这段时间内的位移积分交给输入调度器，
+    所有节拍都在共享的定时器线程上执行，不额外创建线程。
+    """
+
+    def __init__(
+        self,
+        input_scheduler,
+        timer_scheduler=None,
+        tick_rate=None,
+        time_constant=None,
+        start_velocity=None,
+        stop_velocity=None,
+        velocity_window=None,
+        clock=time.monotonic,
+    ):
+        config = TOUCHPAD_CONFIG
+        self.input_scheduler = input_scheduler
+        self.timer_scheduler = timer_scheduler or get_timer_scheduler()
+        self.tick_interval = 1.0 / (tick_rate or config["KINETIC_TICK_RATE"])
+        self.time_constant = time_constant or config["KINETIC_TIME_CONSTANT"]
+        if start_velocity is None:
+            start_velocity = config["KINETIC_START_VELOCITY"]
+        if stop_velocity is None:
+            stop_velocity = config["KINETIC_STOP_VELOCITY"]
+        self.start_velocity = start_velocity
+        self.stop_velocity = stop_velocity
+        self.velocity_window = velocity_window or config["KINETIC_VELOCITY_WINDOW"]
+        self.clock = clock
+
+        self._samples = []
+        self._vx = 0.0
+        self._vy = 0.0
+        self._last_tick = 0.0
+        self._timer = None
+        # 每次开始或停止都换代，已出堆但尚未执行的旧节拍据此作废
+        self._generation = 0
+        self._lock = threading.Lock()
+
+        self.stats = {"flings": 0, "ticks": 0, "cancelled": 0}
+
+    @property
+    def active(self):
+        """是否正在惯性滚动"""
+        return self._timer is not None
+
+    def track(self, dx, dy, timestamp=None):
+        """
+        记录一次手指滚动增量
+
+        Args:
+            dx: 水平滚动量（已换算为滚动单位）
+            dy: 垂直滚动量
+            timestamp: 事件时间（秒），缺省时使用时钟
+        """
+        now = self.clock() if timestamp is None else timestamp
+        with self._lock:
+            samples = self._samples
+            samples.append((now, dx, dy))
+            # 只保留速度窗口内的样本
+            while samples and now - samples[0][0] > self.velocity_window:
+                samples.pop(0)
+
+    def release(self, timestamp=None):
+        """
+        手指抬起，速度足够时开始惯性滚动
+
+        Args:
+            timestamp: 抬起时间（秒），缺省时使用时钟
+
+        Returns:
+            tuple: 抛掷速度 (vx, vy)，单位为滚动单位/秒；未开始惯性滚动时返回None
+        """
+        now = self.clock() if timestamp is None else timestamp
+        with self._lock:
+            samples = [s for s in self._samples if now - s[0] <= self.velocity_window]
+            self._samples = []
+
+            # 第一个样本的增量发生在窗口开始之前，只用来确定时间起点
+            if len(samples) < 2:
+                return None
+            span = samples[-1][0] - samples[0][0]
+            if span <= 0:
+                return None
+            vx = sum(s[1] for s in samples[1:]) / span
+            vy = sum(s[2] for s in samples[1:]) / span
+            if math.hypot(vx, vy) < self.start_velocity:
+                return None
+
+            self._cancel_timer()
+            self._vx, self._vy = vx, vy
+            self._last_tick = self.clock()
+            self._timer = self.timer_scheduler.call_later(
+                self.tick_interval, self._tick, self._generation
+            )
+            self.stats["flings"] += 1
+            return vx, vy
+
+    def cancel(self):
+        """停止惯性滚动并丢弃已记录的样本（新的触摸或滚轮事件到达时调用）"""
+        with self._lock:
+            self._samples = []
+            if self._timer is not None:
+                self._cancel_timer()
+                self.stats["cancelled"] += 1
+
+    def get_stats(self):
+        """
+        获取惯性滚动统计
+
+        Returns:
+            dict: 抛掷次数、节拍数、被打断次数及当前是否在滚动
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            stats["active"] = self._timer is not None
+        return stats
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._generation += 1
+        self._vx = self._vy = 0.0
+
+    def _tick(self, generation):
+        """定时器线程上的节拍，注入这段时间内的衰减位移"""
+        with self._lock:
+            if generation != self._generation or self._timer is None:
+                return
+
+            now = self.clock()
+            dt = now - self._last_tick
+            self._last_tick = now
+
+            # v(t) = v0 * e^(-t/τ)，位移为速度在 dt 内的积分
+            decay = math.exp(-dt / self.time_constant)
+            travel = self.time_constant * (1 - decay)
+            dx, dy = self._vx * travel, self._vy * travel
+            self._vx *= decay
+            self._vy *= decay
+            self.stats["ticks"] += 1
+
+            if math.hypot(self._vx, self._vy) < self.stop_velocity:
+                self._timer = None
+                self._generation += 1
+                self._vx = self._vy = 0.0
+            else:
+                self._timer = self.timer_scheduler.call_later(
+                    self.tick_interval, self._tick, generation
+                )
+
+        self.input_scheduler.add_scroll(dx, dy)
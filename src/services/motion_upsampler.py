@@ -0,0 +1,283 @@
+"""
+运动插值模块
+客户端以较低频率发送触摸采样时，在服务端按显示帧率把每次采样的位移平滑地分摊到多个帧
+"""
+
+import math
+import threading
+import time
+
+from core.config import TOUCHPAD_CONFIG
+from utils.timer_scheduler import get_timer_scheduler
+
+# 采样间隔估计的平滑系数
+INTERVAL_SMOOTHING = 0.3
+
+# 超过估计采样间隔的该倍数仍没有新采样时，视为停顿，立即注入剩余位移
+STALL_FACTOR = 1.5
+
+
+def _smoothing_factor(cutoff, interval):
+    tau = 1.0 / (2 * math.pi * cutoff)
+    return 1.0 / (1.0 + tau / interval)
+
+
+class OneEuroFilter:
+    """One Euro 低通滤波器
+
+    截止频率随信号变化率自适应：变化慢时截止频率低，抑制抖动；
+    变化快时截止频率高，减少滞后。
+    """
+
+    def __init__(self, min_cutoff=1.0, beta=0.0, d_cutoff=1.0):
+        """
+        Args:
+            min_cutoff: 最低截止频率（Hz）
+            beta: 截止频率随变化率增长的系数
+            d_cutoff: 变化率本身的截止频率（Hz）
+        """
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+
+    def reset(self):
+        """丢弃历史，下一个采样原样输出"""
+        self._value = None
+        self._derivative = 0.0
+
+    def __call__(self, value, interval):
+        """
+        滤波一个采样
+
+        Args:
+            value: 采样值
+            interval: 距上一个采样的时间（秒）
+
+        Returns:
+            float: 滤波后的值
+        """
+        if self._value is None or interval <= 0:
+            self._value = value
+            return value
+
+        derivative = (value - self._value) / interval
+        alpha_d = _smoothing_factor(self.d_cutoff, interval)
+        self._derivative += alpha_d * (derivative - self._derivative)
+
+        cutoff = self.min_cutoff + self.beta * abs(self._derivative)
+        alpha = _smoothing_factor(cutoff, interval)
+        self._value += alpha * (value - self._value)
+        return self._value
+
+
+class MotionUpsampler:
+    """运动插值器
+
+    按客户端时间戳估计采样间隔。间隔不超过 passthrough_interval 的高频客户端直接注入；
+    低频客户端的位移先进入待注入量，每个节拍按滤波后的速度注入一部分，
+    并把待注入量向“一个采样间隔的位移”收敛，保证下一个采样到达前光标不会停住，
+    也不会越过客户端实际发送的位移。节拍在共享的定时器线程上执行。
+    """
+
+    def __init__(
+        self,
+        input_scheduler,
+        timer_scheduler=None,
+        tick_rate=None,
+        passthrough_interval=None,
+        max_interval=None,
+        min_cutoff=None,
+        beta=None,
+        clock=time.monotonic,
+    ):
+        config = TOUCHPAD_CONFIG
+        self.input_scheduler = input_scheduler
+        self.timer_scheduler = timer_scheduler or get_timer_scheduler()
+        self.tick_interval = 1.0 / (tick_rate or config["INJECTION_FRAME_RATE"])
+        self.passthrough_interval = (
+            passthrough_interval or config["UPSAMPLE_PASSTHROUGH_INTERVAL"]
+        )
+        self.max_interval = max_interval or config["UPSAMPLE_MAX_INTERVAL"]
+        if min_cutoff is None:
+            min_cutoff = config["UPSAMPLE_MIN_CUTOFF"]
+        if beta is None:
+            beta = config["UPSAMPLE_BETA"]
+        self.clock = clock
+
+        self._filter_x = OneEuroFilter(min_cutoff, beta)
+        self._filter_y = OneEuroFilter(min_cutoff, beta)
+        self._interval = None
+        self._last_sample = None
+        self._last_arrival = 0.0
+        self._last_tick = 0.0
+        self._pending_x = 0.0
+        self._pending_y = 0.0
+        self._vx = 0.0
+        self._vy = 0.0
+        self._timer = None
+        # 每次开始或停止都换代，已出堆但尚未执行的旧节拍据此作废
+        self._generation = 0
+        self._lock = threading.Lock()
+
+        self.stats = {"passthrough": 0, "interpolated": 0, "ticks": 0, "stalls": 0}
+
+    @property
+    def active(self):
+        """是否有尚未注入完的位移"""
+        return self._timer is not None
+
+    @property
+    def sample_interval(self):
+        """估计的客户端采样间隔（秒），尚无估计时为None"""
+        return self._interval
+
+    def begin(self):
+        """
+        新的触摸开始，丢弃上一次触摸的采样时刻和速度历史
+
+        按下到开始移动之间的停留不代表客户端的发送间隔，第一个移动采样只作为间隔的起点；
+        估计的采样间隔跨触摸保留，同一客户端的发送频率通常不变。
+        """
+        with self._lock:
+            self._last_sample = None
+            self._filter_x.reset()
+            self._filter_y.reset()
+
+    def add(self, dx, dy, timestamp=None):
+        """
+        加入一次采样的光标位移
+
+        Args:
+            dx: 水平位移（已按加速曲线换算）
+            dy: 垂直位移
+            timestamp: 事件时间（秒），缺省时使用时钟
+        """
+        now = self.clock()
+        sample_time = now if timestamp is None else timestamp
+
+        with self._lock:
+            gap = None
+            if self._last_sample is not None:
+                gap = sample_time - self._last_sample
+                if not 0 < gap <= self.max_interval:
+                    gap = None
+            self._last_sample = sample_time
+
+            if gap is not None:
+                if self._interval is None:
+                    self._interval = gap
+                else:
+                    self._interval += INTERVAL_SMOOTHING * (gap - self._interval)
+
+            if self._interval is None or self._interval <= self.passthrough_interval:
+                # 高频客户端不需要插值；切换过来时把尚未注入的位移一并带上
+                dx += self._pending_x
+                dy += self._pending_y
+                self._stop()
+                self.stats["passthrough"] += 1
+                interpolate = False
+            else:
+                interval = gap or self._interval
+                self._vx = self._filter_x(dx / interval, interval)
+                self._vy = self._filter_y(dy / interval, interval)
+                self._pending_x += dx
+                self._pending_y += dy
+                self._last_arrival = now
+                self.stats["interpolated"] += 1
+                interpolate = True
+                if self._timer is None:
+                    self._last_tick = now
+                    self._timer = self.timer_scheduler.call_later(
+                        self.tick_interval, self._tick, self._generation
+                    )
+
+        if not interpolate:
+            self.input_scheduler.add_move(dx, dy)
+
+    def flush(self):
+        """立即注入全部待注入的位移（点击、按下或释放按键之前调用）"""
+        with self._lock:
+            dx, dy = self._pending_x, self._pending_y
+            self._stop()
+        if dx or dy:
+            self.input_scheduler.add_move(dx, dy)
+
+    def cancel(self):
+        """丢弃待注入的位移（会话关闭时调用）"""
+        with self._lock:
+            self._stop()
+
+    def get_stats(self):
+        """
+        获取插值统计
+
+        Returns:
+            dict: 直接注入和插值的采样数、节拍数、停顿次数及估计的采样间隔
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            stats["sample_interval_ms"] = (
+                self._interval * 1000 if self._interval is not None else None
+            )
+            stats["pending"] = (self._pending_x, self._pending_y)
+            stats["active"] = self._timer is not None
+        return stats
+
+    def _stop(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._generation += 1
+        self._pending_x = self._pending_y = 0.0
+
+    def _tick(self, generation):
+        """定时器线程上的节拍，注入这一帧分到的位移"""
+        with self._lock:
+            if generation != self._generation or self._timer is None:
+                return
+
+            now = self.clock()
+            dt = now - self._last_tick
+            self._last_tick = now
+            interval = self._interval
+            self.stats["ticks"] += 1
+
+            if now - self._last_arrival >= interval * STALL_FACTOR:
+                # 客户端停顿或触摸已结束，剩余位移全部注入
+                step_x, step_y = self._pending_x, self._pending_y
+                self.stats["stalls"] += 1
+            else:
+                # 按滤波速度前进，同时把待注入量拉向一个采样间隔的位移
+                catch_up = min(1.0, dt / interval)
+                step_x = _clamp(
+                    self._vx * dt + (self._pending_x - self._vx * interval) * catch_up,
+                    self._pending_x,
+                )
+                step_y = _clamp(
+                    self._vy * dt + (self._pending_y - self._vy * interval) * catch_up,
+                    self._pending_y,
+                )
+
+            self._pending_x -= step_x
+            self._pending_y -= step_y
+            if not self._pending_x and not self._pending_y:
+                # 已全部注入，下一个采样到达时重新开始节拍
+                self._timer = None
+                self._generation += 1
+            else:
+                self._timer = self.timer_scheduler.call_later(
+                    self.tick_interval, self._tick, generation
+                )
+
+        if step_x or step_y:
+            self.input_scheduler.add_move(step_x, step_y)
+            # 节拍本身就是帧时钟，立即注入，避免与调度器的帧定时器相位不一致
+            self.input_scheduler.request_flush()
+
+
+def _clamp(step, pending):
+    """把单轴的注入量限制在 [0, pending] 区间（pending 为负时为 [pending, 0]）"""
+    if pending >= 0:
+        return min(max(step, 0.0), pending)
+    return max(min(step, 0.0), pending)
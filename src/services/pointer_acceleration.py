@@ -0,0 +1,193 @@
+"""
+指针加速模块
+根据手指移动速度计算光标位移倍数，慢速时保持精确，快速时用更少的事件移动更远的距离
+"""
+
+import bisect
+import time
+
+from core.config import POINTER_ACCELERATION_PROFILES, TOUCHPAD_CONFIG
+
+
+class AccelerationCurve:
+    """加速曲线基类
+
+    曲线只描述速度到倍数的映射，不保存状态，可在多个触摸之间共享。
+    速度单位为客户端像素/秒。
+    """
+
+    def gain(self, speed):
+        """
+        计算位移倍数
+
+        Args:
+            speed: 手指移动速度（像素/秒）
+
+        Returns:
+            float: 光标位移倍数
+        """
+        raise NotImplementedError
+
+
+class FlatCurve(AccelerationCurve):
+    """固定倍数，不做加速"""
+
+    def __init__(self, gain):
+        self._gain = float(gain)
+
+    def gain(self, speed):
+        return self._gain
+
+
+class AdaptiveCurve(AccelerationCurve):
+    """阈值线性加速
+
+    速度低于阈值时使用基础倍数，超过阈值后倍数随速度线性增长，直到最大倍数。
+    """
+
+    def __init__(self, base_gain, max_gain, threshold, accel):
+        if max_gain < base_gain:
+            raise ValueError("max_gain 不能小于 base_gain")
+        self.base_gain = float(base_gain)
+        self.max_gain = float(max_gain)
+        self.threshold = float(threshold)
+        self.accel = float(accel)
+
+    def gain(self, speed):
+        if speed <= self.threshold:
+            return self.base_gain
+        gain = self.base_gain + (speed - self.threshold) * self.accel
+        return min(self.max_gain, gain)
+
+
+class TableCurve(AccelerationCurve):
+    """查找表曲线
+
+    由 (速度, 倍数) 点组成，点之间线性插值，超出范围时取两端的倍数。
+    """
+
+    def __init__(self, points):
+        points = sorted((float(speed), float(gain)) for speed, gain in points)
+        if not points:
+            raise ValueError("查找表不能为空")
+        self.speeds = [speed for speed, _ in points]
+        self.gains = [gain for _, gain in points]
+
+    def gain(self, speed):
+        index = bisect.bisect_right(self.speeds, speed)
+        if index == 0:
+            return self.gains[0]
+        if index == len(self.speeds):
+            return self.gains[-1]
+
+        low, high = self.speeds[index - 1], self.speeds[index]
+        ratio = (speed - low) / (high - low)
+        low_gain, high_gain = self.gains[index - 1], self.gains[index]
+        return low_gain + (high_gain - low_gain) * ratio
+
+
+CURVE_TYPES = {
+    "flat": FlatCurve,
+    "adaptive": AdaptiveCurve,
+    "table": TableCurve,
+}
+
+
+def create_curve(profile=None):
+    """
+    根据配置创建加速曲线
+
+    Args:
+        profile: 配置名称或包含 type 字段的字典，
+                 默认为 TOUCHPAD_CONFIG["ACCELERATION_PROFILE"]
+
+    Returns:
+        AccelerationCurve: 加速曲线
+
+    Raises:
+        ValueError: 配置名称或曲线类型未知、参数无效
+    """
+    if profile is None:
+        profile = TOUCHPAD_CONFIG["ACCELERATION_PROFILE"]
+
+    if isinstance(profile, AccelerationCurve):
+        return profile
+    if isinstance(profile, str):
+        if profile not in POINTER_ACCELERATION_PROFILES:
+            raise ValueError(f"未知的指针加速配置: {profile}")
+        profile = POINTER_ACCELERATION_PROFILES[profile]
+    if not isinstance(profile, dict):
+        raise ValueError(f"无效的指针加速配置: {profile!r}")
+
+    params = dict(profile)
+    curve_type = params.pop("type", None)
+    if curve_type not in CURVE_TYPES:
+        raise ValueError(f"未知的加速曲线类型: {curve_type}")
+
+    try:
+        return CURVE_TYPES[curve_type](**params)
+    except TypeError as e:
+        raise ValueError(f"无效的加速曲线参数: {e}") from e
+
+
+class PointerAccelerator:
+    """单个触摸的指针加速器
+
+    用客户端时间戳计算两次移动之间的速度（时间戳缺失时使用服务端时钟），
+    速度做指数平滑以抵抗采样抖动，再按曲线换算为光标位移。
+    """
+
+    def __init__(
+        self, curve, smoothing=0.5, max_interval=0.1, clock=time.monotonic
+    ):
+        """
+        Args:
+            curve: 加速曲线
+            smoothing: 新速度样本的权重，1 为不平滑
+            max_interval: 超过该间隔（秒）的停顿视为重新起步，速度从零开始
+            clock: 时间戳缺失时使用的时钟
+        """
+        self.curve = curve
+        self.smoothing = smoothing
+        self.max_interval = max_interval
+        self.clock = clock
+        self.speed = 0.0
+        self._last_time = None
+
+    def reset(self, timestamp=None):
+        """
+        清除速度状态
+
+        Args:
+            timestamp: 触摸开始时间（秒），提供后第一次移动即可计算速度
+        """
+        self.speed = 0.0
+        self._last_time = timestamp
+
+    def apply(self, dx, dy, timestamp=None):
+        """
+        计算加速后的光标位移
+
+        Args:
+            dx: 手指水平位移（客户端像素）
+            dy: 手指垂直位移（客户端像素）
+            timestamp: 事件时间（秒），缺省时使用时钟
+
+        Returns:
+            tuple: 光标位移 (dx, dy)
+        """
+        now = self.clock() if timestamp is None else timestamp
+        last = self._last_time
+        self._last_time = now
+
+        if last is not None:
+            interval = now - last
+            if interval > self.max_interval:
+                self.speed = 0.0
+            elif interval > 0:
+                # 同一毫秒内的多个事件无法计算速度，沿用上一次的速度
+                sample = (dx * dx + dy * dy) ** 0.5 / interval
+                self.speed += (sample - self.speed) * self.smoothing
+
+        gain = self.curve.gain(self.speed)
+        return dx * gain, dy * gain
@@ -10,7 +10,8 @@ import logging
 logger = logging.getLogger(__name__)
 
 from core.config import CURRENT_PLATFORM
-from utils.system_utils import get_system_info
+from utils.event_tracer import get_event_tracer
+from utils.system_utils import get_system_info, invalidate_screen_size
 
 
 class SystemService:
@@ -77,19 +78,37 @@ class SystemService:
 
         return {"status": "error", "message": "Linux系统锁屏失败，所有锁屏命令都不可用"}
 
-    def get_system_status(self):
+    def get_system_status(self, refresh=False):
         """
         获取系统状态信息
 
+        Args:
+            refresh: 是否重新检测屏幕尺寸（如切换显示器后）
+
         Returns:
             dict: 系统状态信息
         """
         try:
+            if refresh:
+                invalidate_screen_size()
             system_info = get_system_info()
             return {"status": "success", "data": system_info}
         except Exception as e:
             return {"status": "error", "message": f"获取系统信息失败: {str(e)}"}
 
+    def dump_event_trace(self):
+        """
+        把事件追踪缓冲区导出到 TRACE_CONFIG["DUMP_PATH"]
+
+        Returns:
+            dict: 操作结果
+        """
+        try:
+            count = get_event_tracer().dump()
+            return {"status": "success", "message": f"已导出 {count} 条追踪记录"}
+        except Exception as e:
+            return {"status": "error", "message": f"导出事件追踪失败: {str(e)}"}
+
     def shutdown_system(self):
         """
         关闭系统
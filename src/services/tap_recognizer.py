@@ -0,0 +1,150 @@
+"""
+点击识别模块
+在手势已不可能变成移动、滚动或拖拽的时刻立即提交点击，并统计每次点击的延迟
+"""
+
+import threading
+import time
+
+from core.config import TOUCHPAD_CONFIG
+from utils.metrics import Histogram, metrics
+
+# 点击动作
+TAP_LEFT_CLICK = "left_click"
+TAP_RIGHT_CLICK = "right_click"
+
+
+class TapRecognizer:
+    """点击识别器
+
+    触摸只有抬起时才能确定是否为点击：抬起前移动超过 move_threshold 会变成移动或滚动，
+    按住超过 max_duration 不再算点击，第二、三根手指落下会变成滚动或拖拽。
+    抬起是最早能确定的时刻，单指轻点立即提交左键点击，双指轻点立即提交右键点击，
+    不再等待固定的点击延迟。
+
+    单指点击后 drag_window 内再次按下为点击拖拽的候选：移动超过阈值即按下左键拖拽，
+    未移动就抬起则是第二次点击，系统据两次点击的间隔自行识别双击。
+    第一次点击已经提交，系统看到的点击拖拽与双击拖拽相同。
+    """
+
+    def __init__(
+        self,
+        max_duration=None,
+        move_threshold=None,
+        drag_window=None,
+        clock=time.monotonic,
+    ):
+        """
+        Args:
+            max_duration: 按住不超过该时间（秒）才算点击
+            move_threshold: 抬起前移动不超过该距离才算点击
+            drag_window: 点击后再次按下可开始拖拽的时间窗口（秒），0 为关闭点击拖拽
+            clock: 时钟函数
+        """
+        config = TOUCHPAD_CONFIG
+        self.max_duration = (
+            config["TAP_MAX_DURATION"] if max_duration is None else max_duration
+        )
+        self.move_threshold = (
+            config["MOVE_THRESHOLD"] if move_threshold is None else move_threshold
+        )
+        self.drag_window = (
+            config["TAP_DRAG_WINDOW"] if drag_window is None else drag_window
+        )
+        self.clock = clock
+
+        self._latency = Histogram()
+        self._lock = threading.Lock()
+        self.stats = {
+            TAP_LEFT_CLICK: 0,
+            TAP_RIGHT_CLICK: 0,
+            "tap_drags": 0,
+            "too_long": 0,
+        }
+
+    def classify(self, fingers, duration, distance):
+        """
+        判断抬起的触摸是否为点击
+
+        Args:
+            fingers: 手指数，1 为单指、2 为双指
+            duration: 按住时间（秒）
+            distance: 抬起前移动的距离
+
+        Returns:
+            str: TAP_LEFT_CLICK、TAP_RIGHT_CLICK，不是点击时返回None
+        """
+        if distance > self.move_threshold:
+            return None
+        action = {1: TAP_LEFT_CLICK, 2: TAP_RIGHT_CLICK}.get(fingers)
+        if action is None:
+            return None
+        if duration > self.max_duration:
+            self.stats["too_long"] += 1
+            return None
+        return action
+
+    def commit(self, session, action):
+        """
+        提交点击，单指点击同时开启点击拖拽的时间窗口
+
+        Args:
+            session: 触摸会话
+            action: 点击动作
+        """
+        self.stats[action] += 1
+        session.last_tap_time = self.clock() if action == TAP_LEFT_CLICK else None
+
+    def arm_drag(self, session):
+        """
+        新的单指触摸开始时判断是否为点击拖拽的候选，窗口只能使用一次
+
+        Args:
+            session: 触摸会话
+
+        Returns:
+            bool: 是否在上次点击后的拖拽窗口内
+        """
+        last_tap_time = session.last_tap_time
+        session.last_tap_time = None
+        return (
+            last_tap_time is not None
+            and self.drag_window > 0
+            and self.clock() - last_tap_time <= self.drag_window
+        )
+
+    def record_drag(self):
+        """记录一次点击拖拽"""
+        self.stats["tap_drags"] += 1
+
+    def record_latency(self, action, seconds):
+        """
+        记录从抬起到点击注入完成的延迟（注入线程上调用）
+
+        Args:
+            action: 点击动作
+            seconds: 延迟（秒）
+        """
+        with self._lock:
+            self._latency.record(seconds)
+        if metrics.enabled:
+            metrics.observe("remote_tap_latency_seconds", seconds, action=action)
+
+    def get_stats(self):
+        """
+        获取点击统计
+
+        Returns:
+            dict: 各类点击次数、点击拖拽次数、按住过久的次数和点击延迟分布（毫秒）
+        """
+        stats = dict(self.stats)
+        with self._lock:
+            latency = self._latency
+            stats["latency_ms"] = {
+                "count": latency.count,
+                "avg": latency.sum / latency.count * 1000 if latency.count else 0.0,
+                "p50": latency.percentile(0.5) * 1000,
+                "p99": latency.percentile(0.99) * 1000,
+                "max": latency.max * 1000,
+            }
+        return stats
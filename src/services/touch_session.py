@@ -0,0 +1,391 @@
+"""
+触摸会话模块
+按客户端隔离手势状态，多个控制设备共用同一套注入通道时互不干扰
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from core.config import TOUCHPAD_CONFIG
+
+DEFAULT_CLIENT_ID = "default"
+
+# 触摸阶段
+PHASE_IDLE = "idle"
+PHASE_PENDING_TAP = "pending_tap"
+PHASE_MOVING = "moving"
+PHASE_SCROLLING = "scrolling"
+PHASE_DRAGGING = "dragging"
+PHASE_PINCHING = "pinching"
+PHASE_SWIPING = "swiping"
+
+# 多指手势阶段之间可以随手指增减互相转换
+_MULTI_TOUCH = {PHASE_SCROLLING, PHASE_PINCHING, PHASE_SWIPING, PHASE_DRAGGING}
+
+# 允许的阶段转换：拖拽按住了鼠标按键，只能在抬起时结束；
+# 缩放只能由手势识别在双指移动时锁定，不能直接从空闲进入
+TRANSITIONS = {
+    PHASE_IDLE: frozenset(
+        {PHASE_PENDING_TAP, PHASE_SCROLLING, PHASE_SWIPING, PHASE_DRAGGING}
+    ),
+    PHASE_PENDING_TAP: frozenset({PHASE_MOVING, PHASE_IDLE, *_MULTI_TOUCH}),
+    PHASE_MOVING: frozenset({PHASE_IDLE, *_MULTI_TOUCH}),
+    PHASE_SCROLLING: frozenset({PHASE_MOVING, PHASE_IDLE, *_MULTI_TOUCH}),
+    PHASE_PINCHING: frozenset({PHASE_MOVING, PHASE_IDLE, *_MULTI_TOUCH}),
+    PHASE_SWIPING: frozenset({PHASE_MOVING, PHASE_IDLE, *_MULTI_TOUCH}),
+    PHASE_DRAGGING: frozenset({PHASE_IDLE}),
+}
+
+# 阶段在追踪记录中的编码
+PHASE_CODES = {
+    PHASE_IDLE: 0,
+    PHASE_PENDING_TAP: 1,
+    PHASE_MOVING: 2,
+    PHASE_SCROLLING: 3,
+    PHASE_DRAGGING: 4,
+    PHASE_PINCHING: 5,
+    PHASE_SWIPING: 6,
+}
+
+
+class InvalidTransition(ValueError):
+    """不允许的触摸阶段转换"""
+
+
+class TouchState:
+    """单个触摸的状态
+
+    定长属性代替按字符串索引的字典，每次移动只做属性读写；
+    阶段只能按 TRANSITIONS 转换，转换时机由 TouchpadService 决定。
+    """
+
+    __slots__ = (
+        "touch_id",
+        "start_x",
+        "start_y",
+        "x",
+        "y",
+        "start_time",
+        "accelerator",
+        "phase",
+        "tap_drag",
+        "gesture",
+    )
+
+    def __init__(self, touch_id, x, y, start_time, accelerator=None, gesture=None):
+        self.touch_id = touch_id
+        self.start_x = self.x = x
+        self.start_y = self.y = y
+        self.start_time = start_time
+        self.accelerator = accelerator
+        self.phase = PHASE_IDLE
+        # 在上一次点击的拖拽窗口内按下，移动时进入拖拽而不是移动
+        self.tap_drag = False
+        # 多点手势识别（GestureTracker）
+        self.gesture = gesture
+
+    @property
+    def distance(self):
+        """距起点的直线距离"""
+        return ((self.x - self.start_x) ** 2 + (self.y - self.start_y) ** 2) ** 0.5
+
+    def move_to(self, x, y):
+        """
+        更新当前位置
+
+        Args:
+            x: 新的横坐标
+            y: 新的纵坐标
+
+        Returns:
+            tuple: 相对上一位置的位移 (dx, dy)
+        """
+        dx, dy = x - self.x, y - self.y
+        self.x, self.y = x, y
+        return dx, dy
+
+    def transition(self, phase):
+        """
+        转换到新阶段
+
+        Args:
+            phase: 目标阶段
+
+        Returns:
+            bool: 是否发生了转换（已处于目标阶段时返回False）
+
+        Raises:
+            InvalidTransition: 不允许从当前阶段转换到目标阶段
+        """
+        if phase == self.phase:
+            return False
+        if phase not in TRANSITIONS[self.phase]:
+            raise InvalidTransition(f"不允许的触摸阶段转换: {self.phase} -> {phase}")
+        self.phase = phase
+        return True
+
+
+class TouchSession:
+    """单个客户端的手势状态"""
+
+    __slots__ = (
+        "client_id",
+        "active_touches",
+        "last_touch_time",
+        "last_tap_time",
+        "zoom_modifier_held",
+        "kinetic_scroller",
+        "motion_upsampler",
+        "last_seen",
+    )
+
+    def __init__(self, client_id, kinetic_scroller=None, motion_upsampler=None):
+        self.client_id = client_id
+        self.active_touches = {}
+        self.last_touch_time = 0
+        self.last_tap_time = None
+        # 缩放期间按住的 Ctrl 键
+        self.zoom_modifier_held = False
+        self.kinetic_scroller = kinetic_scroller
+        self.motion_upsampler = motion_upsampler
+        self.last_seen = 0.0
+
+    @property
+    def is_dragging(self):
+        """是否有触摸处于拖拽阶段"""
+        return any(
+            touch.phase == PHASE_DRAGGING for touch in self.active_touches.values()
+        )
+
+    def get_status(self):
+        """
+        获取会话状态
+
+        Returns:
+            dict: 活动触摸数、阶段和拖拽状态
+        """
+        return {
+            "client_id": self.client_id,
+            "active_touches_count": len(self.active_touches),
+            "touch_phases": [touch.phase for touch in self.active_touches.values()],
+            "is_dragging": self.is_dragging,
+            "last_touch_time": self.last_touch_time,
+        }
+
+
+class TouchSessionRegistry:
+    """触摸会话表
+
+    按客户端标识创建会话，按最近使用顺序保存。查找时顺带清理空闲超时的会话
+    （最多每秒一次），会话数超过上限时淘汰最久未使用的会话。
+    """
+
+    def __init__(
+        self,
+        factory,
+        on_evict=None,
+        idle_timeout=None,
+        max_sessions=None,
+        clock=time.monotonic,
+    ):
+        """
+        Args:
+            factory: 以客户端标识创建 TouchSession 的函数
+            on_evict: 会话被淘汰时的清理回调
+            idle_timeout: 空闲超时（秒）
+            max_sessions: 最多保留的会话数
+            clock: 单调时钟
+        """
+        self.factory = factory
+        self.on_evict = on_evict
+        self.idle_timeout = idle_timeout or TOUCHPAD_CONFIG["SESSION_IDLE_TIMEOUT"]
+        self.max_sessions = max_sessions or TOUCHPAD_CONFIG["MAX_SESSIONS"]
+        self.clock = clock
+
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_sweep = 0.0
+        self.stats = {"created": 0, "evicted": 0}
+
+    def get(self, client_id=None):
+        """
+        获取客户端的会话，不存在时创建
+
+        Args:
+            client_id: 客户端标识，缺省时使用默认会话
+
+        Returns:
+            TouchSession: 会话
+        """
+        client_id = client_id or DEFAULT_CLIENT_ID
+        now = self.clock()
+        evicted = []
+
+        with self._lock:
+            session = self._sessions.get(client_id)
+            if session is None:
+                session = self.factory(client_id)
+                self._sessions[client_id] = session
+                self.stats["created"] += 1
+            else:
+                self._sessions.move_to_end(client_id)
+            session.last_seen = now
+
+            if now - self._last_sweep >= 1.0:
+                self._last_sweep = now
+                evicted.extend(self._pop_idle(now))
+            while len(self._sessions) > self.max_sessions:
+                evicted.append(self._sessions.popitem(last=False)[1])
+
+            self.stats["evicted"] += len(evicted)
+
+        self._evict(evicted)
+        return session
+
+    def evict_idle(self):
+        """
+        立即清理空闲超时的会话
+
+        Returns:
+            int: 清理的会话数
+        """
+        with self._lock:
+            evicted = self._pop_idle(self.clock())
+            self.stats["evicted"] += len(evicted)
+        self._evict(evicted)
+        return len(evicted)
+
+    def sessions(self):
+        """
+        当前会话的快照
+
+        Returns:
+            list: TouchSession 列表，按最近使用排序
+        """
+        with self._lock:
+            return list(self._sessions.values())
+
+    def clear(self):
+        """清理全部会话"""
+        with self._lock:
+            evicted = list(self._sessions.values())
+            self._sessions.clear()
+        self._evict(evicted)
+
+    def get_stats(self):
+        """
+        获取会话统计
+
+        Returns:
+            dict: 当前、已创建和已淘汰的会话数
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            stats["active"] = len(self._sessions)
+        return stats
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def _pop_idle(self, now):
+        evicted = []
+        # 按最近使用排序，遇到未超时的会话即可停止
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if now - session.last_seen < self.idle_timeout:
+                break
+            evicted.append(self._sessions.popitem(last=False)[1])
+        return evicted
+
+    def _evict(self, sessions):
+        if self.on_evict is not None:
+            for session in sessions:
+                self.on_evict(session)
+
+
+class ButtonArbiter:
+    """按键仲裁
+
+    多个会话可能同时按住同一个按键（如两台设备都在三指拖拽，或都在双指缩放时按住 Ctrl）。
+    第一个持有者按下时才注入按下，最后一个持有者松开时才注入释放，
+    一个会话结束拖拽或缩放不会打断另一个会话。
+    """
+
+    def __init__(self, mouse_controller, input_scheduler, keyboard_controller=None):
+        self.mouse_controller = mouse_controller
+        self.keyboard_controller = keyboard_controller
+        self.input_scheduler = input_scheduler
+        # 按键 -> (控制器, 持有者集合)
+        self._owners = {}
+        self._lock = threading.Lock()
+
+    def press(self, owner, button):
+        """
+        按下鼠标按键
+
+        Args:
+            owner: 持有者（会话）
+            button: 鼠标按键
+        """
+        self._press(owner, button, self.mouse_controller)
+
+    def press_key(self, owner, key):
+        """
+        按下键盘按键（如缩放用的修饰键）
+
+        Args:
+            owner: 持有者（会话）
+            key: 键盘按键
+        """
+        self._press(owner, key, self.keyboard_controller)
+
+    def release(self, owner, button):
+        """
+        释放按键
+
+        Args:
+            owner: 持有者（会话）
+            button: 鼠标按键或键盘按键
+        """
+        with self._lock:
+            controller, owners = self._owners.get(button, (None, ()))
+            if owner not in owners:
+                return
+            owners.discard(owner)
+            if not owners:
+                # 先注入之前的移动和滚动，释放发生在最终位置，缩放的滚轮仍带着修饰键
+                self.input_scheduler.submit_after_flush(controller.release, button)
+
+    def release_all(self, owner):
+        """
+        释放持有者按住的全部按键
+
+        Args:
+            owner: 持有者（会话）
+        """
+        for button in list(self._owners):
+            self.release(owner, button)
+
+    def _press(self, owner, button, controller):
+        with self._lock:
+            _, owners = self._owners.setdefault(button, (controller, set()))
+            first = not owners
+            owners.add(owner)
+            if first:
+                # 与尚未发出的移动和滚动在同一个注入任务中，按下发生在光标的当前位置，
+                # 之前的滚轮不会带上修饰键
+                self.input_scheduler.submit_after_flush(controller.press, button)
+
+    def holders(self, button):
+        """
+        按住某个按键的持有者数量
+
+        Args:
+            button: 鼠标按键或键盘按键
+
+        Returns:
+            int: 持有者数量
+        """
+        with self._lock:
+            return len(self._owners.get(button, (None, ()))[1])
@@ -4,36 +4,206 @@
 """
 
 import logging
-import threading
+import math
 import time
 
 from pynput import mouse
+from pynput.keyboard import Key
 
 from core.config import TOUCHPAD_CONFIG
-from utils.security import get_controllers
-
-logger = logging.getLogger(__name__)
+from services.gesture_engine import GESTURE_PINCH, GESTURE_SCROLL, GestureTracker
+from services.hotkey_engine import HotkeyEngine
+from services.input_scheduler import InputScheduler
+from services.kinetic_scroll import KineticScroller
+from services.motion_upsampler import MotionUpsampler
+from services.pointer_acceleration import PointerAccelerator, create_curve
+from services.tap_recognizer import TAP_LEFT_CLICK, TAP_RIGHT_CLICK, TapRecognizer
+from services.touch_session import (
+    PHASE_CODES,
+    PHASE_DRAGGING,
+    PHASE_IDLE,
+    PHASE_MOVING,
+    PHASE_PENDING_TAP,
+    PHASE_PINCHING,
+    PHASE_SCROLLING,
+    PHASE_SWIPING,
+    ButtonArbiter,
+    TouchSession,
+    TouchSessionRegistry,
+    TouchState,
+)
+from utils.event_tracer import get_event_tracer
+from utils.input_worker import get_input_worker
+from utils.security import get_controllers, get_input_backend
+from utils.timer_scheduler import get_timer_scheduler
+
+tracer = get_event_tracer()
+
+# 触摸模式和结束动作在追踪记录中的编码
+MODE_CODES = {"single": 1, "scroll": 2, "dragging": 3, "swipe": 4}
+START_PHASES = {
+    "single": PHASE_PENDING_TAP,
+    "scroll": PHASE_SCROLLING,
+    "dragging": PHASE_DRAGGING,
+    "swipe": PHASE_SWIPING,
+}
+GESTURE_CODES = {GESTURE_PINCH: 1, "swipe": 2}
+
+# 缩放期间按住的修饰键，配合滚轮实现 Ctrl+滚轮缩放
+ZOOM_MODIFIER = Key.ctrl_l
+
+# 轻扫快捷键使用的时序配置
+SWIPE_HOTKEY_PROFILE = "fast"
+ACTION_CODES = {None: 0, "left_click": 1, "right_click": 2, "drag_release": 3}
+
+# 可能是点击的阶段及其手指数，点击动作对应的鼠标按键
+TAP_FINGERS = {PHASE_PENDING_TAP: 1, PHASE_SCROLLING: 2}
+TAP_BUTTONS = {TAP_LEFT_CLICK: mouse.Button.left, TAP_RIGHT_CLICK: mouse.Button.right}
+
+EV_TOUCH_START = tracer.register("touch_start", ("touch_count", "x", "y", "mode"))
+EV_TOUCH_MOVE = tracer.register(
+    "touch_move", ("touch_count", "dx", "dy", "distance"), sampled=True
+)
+EV_TOUCH_MOVE_INVALID = tracer.register(
+    "touch_move_invalid", ("touches", "active_touches"), level=logging.INFO
+)
+EV_TOUCH_END = tracer.register(
+    "touch_end", ("phase", "duration", "distance", "action")
+)
+EV_TOUCH_END_INVALID = tracer.register(
+    "touch_end_invalid", ("active_touches",), level=logging.INFO
+)
+EV_SCROLL = tracer.register("scroll", ("source", "dx", "dy"), sampled=True)
+EV_CLICK_FIRED = tracer.register("click_fired", ("action",))
+EV_TAP_DRAG = tracer.register("tap_drag")
+EV_KINETIC_SCROLL = tracer.register("kinetic_scroll", ("touch_count", "vx", "vy"))
+EV_GESTURE = tracer.register("gesture", ("touch_count", "gesture"))
+
+
+def _touch_count(touches_data):
+    """手指数，优先使用 touch_count 字段"""
+    if "touch_count" in touches_data:
+        return touches_data["touch_count"]
+    if "touches" in touches_data:
+        return len(touches_data["touches"])
+    return 1
+
+
+def _check_coordinates(touches_data):
+    """
+    校验触摸点和合并帧的坐标，缺失的坐标按0处理
+
+    Args:
+        touches_data: 触摸数据
+
+    Raises:
+        ValueError: 触摸点不是字典或坐标不是有限的数值
+    """
+    frames = touches_data.get("frames") or []
+    if not isinstance(frames, list):
+        raise ValueError("无效的触摸帧")
+    for touches in (*frames, touches_data["touches"]):
+        if not isinstance(touches, list):
+            raise ValueError("无效的触摸数据")
+        for touch in touches:
+            if not isinstance(touch, dict):
+                raise ValueError("无效的触摸点")
+            for axis in ("x", "y"):
+                value = touch.get(axis, 0)
+                # bool 是 int 的子类，也不是有效坐标
+                if (
+                    isinstance(value, bool)
+                    or not isinstance(value, (int, float))
+                    or not math.isfinite(value)
+                ):
+                    raise ValueError(f"无效的触摸坐标: {axis}={value!r}")
+
+
+def _event_time(touches_data):
+    """客户端时间戳（毫秒）换算为秒，缺失时返回None"""
+    timestamp = touches_data.get("timestamp")
+    if isinstance(timestamp, (int, float)):
+        return timestamp / 1000
+    return None
 
 
 class TouchpadService:
     """触摸板操作服务类"""
 
     def __init__(self):
+        self.input_backend = get_input_backend()
         self.mouse_controller, self.keyboard_controller = get_controllers()
 
-        # 触摸板状态变量
-        self.touchpad_state = {
-            "active_touches": {},
-            "last_touch_time": 0,
-            "is_dragging": False,
-            "drag_start_pos": None,
-            "pending_click": None,
-            "click_timer": None,
-        }
-
         # 配置参数
         self.config = TOUCHPAD_CONFIG
 
+        # 惯性滚动、运动插值等定时任务共用一个调度线程
+        self.timer_scheduler = get_timer_scheduler()
+
+        # 所有设备注入都交给同一个注入线程执行
+        self.injector = get_input_worker()
+
+        # 按帧合并移动和滚动增量
+        self.input_scheduler = InputScheduler(
+            self.mouse_controller,
+            timer_scheduler=self.timer_scheduler,
+            injector=self.injector,
+            batch=self.input_backend.batch,
+        )
+
+        # 抬起时立即判断点击，不再等待固定延迟
+        self.tap_recognizer = TapRecognizer()
+
+        # 三指轻扫触发的快捷键与键盘服务一样按时间线调度
+        self.hotkey_engine = HotkeyEngine(
+            self.keyboard_controller,
+            timer_scheduler=self.timer_scheduler,
+            injector=self.injector,
+        )
+        # 其他会话缩放期间丢弃的滚动次数
+        self.gesture_stats = {"pinches": 0, "swipes": 0, "scrolls_suppressed": 0}
+
+        # 多个客户端共用按键时由仲裁器决定何时真正按下和释放
+        self.button_arbiter = ButtonArbiter(
+            self.mouse_controller, self.input_scheduler, self.keyboard_controller
+        )
+
+        # 手势状态按客户端隔离，所有会话的移动和滚动汇入同一个调度器
+        self.sessions = TouchSessionRegistry(
+            self._create_session, on_evict=self._close_session
+        )
+
+    def get_session(self, client_id=None):
+        """
+        获取客户端的触摸会话
+
+        Args:
+            client_id: 客户端标识，缺省时使用默认会话
+
+        Returns:
+            TouchSession: 会话
+        """
+        return self.sessions.get(client_id)
+
+    def _create_session(self, client_id):
+        # 每个会话有自己的惯性滚动，松手后的滚动不会被其他设备的触摸打断
+        kinetic_scroller = KineticScroller(
+            self.input_scheduler, timer_scheduler=self.timer_scheduler
+        )
+        # 运动插值按客户端估计采样间隔，不同发送频率的设备各自插值
+        motion_upsampler = MotionUpsampler(
+            self.input_scheduler, timer_scheduler=self.timer_scheduler
+        )
+        return TouchSession(client_id, kinetic_scroller, motion_upsampler)
+
+    def _close_session(self, session):
+        """释放会话持有的惯性滚动、插值中的位移和按键"""
+        session.kinetic_scroller.cancel()
+        session.motion_upsampler.cancel()
+        self._hold_zoom_modifier(session, False)
+        self.button_arbiter.release_all(session)
+        session.active_touches.clear()
+
     def detect_touch_mode(self, touches_data):
         """
         检测触摸模式
@@ -42,24 +212,19 @@ class TouchpadService:
             touches_data: 触摸数据
 
         Returns:
-            str: 触摸模式 ('single', 'scroll', 'zoom')
+            str: 触摸模式 ('single', 'scroll', 'dragging', 'swipe')；
+                 双指的滚动和缩放由手势识别在移动时区分
         """
-        # 优先使用touch_count字段
-        if "touch_count" in touches_data:
-            touch_count = touches_data["touch_count"]
-        elif "touches" in touches_data:
-            touch_count = len(touches_data["touches"])
-        else:
-            touch_count = 1
-
-        logger.debug(f"检测触摸模式: touch_count={touch_count}")
+        touch_count = _touch_count(touches_data)
 
         if touch_count == 1:
             return "single"
         elif touch_count == 2:
             return "scroll"
         elif touch_count >= 3:
-            return "dragging"
+            if self.config["THREE_FINGER_GESTURE"] == "drag":
+                return "dragging"
+            return "swipe"
         else:
             return "single"
 
@@ -72,46 +237,57 @@ class TouchpadService:
 
         Returns:
             dict: 响应数据
-        """
-        logger.debug(f"收到触摸开始数据: {touches_data}")  # 添加调试日志
 
+        Raises:
+            ValueError: 触摸坐标无效
+        """
+        session = self.get_session(touches_data.get("client_id"))
         touch_id = touches_data.get("touch_id", "default")
         touches = touches_data.get("touches", [])
 
         if not touches:
             return {"status": "error", "message": "无效的触摸数据"}
+        _check_coordinates(touches_data)
+
+        # 先校验请求，无效的触摸不能打断本会话正在进行的惯性滚动和插值
+        try:
+            curve = create_curve(touches_data.get("acceleration"))
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}
+
+        # 新的触摸让本会话正在进行的惯性滚动立即停下
+        session.kinetic_scroller.cancel()
+        session.motion_upsampler.begin()
 
         touch = touches[0]
         x, y = touch.get("x", 0), touch.get("y", 0)
 
-        # 记录触摸状态
-        self.touchpad_state["active_touches"][touch_id] = {
-            "start_x": x,
-            "start_y": y,
-            "current_x": x,
-            "current_y": y,
-            "start_time": time.time(),
-        }
-
-        logger.debug(
-            f"触摸开始记录: touch_id={touch_id}, 位置=({x}, {y}), 触摸模式={self.detect_touch_mode(touches_data)}"
-        )
+        # 每个触摸单独计算速度，按加速曲线换算光标位移
+        accelerator = PointerAccelerator(curve)
+        accelerator.reset(_event_time(touches_data))
+
+        # 同一触摸ID重复开始时先结束旧触摸，避免其按住的按键无人释放
+        previous = session.active_touches.get(touch_id)
+        if previous is not None and previous.phase == PHASE_DRAGGING:
+            self.button_arbiter.release(session, mouse.Button.left)
+        elif previous is not None and previous.phase == PHASE_PINCHING:
+            self._hold_zoom_modifier(session, False)
+
+        # 记录触摸状态，全部触摸点作为手势识别的第一帧
+        gesture = GestureTracker()
+        gesture.update([touches], _touch_count(touches_data))
+        state = TouchState(touch_id, x, y, time.time(), accelerator, gesture)
+        session.active_touches[touch_id] = state
 
         # 检测触摸模式
         mode = self.detect_touch_mode(touches_data)
+        tracer.record(EV_TOUCH_START, len(touches), x, y, MODE_CODES[mode])
 
+        # 单指等待判定为点击，刚点击过则可能是点击拖拽；双指进入滚动，
+        # 三指按配置进入轻扫或拖拽
         if mode == "single":
-            # 单指触摸，准备延迟点击
-            self._prepare_delayed_click()
-        elif mode == "scroll":
-            # 双指触摸，准备滚动
-            self._cancel_pending_click()
-        elif mode == "dragging":
-            # 三指触摸，准备拖拽
-            self._cancel_pending_click()
-            self.touchpad_state["is_dragging"] = True
-            self.touchpad_state["drag_start_pos"] = (x, y)
-            self.mouse_controller.press(mouse.Button.left)
+            state.tap_drag = self.tap_recognizer.arm_drag(session)
+        self._enter_phase(session, state, START_PHASES[mode])
 
         return {"status": "success", "mode": mode}
 
@@ -124,70 +300,93 @@ class TouchpadService:
 
         Returns:
             dict: 响应数据
-        """
-        logger.debug(f"收到触摸移动数据: {touches_data}")  # 添加调试日志
 
+        Raises:
+            ValueError: 触摸坐标无效
+        """
+        session = self.get_session(touches_data.get("client_id"))
         touch_id = touches_data.get("touch_id", "default")
         touches = touches_data.get("touches", [])
+        state = session.active_touches.get(touch_id)
 
-        if not touches or touch_id not in self.touchpad_state["active_touches"]:
-            logger.debug(
-                f"无效的触摸移动: touch_id={touch_id}, touches={len(touches)}, active_touches={list(self.touchpad_state['active_touches'].keys())}"
+        if not touches or state is None:
+            tracer.record(
+                EV_TOUCH_MOVE_INVALID,
+                len(touches),
+                len(session.active_touches),
             )
             return {"status": "error", "message": "无效的触摸移动"}
+        _check_coordinates(touches_data)
 
         touch = touches[0]
-        x, y = touch.get("x", 0), touch.get("y", 0)
-
-        # 更新触摸状态
-        touch_state = self.touchpad_state["active_touches"][touch_id]
-        prev_x, prev_y = touch_state["current_x"], touch_state["current_y"]
-        touch_state["current_x"] = x
-        touch_state["current_y"] = y
-
-        # 计算移动距离
-        dx = x - prev_x
-        dy = y - prev_y
-        total_distance = (
-            (x - touch_state["start_x"]) ** 2 + (y - touch_state["start_y"]) ** 2
-        ) ** 0.5
-
-        logger.debug(f"移动计算: dx={dx}, dy={dy}, total_distance={total_distance}")
+        dx, dy = state.move_to(touch.get("x", 0), touch.get("y", 0))
+        total_distance = state.distance
 
         # 检测触摸模式
         mode = self.detect_touch_mode(touches_data)
+        tracer.record(EV_TOUCH_MOVE, len(touches), dx, dy, total_distance)
 
-        if mode == "single":
-            if total_distance > self.config["MOVE_THRESHOLD"]:
-                # 移动距离超过阈值，取消点击，开始拖拽或移动鼠标
-                self._cancel_pending_click()
-
-            # 移动鼠标光标
-            current_pos = self.mouse_controller.position
-            new_x = current_pos[0] + dx * self.config["CURSOR_SENSITIVITY"]
-            new_y = current_pos[1] + dy * self.config["CURSOR_SENSITIVITY"]
-            logger.debug(f"移动鼠标: 从 {current_pos} 到 ({new_x}, {new_y})")
-            self.mouse_controller.position = (new_x, new_y)
+        # 合并发送的一批移动（frames 为之前各帧的触摸点）由手势识别一次处理
+        frames = touches_data.get("frames") or []
+        gesture = state.gesture.update(
+            [*frames, touches], _touch_count(touches_data)
+        )
 
+        # 拖拽按住了鼠标按键，抬起前一直保持；单指移动超过阈值后不再是点击
+        if mode == "dragging" or state.phase == PHASE_DRAGGING:
+            phase = PHASE_DRAGGING
         elif mode == "scroll":
-            # 双指滚动
-            self._cancel_pending_click()
-            scroll_dx = dx * self.config["SCROLL_SENSITIVITY"]
-            scroll_dy = -dy * self.config["SCROLL_SENSITIVITY"]  # 反转Y轴
-            logger.debug(f"滚动: scroll_dx={scroll_dx}, scroll_dy={scroll_dy}")
-            self.mouse_controller.scroll(scroll_dx, scroll_dy)
-        elif mode == "dragging":
-            # 三指拖拽
-            self.touchpad_state["is_dragging"] = True
-            self.touchpad_state["drag_start_pos"] = (x, y)
-            # 移动鼠标光标
-            current_pos = self.mouse_controller.position
-            new_x = current_pos[0] + dx * self.config["CURSOR_SENSITIVITY"]
-            new_y = current_pos[1] + dy * self.config["CURSOR_SENSITIVITY"]
-            logger.debug(f"移动鼠标: 从 {current_pos} 到 ({new_x}, {new_y})")
-            self.mouse_controller.position = (new_x, new_y)
-
-        return {"status": "success", "mode": mode, "dx": dx, "dy": dy}
+            phase = (
+                PHASE_PINCHING
+                if gesture["gesture"] == GESTURE_PINCH
+                else PHASE_SCROLLING
+            )
+        elif mode == "swipe":
+            phase = PHASE_SWIPING
+        elif state.phase == PHASE_PENDING_TAP:
+            if total_distance <= self.config["MOVE_THRESHOLD"]:
+                phase = PHASE_PENDING_TAP
+            elif state.tap_drag:
+                # 点击后立即按下并移动：按住左键拖拽
+                phase = PHASE_DRAGGING
+                self.tap_recognizer.record_drag()
+                tracer.record(EV_TAP_DRAG)
+            else:
+                phase = PHASE_MOVING
+        else:
+            phase = PHASE_MOVING
+        self._enter_phase(session, state, phase)
+
+        if phase == PHASE_SCROLLING:
+            # 双指滚动，按全部触摸点的质心位移计算；另一台设备缩放时按住的 Ctrl
+            # 会把滚动变成缩放，丢弃这段滚动
+            if gesture["gesture"] == GESTURE_SCROLL:
+                if self._zoom_held_elsewhere(session):
+                    self.gesture_stats["scrolls_suppressed"] += 1
+                else:
+                    self._scroll(session, gesture, _event_time(touches_data))
+        elif phase == PHASE_PINCHING:
+            # 张开为放大、捏合为缩小，对应 Ctrl 按住时向上、向下滚动
+            steps = gesture["zoom"] / math.log(self.config["PINCH_ZOOM_STEP"])
+            if steps:
+                self.input_scheduler.add_scroll(0, steps)
+        elif phase == PHASE_SWIPING:
+            if gesture["swipe"] is not None:
+                self._swipe(gesture["swipe"], _touch_count(touches_data))
+        else:
+            # 移动鼠标光标（拖拽时按键保持按下），由调度器按帧合并注入；
+            # 低频客户端的位移先经插值分摊到显示帧
+            timestamp = _event_time(touches_data)
+            move_dx, move_dy = state.accelerator.apply(dx, dy, timestamp)
+            if self.config["MOTION_UPSAMPLING"]:
+                session.motion_upsampler.add(move_dx, move_dy, timestamp)
+            else:
+                self.input_scheduler.add_move(move_dx, move_dy)
+
+        result = {"status": "success", "mode": mode, "dx": dx, "dy": dy}
+        if gesture["gesture"] is not None:
+            result["gesture"] = gesture["gesture"]
+        return result
 
     def handle_touch_end(self, touches_data):
         """
@@ -199,118 +398,213 @@ class TouchpadService:
         Returns:
             dict: 响应数据
         """
-        logger.debug(f"收到触摸结束数据: {touches_data}")  # 添加调试日志
-
+        lifted_at = time.perf_counter()
+        session = self.get_session(touches_data.get("client_id"))
         touch_id = touches_data.get("touch_id", "default")
+        state = session.active_touches.pop(touch_id, None)
 
-        if touch_id not in self.touchpad_state["active_touches"]:
-            logger.debug(f"无效的触摸结束: touch_id={touch_id}")
+        if state is None:
+            tracer.record(EV_TOUCH_END_INVALID, len(session.active_touches))
             return {"status": "error", "message": "无效的触摸结束"}
 
-        # 获取触摸状态
-        touch_state = self.touchpad_state["active_touches"][touch_id]
-
-        # 检测触摸模式
-        mode = self.detect_touch_mode(touches_data)
-        logger.debug(f"触摸结束模式: {mode}")
-
         # 计算触摸持续时间和移动距离
-        touch_duration = time.time() - touch_state["start_time"]
-        total_distance = (
-            (touch_state["current_x"] - touch_state["start_x"]) ** 2
-            + (touch_state["current_y"] - touch_state["start_y"]) ** 2
-        ) ** 0.5
-
-        logger.debug(
-            f"触摸持续时间: {touch_duration:.3f}s, 移动距离: {total_distance:.1f}px"
-        )
+        touch_duration = time.time() - state.start_time
+        total_distance = state.distance
+        phase = state.phase
 
         action_performed = None
 
-        # 处理双指右键点击
-        if (
-            mode == "scroll"
-            and touch_duration < self.config["DOUBLE_CLICK_TIME"]
-            and total_distance < self.config["MOVE_THRESHOLD"]
-        ):
-            logger.debug("执行双指右键点击")
-            self.mouse_controller.click(mouse.Button.right)
-            action_performed = "right_click"
-            self._cancel_pending_click()  # 取消任何待处理的左键点击
-        elif mode == "single":
-            action_performed = "left_click"
-        elif mode == "dragging":
-            self.mouse_controller.release(mouse.Button.left)
-            logger.debug("三指拖拽结束，释放鼠标左键")
-
-        # 移除触摸状态
-        self.touchpad_state["active_touches"].pop(touch_id)
+        # 先注入尚未发出的移动，保证点击和释放发生在最终位置；
+        # 单纯的移动结束时，插值中的位移照常按帧注入完
+        if phase != PHASE_MOVING:
+            session.motion_upsampler.flush()
+        self.input_scheduler.request_flush()
 
-        # 更新最后触摸时间
-        self.touchpad_state["last_touch_time"] = time.time()
+        if phase in TAP_FINGERS:
+            # 手指已抬起，不可能再变成移动、滚动或拖拽，是点击就立即提交
+            action_performed = self.tap_recognizer.classify(
+                TAP_FINGERS[phase], touch_duration, total_distance
+            )
+            if action_performed is not None:
+                self._click(session, action_performed, lifted_at)
+            elif phase == PHASE_SCROLLING and self.config["KINETIC_SCROLL"]:
+                # 按松手前的滚动速度继续惯性滚动
+                velocity = session.kinetic_scroller.release(_event_time(touches_data))
+                if velocity is not None:
+                    tracer.record(EV_KINETIC_SCROLL, 2, *velocity)
+        elif phase == PHASE_DRAGGING:
+            self.button_arbiter.release(session, mouse.Button.left)
+            action_performed = "drag_release"
+        elif phase == PHASE_PINCHING:
+            self._hold_zoom_modifier(session, False)
+
+        state.transition(PHASE_IDLE)
 
-        # 重置拖拽状态
-        self.touchpad_state["is_dragging"] = False
-        self.touchpad_state["drag_start_pos"] = None
+        # 更新最后触摸时间
+        session.last_touch_time = time.time()
+
+        tracer.record(
+            EV_TOUCH_END,
+            PHASE_CODES[phase],
+            touch_duration,
+            total_distance,
+            ACTION_CODES[action_performed],
+        )
 
         result = {"status": "success", "message": "触摸结束"}
-        if action_performed:
+        if action_performed and action_performed != "drag_release":
             result["action"] = action_performed
 
         return result
 
-    def _prepare_delayed_click(self):
+    def _enter_phase(self, session, state, phase):
         """
-        准备延迟点击
+        转换触摸阶段并执行进入新阶段时的动作
 
+        Args:
+            session: 触摸会话
+            state: 触摸状态
+            phase: 目标阶段
         """
-        # 取消之前的点击
-        self._cancel_pending_click()
+        previous = state.phase
+        if not state.transition(phase):
+            return
+
+        if previous == PHASE_PINCHING:
+            self._hold_zoom_modifier(session, False)
+
+        if phase == PHASE_DRAGGING:
+            session.motion_upsampler.flush()
+            self.button_arbiter.press(session, mouse.Button.left)
+        elif phase == PHASE_PINCHING:
+            self.gesture_stats["pinches"] += 1
+            tracer.record(EV_GESTURE, 2, GESTURE_CODES[GESTURE_PINCH])
+            self._hold_zoom_modifier(session, True)
+
+    def _hold_zoom_modifier(self, session, held):
+        """
+        按下或释放缩放用的修饰键
 
-        # 设置新的延迟点击
-        self.touchpad_state["pending_click"] = True
-        self.touchpad_state["click_timer"] = threading.Timer(
-            self.config["CLICK_DELAY"], self._execute_delayed_click
-        )
-        self.touchpad_state["click_timer"].start()
-
-    def _execute_delayed_click(self):
-        """执行延迟点击"""
-        if self.touchpad_state["pending_click"]:
-            # 执行点击
-            self.mouse_controller.click(mouse.Button.left)
-            logger.debug("执行延迟点击")
-            # 清理状态
-            self.touchpad_state["pending_click"] = None
-            self.touchpad_state["click_timer"] = None
-
-    def _cancel_pending_click(self):
-        logger.debug("取消待处理的点击")
-        """取消待处理的点击"""
-        if self.touchpad_state["click_timer"]:
-            self.touchpad_state["click_timer"].cancel()
-            self.touchpad_state["click_timer"] = None
-        self.touchpad_state["pending_click"] = None
-
-    def get_touchpad_status(self):
+        Args:
+            session: 触摸会话
+            held: True 为按下，False 为释放
+        """
+        if session.zoom_modifier_held == held:
+            return
+        session.zoom_modifier_held = held
+        # 与鼠标按键一样由仲裁器按持有者计数，重叠的缩放只在最后一个结束时释放
+        if held:
+            # 其他会话的惯性滚动在按住 Ctrl 期间会变成缩放，立即停下
+            for other in self.sessions.sessions():
+                if other is not session:
+                    other.kinetic_scroller.cancel()
+            self.button_arbiter.press_key(session, ZOOM_MODIFIER)
+        else:
+            self.button_arbiter.release(session, ZOOM_MODIFIER)
+
+    def _scroll(self, session, gesture, timestamp):
+        """按双指质心位移注入滚动，并跟踪惯性滚动的速度"""
+        sensitivity = self.config["SCROLL_SENSITIVITY"]
+        scroll_dx = gesture["dx"] * sensitivity
+        scroll_dy = -gesture["dy"] * sensitivity  # 反转Y轴
+        self.input_scheduler.add_scroll(scroll_dx, scroll_dy)
+        if self.config["KINETIC_SCROLL"]:
+            session.kinetic_scroller.track(scroll_dx, scroll_dy, timestamp)
+
+    def _zoom_held_elsewhere(self, session):
+        """其他会话是否正按住缩放修饰键，此时注入的滚轮会变成缩放"""
+        held = self.button_arbiter.holders(ZOOM_MODIFIER)
+        return held > (1 if session.zoom_modifier_held else 0)
+
+    def _swipe(self, direction, touch_count):
+        """
+        执行轻扫方向配置的快捷键
+
+        Args:
+            direction: "left"、"right"、"up" 或 "down"
+            touch_count: 手指数
+        """
+        self.gesture_stats["swipes"] += 1
+        tracer.record(EV_GESTURE, touch_count, GESTURE_CODES["swipe"])
+        keys = self.config["SWIPE_HOTKEYS"].get(direction)
+        if keys:
+            self.hotkey_engine.execute(keys, SWIPE_HOTKEY_PROFILE)
+
+    def handle_scroll(self, scroll_data):
+        """
+        处理滚轮滚动事件
+
+        Args:
+            scroll_data: 滚动数据，dx/dy 为浏览器滚轮增量
+
+        Returns:
+            dict: 响应数据
+        """
+        dx = scroll_data.get("dx", 0)
+        dy = scroll_data.get("dy", 0)
+
+        session = self.get_session(scroll_data.get("client_id"))
+        session.kinetic_scroller.cancel()
+        scroll_dx = dx * self.config["WHEEL_SENSITIVITY"]
+        scroll_dy = -dy * self.config["WHEEL_SENSITIVITY"]  # 反转Y轴
+        tracer.record(EV_SCROLL, 1, scroll_dx, scroll_dy)
+        if self._zoom_held_elsewhere(session):
+            # 另一台设备正在缩放，按住的 Ctrl 会把这次滚动变成缩放
+            self.gesture_stats["scrolls_suppressed"] += 1
+        else:
+            self.input_scheduler.add_scroll(scroll_dx, scroll_dy)
+
+        return {"status": "success", "dx": scroll_dx, "dy": scroll_dy}
+
+    def _click(self, session, action, lifted_at):
+        """
+        提交点击
+
+        Args:
+            session: 触摸会话
+            action: TAP_LEFT_CLICK 或 TAP_RIGHT_CLICK
+            lifted_at: 收到抬起事件的时刻（perf_counter）
+        """
+        self.tap_recognizer.commit(session, action)
+        tracer.record(EV_CLICK_FIRED, ACTION_CODES[action])
+        self.injector.submit(self._inject_click, TAP_BUTTONS[action], action, lifted_at)
+
+    def _inject_click(self, button, action, lifted_at):
+        """注入线程上执行点击，并记录从抬起到注入完成的延迟"""
+        self.mouse_controller.click(button)
+        self.tap_recognizer.record_latency(action, time.perf_counter() - lifted_at)
+
+    def get_touchpad_status(self, client_id=None):
         """
         获取触摸板状态
 
+        Args:
+            client_id: 客户端标识，缺省时为默认会话
+
         Returns:
             dict: 触摸板状态信息
         """
-        return {
-            "active_touches_count": len(self.touchpad_state["active_touches"]),
-            "is_dragging": self.touchpad_state["is_dragging"],
-            "has_pending_click": self.touchpad_state["pending_click"] is not None,
-            "last_touch_time": self.touchpad_state["last_touch_time"],
-        }
+        session = self.get_session(client_id)
+        status = session.get_status()
+        status.update(
+            {
+                "session_stats": self.sessions.get_stats(),
+                "injection_stats": self.input_scheduler.get_stats(),
+                "kinetic_stats": session.kinetic_scroller.get_stats(),
+                "tap_stats": self.tap_recognizer.get_stats(),
+                "gesture_stats": dict(self.gesture_stats),
+                "motion_stats": session.motion_upsampler.get_stats(),
+                "timer_stats": self.timer_scheduler.get_stats(),
+                "worker_stats": self.injector.get_stats(),
+                "input_backend": self.input_backend.get_status(),
+                "trace_stats": tracer.get_stats(),
+            }
+        )
+        return status
 
     def shutdown(self):
         """
         关闭服务，清理资源
         """
-        self._cancel_pending_click()
-        self.touchpad_state["active_touches"].clear()
-        self.touchpad_state["is_dragging"] = False
-        self.touchpad_state["drag_start_pos"] = None
+        self.sessions.clear()
+        self.input_scheduler.stop()
@@ -96,46 +96,384 @@ async function apiCall(endpoint, data) {
 let touchpadState = {
     activeTouches: new Map(),
     touchStartTime: null,
+    touchId: null,
+    touchSerial: 0,
     touchTimeout: 300, // 300ms
     multiTouchWindow: 100, // 100ms
     lastTouchCount: 0
 };
 
-// 触摸板API调用函数
-async function touchpadApiCall(data) {
+// 二进制输入协议，格式与 src/utils/wire_format.py 保持一致
+const WIRE_PROTOCOL_VERSION = 1;
+const WIRE_FLAG_ACK = 0x01;
+const WIRE_FLAG_MULTI_POINT = 0x02;
+const WIRE_MSG_TYPES = {
+    touch_start: 0x01,
+    touch_move: 0x02,
+    touch_end: 0x03,
+    scroll: 0x04,
+    press: 0x10,
+    release: 0x11,
+    type: 0x12,
+    hotkey: 0x13
+};
+const WIRE_HEADER_SIZE = 14;
+const WIRE_POINTER_EVENT_SIZE = 10;
+const WIRE_KEY_EVENT_SIZE = 6;
+const WIRE_POINT_OFFSET_SIZE = 4;
+const wireTextEncoder = new TextEncoder();
+
+function clampInt16(value) {
+    return Math.max(-32768, Math.min(32767, Math.round(value)));
+}
+
+// 将事件数组编码为一个二进制数据包
+function encodeInputPacket(events, seq = 0, flags = 0) {
+    const baseTime = events.length > 0 && events[0].timestamp ? events[0].timestamp : Date.now();
+
+    // 预先编码键盘事件负载以计算包长度
+    const payloads = events.map(event => {
+        if (event.action === 'type') return wireTextEncoder.encode(event.text);
+        if (event.action === 'hotkey') return wireTextEncoder.encode(event.keys.join('\x1f'));
+        if (event.channel === 'keyboard') return wireTextEncoder.encode(event.key);
+        return null;
+    });
+
+    // 有事件携带多个触摸点时，触摸开始和移动事件之后附加其余触摸点
+    const extraPoints = events.map(event => (
+        event.action === 'touch_start' || event.action === 'touch_move'
+            ? (event.touches || []).slice(1, 256)
+            : null
+    ));
+    const multiPoint = extraPoints.some(points => points && points.length > 0);
+    if (multiPoint) {
+        flags |= WIRE_FLAG_MULTI_POINT;
+    }
+
+    let size = WIRE_HEADER_SIZE;
+    payloads.forEach((payload, index) => {
+        size += payload ? WIRE_KEY_EVENT_SIZE + payload.length : WIRE_POINTER_EVENT_SIZE;
+        if (multiPoint && extraPoints[index]) {
+            size += 1 + extraPoints[index].length * WIRE_POINT_OFFSET_SIZE;
+        }
+    });
+
+    const buffer = new ArrayBuffer(size);
+    const view = new DataView(buffer);
+    const bytes = new Uint8Array(buffer);
+
+    view.setUint8(0, WIRE_PROTOCOL_VERSION);
+    view.setUint8(1, flags);
+    view.setUint16(2, events.length, true);
+    view.setUint16(4, seq & 0xffff, true);
+    view.setFloat64(6, baseTime, true);
+
+    let offset = WIRE_HEADER_SIZE;
+    let prevX = 0, prevY = 0;
+
+    events.forEach((event, index) => {
+        const dt = Math.max(0, Math.min(0xffff, Math.round((event.timestamp || baseTime) - baseTime)));
+        const payload = payloads[index];
+
+        view.setUint8(offset, WIRE_MSG_TYPES[event.action]);
+
+        if (payload) {
+            view.setUint16(offset + 2, dt, true);
+            view.setUint16(offset + 4, payload.length, true);
+            bytes.set(payload, offset + WIRE_KEY_EVENT_SIZE);
+            offset += WIRE_KEY_EVENT_SIZE + payload.length;
+            return;
+        }
+
+        if (event.action === 'scroll') {
+            view.setUint16(offset + 4, dt, true);
+            view.setInt16(offset + 6, clampInt16(event.dx || 0), true);
+            view.setInt16(offset + 8, clampInt16(event.dy || 0), true);
+        } else {
+            const point = event.touches && event.touches.length > 0
+                ? event.touches[0]
+                : (event.position || { x: prevX, y: prevY });
+            const dx = clampInt16(point.x - prevX);
+            const dy = clampInt16(point.y - prevY);
+            const touchId = parseInt(String(event.touch_id).split('_').pop(), 10) & 0xffff;
+
+            view.setUint8(offset + 1, Math.min(0xff, event.touch_count || 1));
+            view.setUint16(offset + 2, touchId, true);
+            view.setUint16(offset + 4, dt, true);
+            view.setInt16(offset + 6, dx, true);
+            view.setInt16(offset + 8, dy, true);
+            prevX += dx;
+            prevY += dy;
+
+            const extra = extraPoints[index];
+            if (multiPoint && extra) {
+                offset += WIRE_POINTER_EVENT_SIZE;
+                view.setUint8(offset, extra.length);
+                offset += 1;
+                extra.forEach(other => {
+                    view.setInt16(offset, clampInt16(other.x - prevX), true);
+                    view.setInt16(offset + 2, clampInt16(other.y - prevY), true);
+                    offset += WIRE_POINT_OFFSET_SIZE;
+                });
+                return;
+            }
+        }
+        offset += WIRE_POINTER_EVENT_SIZE;
+    });
+
+    return buffer;
+}
+
+// 调试开关：页面地址带 ?debug 参数时输出输入事件日志
+const DEBUG_INPUT = new URLSearchParams(location.search).has('debug');
+
+function debugLog(...args) {
+    if (DEBUG_INPUT) {
+        console.log(...args);
+    }
+}
+
+// 客户端标识：同一标签页内保持不变，服务端据此隔离各设备的手势状态
+const CLIENT_ID = (() => {
+    const newId = () => Math.random().toString(36).slice(2, 12);
     try {
-        console.log('发送触摸板数据:', data); // 添加调试日志
-        const response = await fetch('/api/touchpad', {
+        let id = sessionStorage.getItem('remoteClientId');
+        if (!id) {
+            id = newId();
+            sessionStorage.setItem('remoteClientId', id);
+        }
+        return id;
+    } catch (error) {
+        return newId();
+    }
+})();
+
+// 输入流连接（WebSocket），未连接时回退到HTTP接口
+let inputStream = null;
+let inputStreamSeq = 0;
+let inputStreamRetryDelay = 1000;
+
+function connectInputStream() {
+    if (!('WebSocket' in window)) {
+        return;
+    }
+
+    const protocol = location.protocol === 'https:' ? 'wss:' : 'ws:';
+    const socket = new WebSocket(
+        `${protocol}//${location.host}/ws/input?client=${encodeURIComponent(CLIENT_ID)}`
+    );
+    socket.binaryType = 'arraybuffer';
+
+    socket.onopen = () => {
+        inputStream = socket;
+        inputStreamRetryDelay = 1000;
+    };
+
+    socket.onmessage = (event) => {
+        const response = JSON.parse(event.data);
+        if (Array.isArray(response.results)) {
+            response.results.forEach(handleTouchpadResult);
+        } else {
+            handleTouchpadResult(response);
+        }
+        if (response.seq !== undefined && response.seq === sendLoop.inFlightSeq) {
+            completeInFlight();
+        }
+    };
+
+    socket.onclose = () => {
+        inputStream = null;
+        if (sendLoop.inFlightSeq !== null) {
+            completeInFlight();
+        }
+        // 指数退避重连
+        setTimeout(connectInputStream, inputStreamRetryDelay);
+        inputStreamRetryDelay = Math.min(inputStreamRetryDelay * 2, 10000);
+    };
+}
+
+// 根据触摸板操作结果更新UI反馈
+function handleTouchpadResult(result) {
+    if (result.status === 'success') {
+        if (result.action === 'left_click') {
+            showTouchFeedback('single-touch');
+            updateStatus('单指点击 - 左键', true);
+        } else if (result.action === 'right_click') {
+            showTouchFeedback('multi-touch');
+            updateStatus('双指点击 - 右键', true);
+        } else if (result.action === 'move') {
+            showTouchFeedback('multi-touch');
+            updateStatus('滑动 = 移动鼠标', true);
+        }
+    } else {
+        console.error('触摸板API调用失败:', result.message);
+    }
+}
+
+// 发送循环：触摸事件先放入缓冲区，每个动画帧最多发送一次，同一时间只有一个请求在途。
+// 请求在途期间到达的事件继续缓冲：同一触摸的连续移动只保留最新位置（服务端按位置差计算位移），
+// 连续的滚轮事件合并为一次。
+const SEND_TIMEOUT = 1000; // 在途请求超时（毫秒），超时后不再等待回包
+const sendLoop = {
+    buffer: [],
+    frameScheduled: false,
+    inFlightSeq: null,
+    inFlightSince: 0,
+    timeoutId: null,
+    rtt: 0 // 往返时间的指数平均（毫秒），用于本地光标预测
+};
+let batchSeq = 0;
+
+function queueTouchpadEvent(event) {
+    const last = sendLoop.buffer[sendLoop.buffer.length - 1];
+    if (event.action === 'touch_move' && last && last.action === 'touch_move' &&
+        last.touch_id === event.touch_id && last.touch_count === event.touch_count) {
+        sendLoop.buffer[sendLoop.buffer.length - 1] = event;
+    } else if (event.action === 'scroll' && last && last.action === 'scroll') {
+        // 同一帧内的滚轮增量直接累加
+        last.dx += event.dx;
+        last.dy += event.dy;
+    } else {
+        sendLoop.buffer.push(event);
+    }
+    scheduleSend();
+}
+
+function scheduleSend() {
+    if (sendLoop.frameScheduled || sendLoop.inFlightSeq !== null || sendLoop.buffer.length === 0) {
+        return;
+    }
+    sendLoop.frameScheduled = true;
+    requestAnimationFrame(flushSendLoop);
+}
+
+function completeInFlight() {
+    const rtt = performance.now() - sendLoop.inFlightSince;
+    sendLoop.rtt = sendLoop.rtt ? sendLoop.rtt * 0.8 + rtt * 0.2 : rtt;
+    clearTimeout(sendLoop.timeoutId);
+    sendLoop.inFlightSeq = null;
+    scheduleSend();
+}
+
+function flushSendLoop() {
+    sendLoop.frameScheduled = false;
+    if (sendLoop.inFlightSeq !== null || sendLoop.buffer.length === 0) {
+        return;
+    }
+
+    const events = sendLoop.buffer;
+    sendLoop.buffer = [];
+    sendLoop.inFlightSince = performance.now();
+    sendLoop.timeoutId = setTimeout(completeInFlight, SEND_TIMEOUT);
+
+    const streamable = events.every(event => event.action in WIRE_MSG_TYPES);
+    if (streamable && inputStream && inputStream.readyState === WebSocket.OPEN) {
+        // 流模式下使用二进制协议，每个数据包都请求回包以确认送达
+        sendLoop.inFlightSeq = (inputStreamSeq = (inputStreamSeq + 1) & 0xFFFF);
+        debugLog('发送触摸板数据包:', sendLoop.inFlightSeq, events);
+        inputStream.send(encodeInputPacket(events, sendLoop.inFlightSeq, WIRE_FLAG_ACK));
+    } else {
+        sendLoop.inFlightSeq = ++batchSeq;
+        debugLog('发送批量触摸板数据:', events);
+        sendBatch(events);
+    }
+}
+
+async function sendBatch(events) {
+    const seq = sendLoop.inFlightSeq;
+    try {
+        // HTTP模式下只有触摸结束需要结果（用于点击反馈）
+        const payload = events.map((event, index) => {
+            const item = { channel: 'touchpad', client_id: CLIENT_ID, ...event };
+            if (event.action === 'touch_end') {
+                item.seq = index;
+            }
+            return item;
+        });
+
+        const response = await fetch('/api/batch', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
             },
-            body: JSON.stringify(data)
+            body: JSON.stringify({ events: payload })
         });
-        
+
         const result = await response.json();
-        console.log('触摸板API响应:', result); // 添加调试日志
-        
-        if (result.status === 'success') {
-            // 根据操作类型更新UI反馈
-            if (result.action === 'left_click') {
-                showTouchFeedback('single-touch');
-                updateStatus('单指点击 - 左键', true);
-            } else if (result.action === 'right_click') {
-                showTouchFeedback('multi-touch');
-                updateStatus('双指点击 - 右键', true);
-            } else if (result.action === 'move') {
-                showTouchFeedback('multi-touch');
-                updateStatus('滑动 = 移动鼠标', true);
-            }
-        } else {
-            console.error('触摸板API调用失败:', result.message);
+        debugLog('批量触摸板响应:', result);
+        if (Array.isArray(result.results)) {
+            result.results.forEach(handleTouchpadResult);
+        }
+        if (result.status !== 'success') {
+            console.error('批量事件处理失败:', result.errors || result.message);
         }
-        return result;
     } catch (error) {
         console.error('触摸板网络错误:', error);
         updateStatus('触摸板连接错误', false);
-        return null;
+    } finally {
+        if (sendLoop.inFlightSeq === seq) {
+            completeInFlight();
+        }
+    }
+}
+
+// 触摸板API调用函数
+function touchpadApiCall(data) {
+    debugLog('发送触摸板数据:', data);
+    queueTouchpadEvent(data);
+    return Promise.resolve(null);
+}
+
+// 本地光标预测：不等待服务端，在触摸板上立即显示按速度外推的光标反馈位置，
+// 外推时长取测得往返时间的一半，近似抵消网络和注入延迟
+const cursorPreview = {
+    element: null,
+    lastX: 0,
+    lastY: 0,
+    lastTime: 0,
+    vx: 0,
+    vy: 0
+};
+
+function initCursorPreview() {
+    const element = document.createElement('div');
+    element.className = 'cursor-preview';
+    touchpad.appendChild(element);
+    cursorPreview.element = element;
+}
+
+function updateCursorPreview(x, y, time, reset = false) {
+    const preview = cursorPreview;
+    if (!preview.element) {
+        return;
+    }
+
+    const dt = time - preview.lastTime;
+    if (reset || dt <= 0 || dt > 100) {
+        preview.vx = 0;
+        preview.vy = 0;
+    } else {
+        // 速度做指数平滑，避免单个抖动样本造成跳动
+        preview.vx = preview.vx * 0.5 + ((x - preview.lastX) / dt) * 0.5;
+        preview.vy = preview.vy * 0.5 + ((y - preview.lastY) / dt) * 0.5;
+    }
+    preview.lastX = x;
+    preview.lastY = y;
+    preview.lastTime = time;
+
+    const lead = Math.min(sendLoop.rtt / 2, 50);
+    const rect = touchpad.getBoundingClientRect();
+    const left = rect.left + touchpad.clientLeft;
+    const top = rect.top + touchpad.clientTop;
+    const px = Math.max(0, Math.min(touchpad.clientWidth, x + preview.vx * lead - left));
+    const py = Math.max(0, Math.min(touchpad.clientHeight, y + preview.vy * lead - top));
+    preview.element.style.transform = `translate(${px}px, ${py}px)`;
+    preview.element.classList.add('visible');
+}
+
+function hideCursorPreview() {
+    if (cursorPreview.element) {
+        cursorPreview.element.classList.remove('visible');
     }
 }
 
@@ -160,11 +498,19 @@ function resetTouchpad() {
     }).then(() => {
         touchpadState.activeTouches.clear();
         touchpadState.touchStartTime = null;
+        touchpadState.touchId = null;
         touchpadState.lastTouchCount = 0;
         updateStatus('触摸板状态已重置', true);
     });
 }
 
+// 分配触摸ID。二进制输入流只能携带16位编号，HTTP 回退使用同一个字符串，
+// 传输方式在手势中途切换时服务端看到的仍是同一个触摸
+function nextTouchId() {
+    touchpadState.touchSerial = (touchpadState.touchSerial + 1) & 0xffff;
+    return 'touch_' + touchpadState.touchSerial;
+}
+
 // 处理触摸开始事件
 function handleTouchpadStart(e) {
     e.preventDefault();
@@ -176,12 +522,13 @@ function handleTouchpadStart(e) {
     // 记录触摸开始时间（使用固定ID）
     if (!touchpadState.touchStartTime) {
         touchpadState.touchStartTime = currentTime;
+        touchpadState.touchId = nextTouchId();
     }
     
     // 构建触摸数据 - 使用一致的ID
     const touchData = {
         action: 'touch_start',
-        touch_id: 'touch_' + touchpadState.touchStartTime,
+        touch_id: touchpadState.touchId,
         touch_count: touchCount,  // 添加触摸点数量
         touches: touches.map((touch, index) => ({
             id: index,
@@ -195,7 +542,8 @@ function handleTouchpadStart(e) {
         timestamp: currentTime
     };
     
-    console.log('[DEBUG] 触摸开始数据:', touchData);  // 添加调试日志
+    debugLog('触摸开始数据:', touchData);
+    updateCursorPreview(touches[0].clientX, touches[0].clientY, performance.now(), true);
     
     // 更新触摸状态
     touchpadState.lastTouchCount = touchCount;
@@ -267,7 +615,7 @@ function handleTouchpadMove(e) {
         // 构建触摸移动数据
         const touchData = {
             action: 'touch_move',
-            touch_id: 'touch_' + touchpadState.touchStartTime,
+            touch_id: touchpadState.touchId,
             touch_count: touches.length,  // 添加触摸点数量
             touches: touches.map((touch, index) => ({
                 id: index,
@@ -281,6 +629,9 @@ function handleTouchpadMove(e) {
             timestamp: currentTime
         };
         
+        // 本地先行显示光标反馈，不等待服务端
+        updateCursorPreview(touches[0].clientX, touches[0].clientY, performance.now());
+        
         // 发送到后端处理
         touchpadApiCall(touchData);
     }
@@ -296,7 +647,7 @@ function handleTouchpadEnd(e) {
     // 构建触摸结束数据
     const touchData = {
         action: 'touch_end',
-        touch_id: 'touch_' + touchpadState.touchStartTime,  // 使用一致的ID
+        touch_id: touchpadState.touchId,  // 使用一致的ID
         touch_count: touchpadState.lastTouchCount || 1,  // 使用记录的触摸点数量
         position: touches.length > 0 ? {
             x: touches[0].clientX,
@@ -305,7 +656,10 @@ function handleTouchpadEnd(e) {
         timestamp: currentTime
     };
     
-    console.log('[DEBUG] 触摸结束数据:', touchData);  // 添加调试日志
+    debugLog('触摸结束数据:', touchData);
+    if (!e.touches || e.touches.length === 0) {
+        hideCursorPreview();
+    }
     
     // 发送触摸结束事件
     touchpadApiCall(touchData);
@@ -313,6 +667,7 @@ function handleTouchpadEnd(e) {
     // 重置状态
     isDragging = false;
     touchpadState.touchStartTime = null;
+    touchpadState.touchId = null;
     touchpadState.lastTouchCount = 0;
 }
 
@@ -372,9 +727,13 @@ function updateStatus(message, isConnected = true) {
 function initializeRemoteController() {
     // 获取触摸板元素
     touchpad = document.getElementById('touchpad');
+    initCursorPreview();
     
     updateStatus('远程控制器已就绪');
     
+    // 建立输入流连接
+    connectInputStream();
+    
     // 初始化标签页系统
     initTabSystem();
     
@@ -388,7 +747,12 @@ function initializeRemoteController() {
     // 滚动支持（触摸板）
     touchpad.addEventListener('wheel', function(e) {
         e.preventDefault();
-        mouseScroll(e.deltaX / 10, e.deltaY / 10);
+        touchpadApiCall({
+            action: 'scroll',
+            dx: e.deltaX,
+            dy: e.deltaY,
+            timestamp: Date.now()
+        });
     }, {passive: false});
     
     // 只在触摸板区域防止页面滚动，其他区域允许正常滚动
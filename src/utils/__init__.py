@@ -3,7 +3,11 @@
 包含各种通用工具函数
 """
 
-from .security import cleanup_keyboard_state, safe_keyboard_operation
-from .system_utils import get_screen_size
+from .security import cleanup_keyboard_state
+from .system_utils import get_screen_size, invalidate_screen_size
 
-__all__ = ["safe_keyboard_operation", "cleanup_keyboard_state", "get_screen_size"]
+__all__ = [
+    "cleanup_keyboard_state",
+    "get_screen_size",
+    "invalidate_screen_size",
+]
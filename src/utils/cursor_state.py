@@ -0,0 +1,137 @@
+"""
+光标状态模块
+在本地维护虚拟光标的亚像素位置，减少对系统光标位置的读取
+"""
+
+import threading
+import time
+
+from core.config import TOUCHPAD_CONFIG
+
+
+class CursorState:
+    """虚拟光标状态
+
+    在 X11 和 Windows 上每次读取 mouse.Controller.position 都是一次阻塞的后端调用。
+    这里在本地累加移动增量并保留小数部分，只在超过同步间隔或首次使用时读取系统位置；
+    同步时若系统位置与最后写入的位置不一致（用户操作了实体鼠标、光标被屏幕边缘截断等），
+    视为漂移并以系统位置为准。
+    """
+
+    def __init__(self, mouse_controller, resync_interval=None):
+        self.mouse_controller = mouse_controller
+        self.resync_interval = (
+            TOUCHPAD_CONFIG["CURSOR_RESYNC_INTERVAL"]
+            if resync_interval is None
+            else resync_interval
+        )
+
+        self._x = None
+        self._y = None
+        self._written = None
+        self._last_sync = 0.0
+        self._lock = threading.Lock()
+
+        self.stats = {"reads": 0, "writes": 0, "drift_corrections": 0}
+
+    @property
+    def position(self):
+        """
+        当前光标位置，缓存过期时才读取系统位置
+
+        Returns:
+            tuple: (x, y) 整数像素坐标
+        """
+        with self._lock:
+            if self._needs_sync():
+                self._sync()
+            return (round(self._x), round(self._y))
+
+    def sync(self):
+        """
+        立即从系统读取光标位置
+
+        Returns:
+            tuple: (x, y) 系统光标位置
+        """
+        with self._lock:
+            return self._sync()
+
+    def invalidate(self):
+        """使缓存失效，下次使用时重新读取系统位置"""
+        with self._lock:
+            self._last_sync = 0.0
+
+    def move_by(self, dx, dy):
+        """
+        按增量移动光标，保留亚像素余量
+
+        Args:
+            dx: 水平增量（可为小数）
+            dy: 垂直增量（可为小数）
+
+        Returns:
+            bool: 是否实际写入了系统光标位置
+        """
+        with self._lock:
+            if self._needs_sync():
+                self._sync()
+            self._x += dx
+            self._y += dy
+            return self._write()
+
+    def move_to(self, x, y):
+        """
+        移动光标到绝对位置
+
+        Args:
+            x: 横坐标
+            y: 纵坐标
+
+        Returns:
+            bool: 是否实际写入了系统光标位置
+        """
+        with self._lock:
+            if self._x is None:
+                self._last_sync = time.monotonic()
+            self._x = float(x)
+            self._y = float(y)
+            return self._write()
+
+    def get_stats(self):
+        """
+        获取读写统计
+
+        Returns:
+            dict: 系统位置读取次数、写入次数和漂移校正次数
+        """
+        return dict(self.stats)
+
+    def _needs_sync(self):
+        return (
+            self._x is None
+            or time.monotonic() - self._last_sync >= self.resync_interval
+        )
+
+    def _sync(self):
+        position = self.mouse_controller.position
+        self.stats["reads"] += 1
+        actual = (round(position[0]), round(position[1]))
+
+        if self._written is None or actual != self._written:
+            if self._written is not None:
+                self.stats["drift_corrections"] += 1
+            self._x, self._y = float(actual[0]), float(actual[1])
+            self._written = actual
+
+        self._last_sync = time.monotonic()
+        return actual
+
+    def _write(self):
+        target = (round(self._x), round(self._y))
+        if target == self._written:
+            return False
+        self.mouse_controller.position = target
+        self._written = target
+        self.stats["writes"] += 1
+        return True
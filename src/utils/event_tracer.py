@@ -0,0 +1,257 @@
+"""
+事件追踪模块
+以定长二进制记录写入环形缓冲区，按级别和采样率过滤，需要时再导出到文件离线分析
+"""
+
+import atexit
+import json
+import logging
+import struct
+import threading
+import time
+
+from core.config import TRACE_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# 记录格式：时间戳（time.monotonic 秒）、事件ID、整数字段、三个浮点字段
+RECORD = struct.Struct("<dHHfff")
+
+# 文件格式：文件头、事件/字符串表（JSON）、按时间顺序排列的记录
+FILE_MAGIC = b"RCTR"
+FILE_VERSION = 1
+FILE_HEADER = struct.Struct("<4sHHII")
+
+# 字符串表上限，超出后记为 UNKNOWN_STRING
+MAX_STRINGS = 1024
+UNKNOWN_STRING = 0xFFFF
+
+
+class EventTracer:
+    """事件追踪器
+
+    调用方只传原始数值，不拼接字符串；低于追踪级别的事件在 record() 开头直接返回。
+    高频事件按采样率每 N 个记录一个。缓冲区写满后覆盖最旧的记录。
+    """
+
+    def __init__(self, level=None, sample_rate=None, capacity=None):
+        self.level = TRACE_CONFIG["LEVEL"] if level is None else level
+        rate = TRACE_CONFIG["SAMPLE_RATE"] if sample_rate is None else sample_rate
+        self.sample_every = max(1, round(1 / rate)) if rate > 0 else 0
+        self.capacity = capacity or TRACE_CONFIG["CAPACITY"]
+
+        self._buffer = bytearray(self.capacity * RECORD.size)
+        self._next = 0
+        self._written = 0
+        self._lock = threading.Lock()
+
+        self._events = []
+        self._event_levels = []
+        self._event_sampled = []
+        self._sample_counters = []
+        self._strings = {}
+
+    def register(self, name, fields=(), level=logging.DEBUG, sampled=False):
+        """
+        登记事件类型
+
+        Args:
+            name: 事件名称
+            fields: 字段名称，依次对应 record() 的 i、a、b、c 参数
+            level: 事件级别，低于追踪级别时不记录
+            sampled: 是否按采样率采样（用于高频事件）
+
+        Returns:
+            int: 事件ID
+        """
+        self._events.append({"name": name, "fields": list(fields)})
+        self._event_levels.append(level)
+        self._event_sampled.append(sampled)
+        self._sample_counters.append(0)
+        return len(self._events) - 1
+
+    def is_enabled(self, event):
+        """
+        事件是否会被记录，可用于跳过代价较高的参数计算
+
+        Args:
+            event: 事件ID
+
+        Returns:
+            bool: 是否记录
+        """
+        return self._event_levels[event] >= self.level
+
+    def intern(self, text):
+        """
+        把字符串映射为整数ID，导出时随字符串表一起写入
+
+        Args:
+            text: 字符串（如按键名称）
+
+        Returns:
+            int: 字符串ID
+        """
+        string_id = self._strings.get(text)
+        if string_id is None:
+            if len(self._strings) >= MAX_STRINGS:
+                return UNKNOWN_STRING
+            string_id = self._strings.setdefault(text, len(self._strings))
+        return string_id
+
+    def record(self, event, i=0, a=0.0, b=0.0, c=0.0):
+        """
+        记录一个事件
+
+        Args:
+            event: 事件ID
+            i: 整数字段（0-65535）
+            a: 浮点字段
+            b: 浮点字段
+            c: 浮点字段
+        """
+        if self._event_levels[event] < self.level:
+            return
+
+        with self._lock:
+            if self._event_sampled[event]:
+                if not self.sample_every:
+                    return
+                count = self._sample_counters[event]
+                self._sample_counters[event] = count + 1
+                if count % self.sample_every:
+                    return
+
+            RECORD.pack_into(
+                self._buffer,
+                self._next * RECORD.size,
+                time.monotonic(),
+                event,
+                i & 0xFFFF,
+                a,
+                b,
+                c,
+            )
+            self._next = (self._next + 1) % self.capacity
+            self._written += 1
+
+    def get_stats(self):
+        """
+        获取追踪统计
+
+        Returns:
+            dict: 级别、已写入和当前保留的记录数
+        """
+        return {
+            "level": logging.getLevelName(self.level),
+            "written": self._written,
+            "buffered": min(self._written, self.capacity),
+            "capacity": self.capacity,
+        }
+
+    def dump(self, path=None):
+        """
+        把缓冲区中的记录按时间顺序写入文件
+
+        Args:
+            path: 输出路径，默认为 TRACE_CONFIG["DUMP_PATH"]
+
+        Returns:
+            int: 写入的记录数
+
+        Raises:
+            ValueError: 未指定路径且未配置 DUMP_PATH
+        """
+        path = path or TRACE_CONFIG["DUMP_PATH"]
+        if not path:
+            raise ValueError("未配置追踪文件路径")
+
+        with self._lock:
+            count = min(self._written, self.capacity)
+            start = (self._next - count) % self.capacity
+            if start + count <= self.capacity:
+                records = bytes(
+                    self._buffer[start * RECORD.size : (start + count) * RECORD.size]
+                )
+            else:
+                records = bytes(self._buffer[start * RECORD.size :]) + bytes(
+                    self._buffer[: self._next * RECORD.size]
+                )
+            strings = sorted(self._strings, key=self._strings.get)
+            table = json.dumps(
+                {"events": self._events, "strings": strings}, ensure_ascii=False
+            ).encode("utf-8")
+
+        with open(path, "wb") as f:
+            f.write(
+                FILE_HEADER.pack(
+                    FILE_MAGIC, FILE_VERSION, RECORD.size, count, len(table)
+                )
+            )
+            f.write(table)
+            f.write(records)
+
+        return count
+
+
+def read_trace(path):
+    """
+    读取导出的追踪文件
+
+    Args:
+        path: 文件路径
+
+    Returns:
+        list: 事件字典列表，包含 t、event 和各字段值；
+              名称以 "key" 结尾的整数字段会还原为字符串
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    magic, version, record_size, count, table_len = FILE_HEADER.unpack_from(data)
+    if magic != FILE_MAGIC or version != FILE_VERSION or record_size != RECORD.size:
+        raise ValueError("无效的追踪文件")
+
+    table = json.loads(data[FILE_HEADER.size : FILE_HEADER.size + table_len])
+    events, strings = table["events"], table["strings"]
+    offset = FILE_HEADER.size + table_len
+
+    result = []
+    for t, event_id, i, a, b, c in RECORD.iter_unpack(
+        data[offset : offset + count * RECORD.size]
+    ):
+        event = events[event_id]
+        entry = {"t": t, "event": event["name"]}
+        for name, value in zip(event["fields"], (i, a, b, c)):
+            if name.endswith("key"):
+                value = strings[value] if value < len(strings) else None
+            entry[name] = value
+        result.append(entry)
+    return result
+
+
+_event_tracer = None
+_event_tracer_lock = threading.Lock()
+
+
+def get_event_tracer():
+    """
+    获取全局事件追踪器，配置了 DUMP_PATH 时在进程退出前自动导出
+
+    Returns:
+        EventTracer: 全局共享的追踪器
+    """
+    global _event_tracer
+    with _event_tracer_lock:
+        if _event_tracer is None:
+            _event_tracer = EventTracer()
+            if TRACE_CONFIG["DUMP_PATH"]:
+                atexit.register(_dump_at_exit, _event_tracer)
+        return _event_tracer
+
+
+def _dump_at_exit(tracer):
+    try:
+        tracer.dump()
+    except Exception as e:
+        logger.error(f"导出事件追踪失败: {e}")
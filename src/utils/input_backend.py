@@ -0,0 +1,128 @@
+"""
+输入后端模块
+统一鼠标/键盘注入接口，按 Config.INPUT_BACKEND 选择 pynput、uinput 或空实现
+"""
+
+import contextlib
+
+from core.config import Config
+from utils.null_controller import NullKeyboardController, NullMouseController
+
+
+class InputBackend:
+    """输入后端基类
+
+    mouse / keyboard 是与 pynput 控制器接口一致的对象：鼠标提供 position 属性和
+    press/release/click/scroll，键盘提供 press/release/type。服务只通过这两个对象注入输入，
+    换后端不需要改动服务代码。
+    """
+
+    name = None
+
+    def __init__(self, mouse_controller, keyboard_controller):
+        self.mouse = mouse_controller
+        self.keyboard = keyboard_controller
+
+    def batch(self):
+        """
+        合并多次注入的上下文，支持批量写入的后端在退出时一次提交
+
+        Returns:
+            上下文管理器
+        """
+        return contextlib.nullcontext()
+
+    def close(self):
+        """释放后端持有的设备"""
+
+    def get_status(self):
+        """
+        获取后端状态
+
+        Returns:
+            dict: 后端名称和控制器类型
+        """
+        return {
+            "name": self.name,
+            "mouse": type(self.mouse).__name__,
+            "keyboard": type(self.keyboard).__name__,
+        }
+
+
+class PynputBackend(InputBackend):
+    """pynput 后端，Windows/macOS/X11 通用"""
+
+    name = "pynput"
+
+    def __init__(self):
+        from pynput import keyboard, mouse
+
+        super().__init__(mouse.Controller(), keyboard.Controller())
+
+
+class NullBackend(InputBackend):
+    """空后端，不产生真实输入，只记录调用时刻"""
+
+    name = "null"
+
+    def __init__(self):
+        super().__init__(NullMouseController(), NullKeyboardController())
+
+
+class RecordingBackend(InputBackend):
+    """录制后端，不产生真实输入，按顺序记录每次调用的方法和参数"""
+
+    name = "recording"
+
+    def __init__(self):
+        super().__init__(
+            NullMouseController(record=True), NullKeyboardController(record=True)
+        )
+
+    @property
+    def events(self):
+        """
+        鼠标和键盘调用按时间合并后的记录
+
+        Returns:
+            list: (时刻, 设备, 方法, 参数) 元组列表
+        """
+        events = [(t, "mouse", m, a) for t, m, a in self.mouse.events]
+        events.extend((t, "keyboard", m, a) for t, m, a in self.keyboard.events)
+        events.sort(key=lambda event: event[0])
+        return events
+
+
+def _create_uinput_backend():
+    # 依赖 Linux 和 evdev 可选依赖，只在选中时导入
+    from utils.uinput_backend import UinputBackend
+
+    return UinputBackend()
+
+
+INPUT_BACKENDS = {
+    "pynput": PynputBackend,
+    "uinput": _create_uinput_backend,
+    "null": NullBackend,
+    "recording": RecordingBackend,
+}
+
+
+def create_input_backend(name=None):
+    """
+    按名称创建输入后端
+
+    Args:
+        name: 后端名称，默认为 Config.INPUT_BACKEND
+
+    Returns:
+        InputBackend: 输入后端
+
+    Raises:
+        ValueError: 未知的后端名称
+    """
+    name = name or Config.INPUT_BACKEND
+    factory = INPUT_BACKENDS.get(name)
+    if factory is None:
+        raise ValueError(f"未知的输入后端: {name}")
+    return factory()
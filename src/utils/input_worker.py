@@ -0,0 +1,199 @@
+"""
+输入注入工作线程模块
+所有设备注入操作都在同一个线程上按提交顺序执行
+"""
+
+import collections
+import logging
+import threading
+import time
+
+from core.config import INPUT_WORKER_CONFIG
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class InputWorker:
+    """输入注入工作线程
+
+    Flask 以 threaded=True 运行，各请求线程直接调用 pynput 控制器会相互竞争。
+    这里把注入操作放入有界队列，由唯一的工作线程依次执行，请求线程提交后立即返回。
+
+    队列满时的背压策略：
+    - 带 coalesce_key 的任务（如光标移动刷新）与队尾的同键任务合并，用新参数替换旧参数，
+      队列满时直接丢弃，累积的增量由下一次刷新注入。只与队尾合并：
+      之后提交的其他任务是屏障，刷新不能越过它们提前执行；
+    - 其余任务（按下、释放、点击、输入文本）不能丢，否则按键会卡住，
+      队列满时仍然入队并计入 overflow。不腾出队列中的刷新任务，
+      否则排在它之后的释放会先于光标的最终位置注入。
+    """
+
+    def __init__(self, max_queue_size=None, name="input-worker"):
+        self.max_queue_size = max_queue_size or INPUT_WORKER_CONFIG["MAX_QUEUE_SIZE"]
+        self.name = name
+
+        self._queue = collections.deque()
+        self._condition = threading.Condition()
+        self._busy = False
+        self._thread = None
+        self._running = False
+
+        self.stats = {
+            "submitted": 0,
+            "executed": 0,
+            "merged": 0,
+            "dropped": 0,
+            "overflow": 0,
+            "errors": 0,
+            "max_depth": 0,
+            "total_wait": 0.0,
+            "max_wait": 0.0,
+        }
+
+    def submit(self, func, *args, coalesce_key=None):
+        """
+        提交注入任务
+
+        Args:
+            func: 在工作线程上执行的函数
+            *args: 函数参数
+            coalesce_key: 合并键，队尾为同键任务时不再入队，而是替换其参数
+
+        Returns:
+            bool: 任务已入队或已合并返回True，带合并键的任务因队列满被丢弃返回False
+        """
+        with self._condition:
+            if not self._running:
+                self._start()
+
+            self.stats["submitted"] += 1
+
+            if (
+                coalesce_key is not None
+                and self._queue
+                and self._queue[-1][2] == coalesce_key
+            ):
+                # 保留原任务的入队时刻，等待时间从第一次请求算起
+                enqueued_at = self._queue[-1][3]
+                self._queue[-1] = (func, args, coalesce_key, enqueued_at)
+                self.stats["merged"] += 1
+                return True
+
+            if len(self._queue) >= self.max_queue_size:
+                if coalesce_key is not None:
+                    self.stats["dropped"] += 1
+                    logger.warning("输入注入队列已满，丢弃刷新任务")
+                    return False
+                self.stats["overflow"] += 1
+
+            self._queue.append((func, args, coalesce_key, time.perf_counter()))
+
+            depth = len(self._queue)
+            if depth > self.stats["max_depth"]:
+                self.stats["max_depth"] = depth
+
+            # wait_idle 的等待者共用同一个条件变量，必须全部唤醒
+            self._condition.notify_all()
+            return True
+
+    def wait_idle(self, timeout=1.0):
+        """
+        等待队列中的任务全部执行完毕
+
+        Args:
+            timeout: 最长等待秒数
+
+        Returns:
+            bool: 是否在超时前变为空闲
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._queue and not self._busy, timeout
+            )
+
+    def get_stats(self):
+        """
+        获取队列统计
+
+        Returns:
+            dict: 当前队列深度、执行/合并/丢弃/超出上限入队数量和排队等待时间（毫秒）
+        """
+        with self._condition:
+            stats = dict(self.stats)
+            stats["depth"] = len(self._queue)
+        executed = stats["executed"]
+        total_wait = stats.pop("total_wait")
+        stats["max_wait_ms"] = stats.pop("max_wait") * 1000
+        stats["avg_wait_ms"] = total_wait / executed * 1000 if executed else 0.0
+        return stats
+
+    def stop(self, timeout=1.0):
+        """执行完已入队的任务后停止工作线程"""
+        self.wait_idle(timeout)
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def _start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._running and not self._queue:
+                    self._condition.wait()
+                if not self._running:
+                    return
+
+                func, args, _, enqueued_at = self._queue.popleft()
+                self._busy = True
+
+            started_at = time.perf_counter()
+            wait = started_at - enqueued_at
+            try:
+                func(*args)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"输入注入失败: {e}")
+
+            if metrics.enabled:
+                task = getattr(func, "__qualname__", type(func).__name__)
+                metrics.observe(
+                    "remote_injection_duration_seconds",
+                    time.perf_counter() - started_at,
+                    task=task,
+                )
+                metrics.observe("remote_injection_wait_seconds", wait)
+
+            with self._condition:
+                self._busy = False
+                self.stats["executed"] += 1
+                self.stats["total_wait"] += wait
+                if wait > self.stats["max_wait"]:
+                    self.stats["max_wait"] = wait
+                if not self._queue:
+                    self._condition.notify_all()
+
+
+_input_worker = None
+_input_worker_lock = threading.Lock()
+
+
+def get_input_worker():
+    """
+    获取全局输入注入工作线程
+
+    Returns:
+        InputWorker: 全局共享的工作线程
+    """
+    global _input_worker
+    with _input_worker_lock:
+        if _input_worker is None:
+            _input_worker = InputWorker()
+        return _input_worker
@@ -0,0 +1,351 @@
+"""
+运行指标模块
+提供计数器和对数分桶延迟直方图，并以 Prometheus 文本格式导出
+"""
+
+import functools
+import threading
+import time
+
+from core.config import Config
+
+# 直方图以微秒为单位记录，每个 2 的幂区间再线性细分为 16 个子桶，相对误差不超过 1/16
+SUB_BUCKET_BITS = 4
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+EXACT_LIMIT = SUB_BUCKET_COUNT * 2
+MAX_MICROSECONDS = (1 << 40) - 1
+BUCKET_COUNT = EXACT_LIMIT + (40 - SUB_BUCKET_BITS - 1) * SUB_BUCKET_COUNT
+
+# 导出到 Prometheus 的桶边界（秒）
+EXPORT_BUCKETS = (
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+)
+
+
+def _bucket_index(value):
+    if value < EXACT_LIMIT:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS - 1
+    return EXACT_LIMIT + (shift - 1) * SUB_BUCKET_COUNT + (value >> shift) - SUB_BUCKET_COUNT
+
+
+def _bucket_upper(index):
+    """桶的上界（微秒，不含）"""
+    if index < EXACT_LIMIT:
+        return index + 1
+    shift = (index - EXACT_LIMIT) // SUB_BUCKET_COUNT + 1
+    top = (index - EXACT_LIMIT) % SUB_BUCKET_COUNT + SUB_BUCKET_COUNT
+    return (top + 1) << shift
+
+
+class Histogram:
+    """对数分桶延迟直方图（HDR 风格）
+
+    记录一次只做整数运算和一次列表自增，内存固定，不随样本数增长。
+    """
+
+    __slots__ = ("counts", "count", "sum", "max")
+
+    def __init__(self):
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        """
+        记录一个样本
+
+        Args:
+            seconds: 耗时（秒）
+        """
+        value = min(MAX_MICROSECONDS, max(0, int(seconds * 1_000_000)))
+        self.counts[_bucket_index(value)] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, fraction):
+        """
+        估算分位数
+
+        Args:
+            fraction: 分位，0-1
+
+        Returns:
+            float: 分位数所在桶的上界（秒），没有样本时返回0
+        """
+        if not self.count:
+            return 0.0
+        target = max(1, int(fraction * self.count + 0.5))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self.max, _bucket_upper(index) / 1_000_000)
+        return self.max
+
+    def cumulative(self, bounds):
+        """
+        按给定边界汇总累计计数
+
+        Args:
+            bounds: 递增的边界列表（秒）
+
+        Returns:
+            list: 每个边界对应的累计样本数
+        """
+        result = []
+        seen = 0
+        index = 0
+        for bound in bounds:
+            limit = bound * 1_000_000
+            while index < BUCKET_COUNT and _bucket_upper(index) <= limit:
+                seen += self.counts[index]
+                index += 1
+            result.append(seen)
+        return result
+
+
+def _format_labels(labels, extra=None):
+    items = list(labels)
+    if extra:
+        items.append(extra)
+    if not items:
+        return ""
+    body = ",".join(
+        '{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"'))
+        for k, v in items
+    )
+    return "{" + body + "}"
+
+
+def _format_value(value):
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
+
+
+class Metrics:
+    """指标注册表
+
+    关闭时调用方只需判断一次 enabled 属性即可跳过全部计时和计数；
+    队列深度等状态量通过采集回调在抓取时读取，不占用热路径。
+    """
+
+    def __init__(self, enabled=None):
+        self.enabled = Config.METRICS_ENABLED if enabled is None else enabled
+        self._lock = threading.Lock()
+        self._help = {}
+        self._counters = {}
+        self._histograms = {}
+        self._collectors = []
+
+    def describe(self, name, help_text):
+        """
+        登记指标说明
+
+        Args:
+            name: 指标名称
+            help_text: 说明文字
+        """
+        self._help[name] = help_text
+
+    def inc(self, name, value=1, **labels):
+        """
+        计数器自增
+
+        Args:
+            name: 指标名称
+            value: 增量
+            **labels: 标签
+        """
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, seconds, **labels):
+        """
+        记录耗时样本
+
+        Args:
+            name: 指标名称
+            seconds: 耗时（秒）
+            **labels: 标签
+        """
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.record(seconds)
+
+    def get_histogram(self, name, **labels):
+        """
+        获取直方图
+
+        Returns:
+            Histogram: 直方图，不存在时返回None
+        """
+        return self._histograms.get((name, tuple(sorted(labels.items()))))
+
+    def get_counter(self, name, **labels):
+        """
+        获取计数器的值
+
+        Returns:
+            int: 计数，不存在时返回0
+        """
+        return self._counters.get((name, tuple(sorted(labels.items()))), 0)
+
+    def register_collector(self, collector):
+        """
+        注册采集回调，抓取时调用
+
+        Args:
+            collector: 返回 [(名称, 标签字典, 数值), ...] 的函数，导出为 gauge
+        """
+        self._collectors.append(collector)
+
+    def reset(self):
+        """清空所有已记录的计数和直方图"""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def render(self):
+        """
+        导出 Prometheus 文本格式
+
+        Returns:
+            str: 指标文本
+        """
+        lines = ["# TYPE remote_metrics_enabled gauge"]
+        lines.append(f"remote_metrics_enabled {int(self.enabled)}")
+
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = [
+                (key, list(h.cumulative(EXPORT_BUCKETS)), h.count, h.sum)
+                for key, h in sorted(self._histograms.items())
+            ]
+
+        self._render_family(lines, counters, "counter", self._render_counter)
+        self._render_family(lines, histograms, "histogram", self._render_histogram)
+
+        gauges = []
+        for collector in self._collectors:
+            try:
+                gauges.extend(
+                    ((name, tuple(sorted(labels.items()))), value)
+                    for name, labels, value in collector()
+                )
+            except Exception as e:
+                lines.append(f"# collector error: {e}")
+        self._render_family(lines, sorted(gauges), "gauge", self._render_counter)
+
+        return "\n".join(lines) + "\n"
+
+    def _render_family(self, lines, entries, metric_type, render_entry):
+        current = None
+        for entry in entries:
+            name = entry[0][0]
+            if name != current:
+                current = name
+                if name in self._help:
+                    lines.append(f"# HELP {name} {self._help[name]}")
+                lines.append(f"# TYPE {name} {metric_type}")
+            render_entry(lines, entry)
+
+    @staticmethod
+    def _render_counter(lines, entry):
+        (name, labels), value = entry
+        lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+    @staticmethod
+    def _render_histogram(lines, entry):
+        (name, labels), cumulative, count, total = entry
+        for bound, seen in zip(EXPORT_BUCKETS, cumulative):
+            lines.append(f"{name}_bucket{_format_labels(labels, ('le', bound))} {seen}")
+        lines.append(f"{name}_bucket{_format_labels(labels, ('le', '+Inf'))} {count}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {total!r}")
+        lines.append(f"{name}_count{_format_labels(labels)} {count}")
+
+
+metrics = Metrics()
+
+metrics.describe("remote_actions_total", "按通道、操作和状态码统计的输入操作次数")
+metrics.describe("remote_action_duration_seconds", "输入操作处理耗时")
+metrics.describe("remote_http_requests_total", "按蓝图和端点统计的HTTP请求次数")
+metrics.describe("remote_http_request_duration_seconds", "HTTP请求处理耗时")
+metrics.describe("remote_injection_duration_seconds", "注入线程上单个设备操作的耗时")
+metrics.describe("remote_injection_wait_seconds", "注入任务在队列中的等待时间")
+metrics.describe("remote_timer_fired_total", "已触发的定时器数量")
+metrics.describe("remote_timer_lateness_seconds", "定时器实际触发时间与计划时间之差")
+metrics.describe("remote_scroll_events_total", "按是否实际注入统计的滚动帧数")
+metrics.describe("remote_tap_latency_seconds", "从触摸抬起到点击注入完成的延迟")
+
+
+def instrument_dispatch(channel, actions):
+    """
+    为操作分发函数添加计数和耗时统计
+
+    未知操作统一记为 "other"，避免任意请求数据产生无限多的标签组合。
+
+    Args:
+        channel: 通道名称，如 "touchpad"
+        actions: 已知操作名称集合
+
+    Returns:
+        callable: 装饰器
+    """
+    known = frozenset(actions)
+
+    def decorator(dispatch):
+        @functools.wraps(dispatch)
+        def wrapper(data):
+            if not metrics.enabled:
+                return dispatch(data)
+
+            action = data.get("action")
+            label = action if action in known else "other"
+            start = time.perf_counter()
+            try:
+                result, status_code = dispatch(data)
+            except Exception:
+                metrics.inc(
+                    "remote_actions_total", channel=channel, action=label, code="500"
+                )
+                raise
+            metrics.observe(
+                "remote_action_duration_seconds",
+                time.perf_counter() - start,
+                channel=channel,
+                action=label,
+            )
+            metrics.inc(
+                "remote_actions_total",
+                channel=channel,
+                action=label,
+                code=str(status_code),
+            )
+            return result, status_code
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,91 @@
+"""
+空输入设备控制器模块
+接口与 pynput 的鼠标/键盘控制器一致但不产生真实输入，用于回放和基准测试
+"""
+
+import collections
+import time
+
+# 保留的最近设备调用时刻数；多进程模式下空后端在长期运行的 Web 进程中，不能无限增长
+CALL_HISTORY = 100_000
+
+
+class NullController:
+    """空控制器基类，记录最近 CALL_HISTORY 次设备调用的时刻（time.perf_counter）"""
+
+    def __init__(self, record=False):
+        """
+        Args:
+            record: 是否同时记录调用的方法和参数（events）
+        """
+        self.call_times = collections.deque(maxlen=CALL_HISTORY)
+        self.events = [] if record else None
+        self._calls = 0
+
+    @property
+    def calls(self):
+        """累计调用次数，不受 call_times 长度限制"""
+        return self._calls
+
+    def _record(self, method, *args):
+        now = time.perf_counter()
+        self._calls += 1
+        self.call_times.append(now)
+        if self.events is not None:
+            self.events.append((now, method, args))
+
+
+class NullMouseController(NullController):
+    """空鼠标控制器"""
+
+    def __init__(self, record=False):
+        super().__init__(record)
+        self._position = (0, 0)
+
+    @property
+    def position(self):
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        self._record("position", value)
+        self._position = value
+
+    def press(self, button):
+        self._record("press", button)
+
+    def release(self, button):
+        self._record("release", button)
+
+    def click(self, button, count=1):
+        self._record("click", button, count)
+
+    def scroll(self, dx, dy):
+        self._record("scroll", dx, dy)
+
+
+class NullKeyboardController(NullController):
+    """空键盘控制器"""
+
+    def press(self, key):
+        self._record("press", key)
+
+    def release(self, key):
+        self._record("release", key)
+
+    def type(self, text):
+        self._record("type", text)
+
+
+def install_null_controllers():
+    """
+    把全局输入设备控制器替换为空实现，必须在创建服务之前调用
+
+    Returns:
+        tuple: (mouse_controller, keyboard_controller)
+    """
+    from utils.input_backend import NullBackend
+    from utils.security import install_input_backend
+
+    backend = install_input_backend(NullBackend())
+    return backend.mouse, backend.keyboard
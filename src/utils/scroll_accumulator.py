@@ -0,0 +1,115 @@
+"""
+滚动累加模块
+跨事件保留滚动增量的小数部分，只向后端注入它能表示的整数刻度
+"""
+
+import math
+import threading
+
+from core.config import TOUCHPAD_CONFIG
+
+# Windows 的滚轮消息和 Linux 的 REL_WHEEL_HI_RES 以 1/120 格为单位（WHEEL_DELTA），
+# 其余 pynput 后端只能注入整格
+WHEEL_DELTA = 120
+HIGH_RESOLUTION_BACKENDS = {
+    "pynput.mouse._win32": WHEEL_DELTA,
+    "utils.uinput_backend": WHEEL_DELTA,
+}
+
+
+def detect_scroll_resolution(mouse_controller):
+    """
+    检测鼠标后端每格滚动可细分的单位数
+
+    Args:
+        mouse_controller: 鼠标控制器
+
+    Returns:
+        int: 每格的单位数，1 表示只支持整格滚动
+    """
+    configured = TOUCHPAD_CONFIG["SCROLL_RESOLUTION"]
+    if configured:
+        return int(configured)
+    return HIGH_RESOLUTION_BACKENDS.get(type(mouse_controller).__module__, 1)
+
+
+class ScrollAccumulator:
+    """滚动累加器
+
+    后端会把 0.3 这样的小数滚动量截断为 0，直接注入时大量小增量被丢弃，
+    偶尔的大增量又一次跳很多格。累加器把增量换算为后端单位，只注入整数部分，
+    余数留给下一次；滚动方向反转时丢弃反方向的余数，避免回滚时先抵消旧余数。
+    """
+
+    def __init__(self, resolution=1):
+        """
+        Args:
+            resolution: 每格滚动的单位数，1 为整格，120 为 Windows 高精度滚轮
+        """
+        self.resolution = resolution
+        self._remainder_x = 0.0
+        self._remainder_y = 0.0
+        self._lock = threading.Lock()
+
+        self.stats = {"emitted": 0, "deferred": 0, "remainders_dropped": 0}
+
+    def add(self, dx, dy):
+        """
+        累加滚动增量并取出可注入的部分
+
+        Args:
+            dx: 水平滚动量（格）
+            dy: 垂直滚动量（格）
+
+        Returns:
+            tuple: 可直接传给 mouse_controller.scroll 的 (dx, dy)，都为 0 时无需注入
+        """
+        with self._lock:
+            steps_x, self._remainder_x = self._take(self._remainder_x, dx)
+            steps_y, self._remainder_y = self._take(self._remainder_y, dy)
+            if steps_x or steps_y:
+                self.stats["emitted"] += 1
+            else:
+                self.stats["deferred"] += 1
+        return self._to_scroll(steps_x), self._to_scroll(steps_y)
+
+    def reset(self):
+        """丢弃未注入的余数"""
+        with self._lock:
+            if self._remainder_x or self._remainder_y:
+                self.stats["remainders_dropped"] += 1
+            self._remainder_x = self._remainder_y = 0.0
+
+    def get_stats(self):
+        """
+        获取累加统计
+
+        Returns:
+            dict: 注入次数、全部留作余数的次数、丢弃余数的次数及当前余数（格）
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            stats["resolution"] = self.resolution
+            stats["remainder"] = (
+                self._remainder_x / self.resolution,
+                self._remainder_y / self.resolution,
+            )
+        return stats
+
+    def _take(self, remainder, delta):
+        units = delta * self.resolution
+        if remainder and units and (remainder > 0) != (units > 0):
+            remainder = 0.0
+            self.stats["remainders_dropped"] += 1
+        total = remainder + units
+        steps = math.trunc(total)
+        return steps, total - steps
+
+    def _to_scroll(self, steps):
+        if self.resolution == 1:
+            return steps
+        if not steps:
+            return 0.0
+        # 后端按 int(value * WHEEL_DELTA) 截断，浮点误差可能少算一个单位，
+        # 向远离零的方向偏移半个单位保证截断后恰好为 steps
+        return (steps + math.copysign(0.5, steps)) / self.resolution
@@ -1,53 +1,26 @@
 """
 安全工具模块
-包含键盘操作安全包装器和状态清理功能
+管理全局输入后端、共享光标状态和键盘状态清理
 """
 
-import logging
 import threading
+import weakref
 
-from pynput import keyboard, mouse
+from core.config import CLEANUP_KEYS, Config
+from utils.cursor_state import CursorState
+from utils.input_backend import create_input_backend
 
-from core.config import CLEANUP_KEYS
+# 全局变量，控制器由 Config.INPUT_BACKEND 选择的后端提供；
+# 多进程模式下 Web 进程不注入输入，设备只在注入进程中打开
+input_backend = create_input_backend(
+    "null" if Config.INJECTION_MODE == "process" else None
+)
+mouse_controller = input_backend.mouse
+keyboard_controller = input_backend.keyboard
 
-# 全局变量
-mouse_controller = mouse.Controller()
-keyboard_controller = keyboard.Controller()
-input_device_lock = threading.Lock()
-
-logger = logging.getLogger(__name__)
-
-
-def safe_keyboard_operation(operation_func):
-    """
-    安全的键盘操作包装器，确保不影响鼠标功能
-
-    Args:
-        operation_func: 要执行的键盘操作函数
-
-    Returns:
-        操作函数的返回值，如果出错则返回None
-    """
-    with input_device_lock:
-        try:
-            # 记录当前鼠标位置
-            original_mouse_pos = mouse_controller.position
-
-            # 执行键盘操作
-            result = operation_func()
-
-            # 确保鼠标位置没有被意外改变
-            current_mouse_pos = mouse_controller.position
-            if current_mouse_pos != original_mouse_pos:
-                logger.info(f"检测到鼠标位置变化，恢复原位置: {original_mouse_pos}")
-                mouse_controller.position = original_mouse_pos
-
-            return result
-        except Exception as e:
-            logger.error(f"键盘操作错误: {e}")
-            # 发生错误时清理所有可能的按键状态
-            cleanup_keyboard_state()
-            return None
+# 每个鼠标控制器对应一个共享的光标状态
+_cursor_states = weakref.WeakKeyDictionary()
+_cursor_states_lock = threading.Lock()
 
 
 def cleanup_keyboard_state():
@@ -67,3 +40,52 @@ def get_controllers():
         tuple: (mouse_controller, keyboard_controller)
     """
     return mouse_controller, keyboard_controller
+
+
+def get_input_backend():
+    """
+    获取当前输入后端
+
+    Returns:
+        InputBackend: 输入后端
+    """
+    return input_backend
+
+
+def install_input_backend(backend):
+    """
+    替换全局输入后端，必须在创建服务之前调用
+
+    Args:
+        backend: 新的输入后端
+
+    Returns:
+        InputBackend: 新的输入后端
+    """
+    global input_backend, mouse_controller, keyboard_controller
+
+    input_backend = backend
+    mouse_controller = backend.mouse
+    keyboard_controller = backend.keyboard
+    return backend
+
+
+def get_cursor_state(controller=None):
+    """
+    获取鼠标控制器对应的共享光标状态
+
+    Args:
+        controller: 鼠标控制器，默认为全局鼠标控制器
+
+    Returns:
+        CursorState: 光标状态
+    """
+    if controller is None:
+        controller = mouse_controller
+
+    with _cursor_states_lock:
+        state = _cursor_states.get(controller)
+        if state is None:
+            state = CursorState(controller)
+            _cursor_states[controller] = state
+        return state
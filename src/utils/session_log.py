@@ -0,0 +1,415 @@
+"""
+输入会话录制模块
+把服务收到的触摸板和键盘事件追加写入紧凑的二进制日志，并支持内存映射读取和回放
+
+文件格式（小端序）::
+
+    文件头 (16字节): 魔数"RCSL"(4s) 版本(H) 保留(H) 录制开始的墙钟时间(d)
+    记录头 (11字节): 相对录制开始的单调时钟微秒(Q) 通道(B) 负载长度(H)
+
+触摸和滚动事件的负载为定长二进制::
+
+    类型(B) 触摸点数(B) 坐标数(B) 客户端时间戳(d, 缺省为NaN)
+    触摸ID长度(B) 触摸ID(UTF-8) 坐标 x(f) y(f) * 坐标数 [其余字段(JSON)]
+
+滚动事件的 dx/dy 作为唯一一组坐标写入。定长部分放不下的字段（client_id、合并移动的
+frames、acceleration、触摸点的非默认 id 等）以紧凑 JSON 对象附在坐标之后，
+回放时原样还原。其余事件（键盘事件等）的负载为紧凑 JSON，类型为 0xFF。
+版本 1 的日志没有附加字段，仍可读取。
+"""
+
+import atexit
+import functools
+import json
+import logging
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+FILE_MAGIC = b"RCSL"
+FILE_VERSION = 2
+READABLE_VERSIONS = frozenset({1, FILE_VERSION})
+FILE_HEADER = struct.Struct("<4sHHd")
+RECORD_HEADER = struct.Struct("<QBH")
+POINTER_HEADER = struct.Struct("<BBBd")
+POINT = struct.Struct("<ff")
+
+CHANNEL_CODES = {"touchpad": 1, "keyboard": 2}
+CHANNEL_NAMES = {code: name for name, code in CHANNEL_CODES.items()}
+
+POINTER_CODES = {
+    "touch_start": 0x01,
+    "touch_move": 0x02,
+    "touch_end": 0x03,
+    "scroll": 0x04,
+}
+POINTER_ACTIONS = {code: action for action, code in POINTER_CODES.items()}
+JSON_PAYLOAD = 0xFF
+
+# 只读操作不改变输入状态，不录制
+READONLY_ACTIONS = frozenset({"status", "hotkey_status"})
+
+MAX_PAYLOAD = 0xFFFF
+
+_NUMBER = (int, float)
+
+
+def _binary_points(touches):
+    """触摸点能否用定长坐标表示：只有 x/y，id 缺省或等于序号"""
+    return isinstance(touches, list) and all(
+        isinstance(t, dict)
+        and t.keys() <= {"id", "x", "y"}
+        and t.get("id", i) == i
+        and isinstance(t.get("x", 0), _NUMBER)
+        and isinstance(t.get("y", 0), _NUMBER)
+        for i, t in enumerate(touches)
+    )
+
+
+def _json_bytes(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class SessionLogError(ValueError):
+    """会话日志格式错误"""
+
+
+def encode_event(event):
+    """
+    编码事件负载
+
+    Args:
+        event: 事件数据
+
+    Returns:
+        bytes: 负载字节
+    """
+    action = event.get("action")
+    code = POINTER_CODES.get(action)
+
+    if code is not None:
+        # 定长部分写不下的字段放入附加 JSON
+        extra = {
+            key: value
+            for key, value in event.items()
+            if key not in ("action", "timestamp")
+        }
+        if action == "scroll":
+            dx, dy = extra.pop("dx", 0), extra.pop("dy", 0)
+            if isinstance(dx, _NUMBER) and isinstance(dy, _NUMBER):
+                points = [(dx, dy)]
+            else:
+                points = []
+                extra.update(dx=dx, dy=dy)
+            touch_count = 0
+            touch_id = b""
+        else:
+            touches = event.get("touches", [])
+            if _binary_points(touches):
+                extra.pop("touches", None)
+                points = [(t.get("x", 0), t.get("y", 0)) for t in touches]
+            else:
+                points = []
+            touch_count = extra.pop(
+                "touch_count", len(touches) if isinstance(touches, list) else 1
+            )
+            touch_id = extra.get("touch_id")
+            if isinstance(touch_id, str) and touch_id:
+                touch_id = extra.pop("touch_id").encode("utf-8")
+            else:
+                touch_id = b""
+
+        timestamp = event.get("timestamp")
+        if (
+            len(points) <= 255
+            and len(touch_id) <= 255
+            and isinstance(touch_count, int)
+            and 0 <= touch_count <= 255
+            and isinstance(timestamp, (int, float, type(None)))
+        ):
+            parts = [
+                POINTER_HEADER.pack(
+                    code,
+                    touch_count,
+                    len(points),
+                    math.nan if timestamp is None else timestamp,
+                ),
+                bytes([len(touch_id)]),
+                touch_id,
+            ]
+            parts.extend(POINT.pack(x, y) for x, y in points)
+            if extra:
+                parts.append(_json_bytes(extra))
+            return b"".join(parts)
+
+    return bytes([JSON_PAYLOAD]) + _json_bytes(event)
+
+
+def decode_event(payload):
+    """
+    解码事件负载，与 encode_event 互逆（坐标精度为 float32）
+
+    Args:
+        payload: 负载字节
+
+    Returns:
+        dict: 事件数据
+
+    Raises:
+        SessionLogError: 负载格式错误
+    """
+    if not payload:
+        raise SessionLogError("空的事件负载")
+
+    if payload[0] == JSON_PAYLOAD:
+        try:
+            return json.loads(payload[1:].decode("utf-8"))
+        except ValueError as e:
+            raise SessionLogError(f"无效的事件负载: {e}") from e
+
+    try:
+        code, touch_count, count, timestamp = POINTER_HEADER.unpack_from(payload)
+        offset = POINTER_HEADER.size
+        id_length = payload[offset]
+        touch_id = payload[offset + 1 : offset + 1 + id_length].decode("utf-8")
+        offset += 1 + id_length
+        points = [
+            POINT.unpack_from(payload, offset + i * POINT.size) for i in range(count)
+        ]
+        offset += count * POINT.size
+        extra = {}
+        if len(payload) > offset:
+            extra = json.loads(payload[offset:].decode("utf-8"))
+    except (struct.error, IndexError, ValueError) as e:
+        raise SessionLogError(f"无效的事件负载: {e}") from e
+    if not isinstance(extra, dict):
+        raise SessionLogError("无效的附加字段")
+
+    action = POINTER_ACTIONS.get(code)
+    if action is None:
+        raise SessionLogError(f"未知的事件类型: {code:#04x}")
+
+    event = {"action": action}
+    if action == "scroll":
+        event["dx"], event["dy"] = points[0] if points else (0.0, 0.0)
+    else:
+        if touch_id:
+            event["touch_id"] = touch_id
+        event["touch_count"] = touch_count
+        event["touches"] = [
+            {"id": i, "x": x, "y": y} for i, (x, y) in enumerate(points)
+        ]
+    if not math.isnan(timestamp):
+        event["timestamp"] = timestamp
+    event.update(extra)
+    return event
+
+
+class SessionRecorder:
+    """会话录制器
+
+    只追加写入，带缓冲，不在请求线程上 fsync；进程异常退出时最后一条记录可能不完整，
+    读取时会忽略不完整的尾部。
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "ab", buffering=64 * 1024)
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self.records = 0
+
+        if self._file.tell() != 0:
+            self._file.close()
+            raise SessionLogError(f"会话日志已存在: {path}")
+        self._file.write(FILE_HEADER.pack(FILE_MAGIC, FILE_VERSION, 0, time.time()))
+
+    def record(self, channel, event):
+        """
+        追加一条事件记录
+
+        Args:
+            channel: 通道名称（touchpad 或 keyboard）
+            event: 事件数据
+        """
+        payload = encode_event(event)
+        if len(payload) > MAX_PAYLOAD:
+            logger.warning("事件数据过大，未录制")
+            return
+
+        channel_code = CHANNEL_CODES[channel]
+        with self._lock:
+            if self._file.closed:
+                return
+            # 时间戳在锁内取得，并发写入的记录在文件中按时间排序，回放依赖这一点
+            offset = int((time.monotonic() - self._start) * 1_000_000)
+            header = RECORD_HEADER.pack(offset, channel_code, len(payload))
+            self._file.write(header)
+            self._file.write(payload)
+            self.records += 1
+
+    def flush(self):
+        """把缓冲的数据写入文件"""
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+
+    def close(self):
+        """关闭日志文件"""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class SessionReader:
+    """会话日志读取器
+
+    通过内存映射按需解码，数小时的会话也不需要整体读入内存。
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            if size < FILE_HEADER.size:
+                raise SessionLogError("无效的会话日志")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+        magic, version, _, self.started_at = FILE_HEADER.unpack_from(self._mmap)
+        if magic != FILE_MAGIC or version not in READABLE_VERSIONS:
+            self.close()
+            raise SessionLogError("无效的会话日志")
+
+    def __iter__(self):
+        """
+        依次产生 (相对时间秒, 通道名称, 事件数据)
+
+        不完整的尾部记录会被忽略。
+        """
+        data = self._mmap
+        size = len(data)
+        offset = FILE_HEADER.size
+
+        while offset + RECORD_HEADER.size <= size:
+            t_us, channel, length = RECORD_HEADER.unpack_from(data, offset)
+            start = offset + RECORD_HEADER.size
+            if start + length > size:
+                break
+            event = decode_event(data[start : start + length])
+            yield t_us / 1_000_000, CHANNEL_NAMES.get(channel, "touchpad"), event
+            offset = start + length
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """关闭内存映射和文件"""
+        self._mmap.close()
+        self._file.close()
+
+
+def replay_session(
+    reader, dispatchers, speed=1.0, sleep=time.sleep, clock=time.monotonic
+):
+    """
+    回放会话
+
+    Args:
+        reader: 可迭代的 (时间, 通道, 事件)，如 SessionReader
+        dispatchers: 通道名称到分发函数的映射
+        speed: 回放倍速，1 为原速，0 为不等待尽快回放
+        sleep: 等待函数
+        clock: 单调时钟函数
+
+    Returns:
+        dict: 回放的事件数、失败数和耗时（秒）
+    """
+    start = clock()
+    replayed = 0
+    failed = 0
+
+    for t, channel, event in reader:
+        if speed > 0:
+            delay = start + t / speed - clock()
+            if delay > 0:
+                sleep(delay)
+
+        try:
+            result, _ = dispatchers[channel](event)
+            if result.get("status") != "success":
+                failed += 1
+        except Exception as e:
+            failed += 1
+            logger.error(f"回放事件失败: {e}")
+        replayed += 1
+
+    return {"events": replayed, "failed": failed, "elapsed": clock() - start}
+
+
+_session_recorder = None
+
+
+def start_session_recording(directory):
+    """
+    开始录制会话，每次启动写入一个新文件
+
+    Args:
+        directory: 日志目录
+
+    Returns:
+        SessionRecorder: 录制器
+    """
+    global _session_recorder
+    if _session_recorder is not None:
+        return _session_recorder
+
+    os.makedirs(directory, exist_ok=True)
+    name = time.strftime("session-%Y%m%d-%H%M%S.rcs")
+    _session_recorder = SessionRecorder(os.path.join(directory, name))
+    atexit.register(_session_recorder.close)
+    logger.info(f"输入会话录制到: {_session_recorder.path}")
+    return _session_recorder
+
+
+def stop_session_recording():
+    """停止录制并关闭日志文件"""
+    global _session_recorder
+    if _session_recorder is not None:
+        _session_recorder.close()
+        _session_recorder = None
+
+
+def record_events(channel):
+    """
+    录制分发函数收到的事件，未开始录制时直接调用原函数
+
+    Args:
+        channel: 通道名称
+
+    Returns:
+        callable: 装饰器
+    """
+
+    def decorator(dispatch):
+        @functools.wraps(dispatch)
+        def wrapper(data):
+            recorder = _session_recorder
+            if recorder is not None and data.get("action") not in READONLY_ACTIONS:
+                recorder.record(channel, data)
+            return dispatch(data)
+
+        return wrapper
+
+    return decorator
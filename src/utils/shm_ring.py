@@ -0,0 +1,216 @@
+"""
+共享内存环形缓冲区模块
+单生产者、单消费者的跨进程字节记录队列，两端只通过各自的索引同步，不使用跨进程锁
+"""
+
+import multiprocessing
+import struct
+import threading
+from multiprocessing import shared_memory
+
+# 头部: 写索引、读索引各占一个缓存行，两端更新自己的索引时不会使对方的缓存行失效
+WRITE_OFFSET = 0
+READ_OFFSET = 64
+WAITING_OFFSET = 128
+HEADER_SIZE = 192
+
+INDEX = struct.Struct("<Q")
+RECORD_HEADER = struct.Struct("<I")
+RECORD_ALIGN = 8
+
+# 记录放不到缓冲区末尾时写入回绕标记，从缓冲区开头继续
+WRAP_MARKER = 0xFFFFFFFF
+
+
+def _aligned_size(length):
+    size = RECORD_HEADER.size + length
+    return (size + RECORD_ALIGN - 1) & ~(RECORD_ALIGN - 1)
+
+
+class ShmRingBuffer:
+    """共享内存环形缓冲区
+
+    读写索引是只增不减的字节计数，对容量取模得到缓冲区位置。生产者先写入记录、
+    再推进写索引，消费者先读出记录、再推进读索引，任何一端都不需要等待对方持有的锁。
+    消费者空闲时置等待标志并在门铃事件上阻塞，生产者只在看到该标志时才敲门铃，
+    繁忙时两端不产生任何系统调用。
+
+    同一进程内的多个生产者线程由进程内的锁串行化；消费者只能有一个线程。
+    """
+
+    def __init__(self, shm, capacity, doorbell, owner):
+        self._shm = shm
+        self._buf = shm.buf
+        self.capacity = capacity
+        self._mask = capacity - 1
+        self.doorbell = doorbell
+        self._owner = owner
+        self._producer_lock = threading.Lock()
+
+        self.stats = {"written": 0, "full": 0, "read": 0, "wakeups": 0}
+
+    @classmethod
+    def create(cls, capacity, context=None):
+        """
+        创建新的环形缓冲区
+
+        Args:
+            capacity: 数据区字节数，向上取整为2的幂
+            context: multiprocessing 上下文，用于创建门铃事件
+
+        Returns:
+            ShmRingBuffer: 缓冲区，由创建者负责 unlink
+        """
+        capacity = 1 << max(capacity - 1, RECORD_ALIGN).bit_length()
+        shm = shared_memory.SharedMemory(create=True, size=HEADER_SIZE + capacity)
+        shm.buf[:HEADER_SIZE] = bytes(HEADER_SIZE)
+        doorbell = (context or multiprocessing).Event()
+        return cls(shm, capacity, doorbell, owner=True)
+
+    def __getstate__(self):
+        # 只在创建子进程时传递，子进程按名称重新映射同一块共享内存
+        return {
+            "name": self._shm.name,
+            "capacity": self.capacity,
+            "doorbell": self.doorbell,
+        }
+
+    def __setstate__(self, state):
+        shm = shared_memory.SharedMemory(name=state["name"])
+        self.__init__(shm, state["capacity"], state["doorbell"], owner=False)
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    @property
+    def max_record_size(self):
+        """单条记录允许的最大字节数"""
+        return self.capacity // 2 - RECORD_HEADER.size
+
+    def put(self, data):
+        """
+        写入一条记录（生产者）
+
+        Args:
+            data: 记录字节
+
+        Returns:
+            bool: 是否写入；缓冲区剩余空间不足时返回False
+
+        Raises:
+            ValueError: 记录超过 max_record_size
+        """
+        length = len(data)
+        if length > self.max_record_size:
+            raise ValueError(f"记录过大: {length} 字节")
+        size = _aligned_size(length)
+        buf = self._buf
+
+        with self._producer_lock:
+            write = INDEX.unpack_from(buf, WRITE_OFFSET)[0]
+            read = INDEX.unpack_from(buf, READ_OFFSET)[0]
+            pos = write & self._mask
+            tail = self.capacity - pos
+            padding = tail if tail < size else 0
+
+            if write + padding + size - read > self.capacity:
+                self.stats["full"] += 1
+                return False
+
+            if padding:
+                RECORD_HEADER.pack_into(buf, HEADER_SIZE + pos, WRAP_MARKER)
+                write += padding
+                pos = 0
+
+            start = HEADER_SIZE + pos
+            RECORD_HEADER.pack_into(buf, start, length)
+            buf[start + RECORD_HEADER.size : start + RECORD_HEADER.size + length] = data
+            # 记录写完后才推进写索引，消费者看到新索引时记录已经完整
+            INDEX.pack_into(buf, WRITE_OFFSET, write + size)
+            self.stats["written"] += 1
+
+            if INDEX.unpack_from(buf, WAITING_OFFSET)[0]:
+                self.doorbell.set()
+                self.stats["wakeups"] += 1
+        return True
+
+    def get(self):
+        """
+        取出一条记录（消费者）
+
+        Returns:
+            bytes: 记录字节，缓冲区为空时返回None
+        """
+        buf = self._buf
+        read = INDEX.unpack_from(buf, READ_OFFSET)[0]
+        if read == INDEX.unpack_from(buf, WRITE_OFFSET)[0]:
+            return None
+
+        pos = read & self._mask
+        length = RECORD_HEADER.unpack_from(buf, HEADER_SIZE + pos)[0]
+        if length == WRAP_MARKER:
+            read += self.capacity - pos
+            pos = 0
+            length = RECORD_HEADER.unpack_from(buf, HEADER_SIZE)[0]
+
+        start = HEADER_SIZE + pos + RECORD_HEADER.size
+        data = bytes(buf[start : start + length])
+        # 读出后才推进读索引，生产者看到新索引时才会覆盖这段空间
+        INDEX.pack_into(buf, READ_OFFSET, read + _aligned_size(length))
+        self.stats["read"] += 1
+        return data
+
+    def wait(self, timeout=None):
+        """
+        阻塞等待新记录（消费者）
+
+        Args:
+            timeout: 最长等待时间（秒）
+
+        Returns:
+            bool: 是否有可读记录
+        """
+        if not self.empty():
+            return True
+
+        INDEX.pack_into(self._buf, WAITING_OFFSET, 1)
+        try:
+            # 置标志后再检查一次，避免生产者在置标志前写入而没有敲门铃
+            if self.empty():
+                self.doorbell.wait(timeout)
+            self.doorbell.clear()
+        finally:
+            INDEX.pack_into(self._buf, WAITING_OFFSET, 0)
+        return not self.empty()
+
+    def empty(self):
+        """缓冲区是否为空"""
+        buf = self._buf
+        return (
+            INDEX.unpack_from(buf, READ_OFFSET)[0]
+            == INDEX.unpack_from(buf, WRITE_OFFSET)[0]
+        )
+
+    def get_stats(self):
+        """
+        获取缓冲区统计
+
+        Returns:
+            dict: 本进程写入、读取、写满和唤醒次数，以及当前占用字节数
+        """
+        stats = dict(self.stats)
+        buf = self._buf
+        stats["capacity"] = self.capacity
+        stats["used"] = (
+            INDEX.unpack_from(buf, WRITE_OFFSET)[0]
+            - INDEX.unpack_from(buf, READ_OFFSET)[0]
+        )
+        return stats
+
+    def close(self):
+        """解除映射，创建者同时删除共享内存"""
+        self._buf = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
@@ -3,13 +3,21 @@
 包含系统相关的工具函数
 """
 
+import functools
 import platform
 import socket
+import threading
+import time
 
+from core.config import Config
 
-def get_screen_size():
+# 检测失败时使用的默认屏幕尺寸
+DEFAULT_SCREEN_SIZE = {"width": 1920, "height": 1080}
+
+
+def _detect_screen_size():
     """
-    获取屏幕尺寸
+    通过 tkinter 检测屏幕尺寸
 
     Returns:
         dict: 包含width和height的字典
@@ -24,24 +32,88 @@ def get_screen_size():
         root.destroy()
         return {"width": width, "height": height}
     except Exception:
-        return {"width": 1920, "height": 1080}
+        return dict(DEFAULT_SCREEN_SIZE)
 
 
-def get_system_info():
+class ScreenGeometry:
+    """屏幕尺寸缓存
+
+    每次检测都要创建并销毁一个 Tk 根窗口，耗时数十到数百毫秒。
+    这里只在首次访问、缓存过期或显式失效后才重新检测。
     """
-    获取系统信息
+
+    def __init__(self, ttl=None, detector=None):
+        self.ttl = Config.SCREEN_SIZE_CACHE_TTL if ttl is None else ttl
+        self.detector = detector or _detect_screen_size
+        self._size = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self):
+        """
+        获取屏幕尺寸
+
+        Returns:
+            dict: 包含width和height的字典
+        """
+        size = self._size
+        if size is not None and time.monotonic() < self._expires_at:
+            return dict(size)
+
+        with self._lock:
+            # 等待锁期间其他线程可能已经完成检测
+            if self._size is None or time.monotonic() >= self._expires_at:
+                self._size = self.detector()
+                self._expires_at = time.monotonic() + self.ttl
+            return dict(self._size)
+
+    def invalidate(self):
+        """使缓存失效，下次访问时重新检测（如显示器分辨率变化后）"""
+        with self._lock:
+            self._size = None
+            self._expires_at = 0.0
+
+
+_screen_geometry = ScreenGeometry()
+
+
+def get_screen_size():
+    """
+    获取屏幕尺寸（带缓存）
 
     Returns:
-        dict: 系统信息字典
+        dict: 包含width和height的字典
     """
+    return _screen_geometry.get()
+
+
+def invalidate_screen_size():
+    """使屏幕尺寸缓存失效"""
+    _screen_geometry.invalidate()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_platform_info():
+    # 平台信息在进程生命周期内不会变化，只查询一次
     return {
         "platform": platform.system(),
         "version": platform.version(),
         "machine": platform.machine(),
-        "screen_size": get_screen_size(),
     }
 
 
+def get_system_info():
+    """
+    获取系统信息
+
+    Returns:
+        dict: 系统信息字典
+    """
+    info = dict(_get_platform_info())
+    info["screen_size"] = get_screen_size()
+    return info
+
+
 def get_local_ip():
     try:
         # 创建一个 UDP 连接到一个外部地址（不真正发送数据）
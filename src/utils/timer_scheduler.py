@@ -0,0 +1,186 @@
+"""
+定时器调度模块
+用单个常驻线程和最小堆执行所有延迟输入操作
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class TimerHandle:
+    """定时器句柄，cancel() 只做标记，由调度线程在出堆时丢弃，复杂度 O(1)"""
+
+    __slots__ = ("when", "callback", "args", "cancelled", "_scheduler")
+
+    def __init__(self, when, callback, args, scheduler):
+        self.when = when
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        self._scheduler = scheduler
+
+    def cancel(self):
+        """取消定时器"""
+        if not self.cancelled:
+            self._scheduler._cancel(self)
+
+
+class TimerScheduler:
+    """定时器调度器
+
+    替代每次点击都创建一个 threading.Timer（即一个系统线程）的做法：
+    所有延迟任务放入同一个按到期时间排序的最小堆，由一个常驻线程依次执行。
+    """
+
+    def __init__(self, name="timer-scheduler"):
+        self.name = name
+        self._heap = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+        self._cancelled_in_heap = 0
+
+        self.stats = {"scheduled": 0, "fired": 0, "cancelled": 0, "errors": 0}
+
+    def call_later(self, delay, callback, *args):
+        """
+        在指定延迟后执行回调
+
+        Args:
+            delay: 延迟秒数
+            callback: 回调函数
+            *args: 回调参数
+
+        Returns:
+            TimerHandle: 可用于取消的句柄
+        """
+        return self.call_at(time.monotonic() + delay, callback, *args)
+
+    def call_at(self, when, callback, *args):
+        """
+        在指定的单调时钟时刻执行回调
+
+        Args:
+            when: time.monotonic() 时刻
+            callback: 回调函数
+            *args: 回调参数
+
+        Returns:
+            TimerHandle: 可用于取消的句柄
+        """
+        handle = TimerHandle(when, callback, args, self)
+        with self._condition:
+            if not self._running:
+                self._start()
+            heapq.heappush(self._heap, (when, next(self._counter), handle))
+            self.stats["scheduled"] += 1
+            # 新任务成为堆顶时唤醒线程重新计算等待时间
+            if self._heap[0][2] is handle:
+                self._condition.notify()
+        return handle
+
+    def get_stats(self):
+        """
+        获取定时器统计
+
+        Returns:
+            dict: 已调度、已触发、已取消的定时器数量及当前待执行数量
+        """
+        with self._condition:
+            stats = dict(self.stats)
+            stats["pending"] = len(self._heap) - self._cancelled_in_heap
+        return stats
+
+    def stop(self):
+        """停止调度线程，丢弃未执行的定时器"""
+        with self._condition:
+            self._running = False
+            self._heap.clear()
+            self._cancelled_in_heap = 0
+            self._condition.notify()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def _cancel(self, handle):
+        with self._condition:
+            if handle.cancelled:
+                return
+            handle.cancelled = True
+            self.stats["cancelled"] += 1
+            self._cancelled_in_heap += 1
+            # 已取消的条目过多时重建堆，避免快速点击时堆无限增长
+            if self._cancelled_in_heap > 64 and self._cancelled_in_heap * 2 > len(
+                self._heap
+            ):
+                self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+                heapq.heapify(self._heap)
+                self._cancelled_in_heap = 0
+
+    def _start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._running:
+                    if not self._heap:
+                        self._condition.wait()
+                        continue
+
+                    when, _, handle = self._heap[0]
+                    if handle.cancelled:
+                        heapq.heappop(self._heap)
+                        self._cancelled_in_heap -= 1
+                        continue
+
+                    delay = when - time.monotonic()
+                    if delay > 0:
+                        self._condition.wait(delay)
+                        continue
+
+                    heapq.heappop(self._heap)
+                    # 出堆后标记为已完成，之后的 cancel() 不再计数
+                    handle.cancelled = True
+                    self.stats["fired"] += 1
+                    break
+                else:
+                    return
+
+            if metrics.enabled:
+                metrics.inc("remote_timer_fired_total")
+                metrics.observe("remote_timer_lateness_seconds", -delay)
+
+            try:
+                handle.callback(*handle.args)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"定时任务执行失败: {e}")
+
+
+_timer_scheduler = None
+_timer_scheduler_lock = threading.Lock()
+
+
+def get_timer_scheduler():
+    """
+    获取全局定时器调度器
+
+    Returns:
+        TimerScheduler: 全局共享的调度器
+    """
+    global _timer_scheduler
+    with _timer_scheduler_lock:
+        if _timer_scheduler is None:
+            _timer_scheduler = TimerScheduler()
+        return _timer_scheduler
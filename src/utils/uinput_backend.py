@@ -0,0 +1,402 @@
+"""
+uinput 输入后端模块
+在 Linux 上创建内核虚拟输入设备，直接写入 evdev 事件，不经过 X11，也可用于 Wayland
+"""
+
+import logging
+import math
+import os
+import struct
+import threading
+
+from utils.input_backend import InputBackend
+from utils.scroll_accumulator import WHEEL_DELTA
+
+logger = logging.getLogger(__name__)
+
+DEVICE_NAME = "remote-controller"
+
+# struct input_event: struct timeval + __u16 type + __u16 code + __s32 value
+# 内核会用自己的时间戳覆盖注入事件的时间，这里填 0
+EVENT_FORMAT = "llHHi"
+EVENT_SIZE = struct.calcsize(EVENT_FORMAT)
+
+# linux/input-event-codes.h
+EV_SYN = 0x00
+EV_KEY = 0x01
+EV_REL = 0x02
+SYN_REPORT = 0
+
+REL_X = 0x00
+REL_Y = 0x01
+REL_HWHEEL = 0x06
+REL_WHEEL = 0x08
+REL_WHEEL_HI_RES = 0x0B
+REL_HWHEEL_HI_RES = 0x0C
+REL_AXES = (REL_X, REL_Y, REL_HWHEEL, REL_WHEEL, REL_WHEEL_HI_RES, REL_HWHEEL_HI_RES)
+
+BUTTON_CODES = {"left": 0x110, "right": 0x111, "middle": 0x112}
+
+KEY_LEFTSHIFT = 42
+
+# pynput Key 名称 -> 键码
+SPECIAL_KEY_CODES = {
+    "esc": 1,
+    "backspace": 14,
+    "tab": 15,
+    "enter": 28,
+    "ctrl": 29,
+    "ctrl_l": 29,
+    "shift": 42,
+    "shift_l": 42,
+    "shift_r": 54,
+    "alt": 56,
+    "alt_l": 56,
+    "space": 57,
+    "caps_lock": 58,
+    "f1": 59,
+    "f2": 60,
+    "f3": 61,
+    "f4": 62,
+    "f5": 63,
+    "f6": 64,
+    "f7": 65,
+    "f8": 66,
+    "f9": 67,
+    "f10": 68,
+    "num_lock": 69,
+    "scroll_lock": 70,
+    "f11": 87,
+    "f12": 88,
+    "ctrl_r": 97,
+    "alt_r": 100,
+    "alt_gr": 100,
+    "home": 102,
+    "up": 103,
+    "page_up": 104,
+    "left": 105,
+    "right": 106,
+    "end": 107,
+    "down": 108,
+    "page_down": 109,
+    "insert": 110,
+    "delete": 111,
+    "cmd": 125,
+    "cmd_l": 125,
+    "cmd_r": 126,
+}
+
+
+def _build_char_codes():
+    """按美式键盘布局生成 字符 -> (键码, 是否需要Shift) 表"""
+    codes = {}
+    rows = (
+        ("1234567890-=", "!@#$%^&*()_+", 2),
+        ("qwertyuiop[]", "QWERTYUIOP{}", 16),
+        ("asdfghjkl;'`", 'ASDFGHJKL:"~', 30),
+        ("\\zxcvbnm,./", "|ZXCVBNM<>?", 43),
+    )
+    for plain, shifted, first_code in rows:
+        for offset, (char, shifted_char) in enumerate(zip(plain, shifted)):
+            codes[char] = (first_code + offset, False)
+            codes[shifted_char] = (first_code + offset, True)
+    codes[" "] = (57, False)
+    codes["\n"] = (28, False)
+    codes["\t"] = (15, False)
+    return codes
+
+
+CHAR_CODES = _build_char_codes()
+
+
+class UinputDevice:
+    """uinput 虚拟设备的事件写入器
+
+    相对位移和滚轮事件并入当前报告，按键事件单独成为一个报告（同一报告内的
+    按下和释放会被合并）。batch() 期间的报告暂存，退出时用一次 write 交给内核。
+    """
+
+    def __init__(self, device):
+        """
+        Args:
+            device: 提供 fd 和 close() 的 uinput 设备（evdev.UInput）
+        """
+        self.device = device
+        self._pending = []
+        self._report_open = False
+        self._depth = 0
+        self._lock = threading.RLock()
+
+        self.stats = {"writes": 0, "events": 0}
+
+    def emit_relative(self, events):
+        """
+        写入相对位移或滚轮事件，批量期间与其他相对事件合并为一个报告
+
+        Args:
+            events: (code, value) 列表
+        """
+        with self._lock:
+            for code, value in events:
+                self._pending.append((EV_REL, code, value))
+            self._report_open = True
+            if not self._depth:
+                self._flush()
+
+    def emit_keys(self, events):
+        """
+        写入按键事件，每个事件单独成为一个报告
+
+        Args:
+            events: (code, value) 列表，value 为 1 按下、0 释放
+        """
+        with self._lock:
+            self._close_report()
+            for code, value in events:
+                self._pending.append((EV_KEY, code, value))
+                self._pending.append((EV_SYN, SYN_REPORT, 0))
+            if not self._depth:
+                self._flush()
+
+    def batch(self):
+        """
+        合并写入的上下文，可嵌套
+
+        Returns:
+            上下文管理器
+        """
+        return _DeviceBatch(self)
+
+    def close(self):
+        """提交剩余事件并关闭设备"""
+        with self._lock:
+            self._flush()
+        self.device.close()
+
+    def _close_report(self):
+        if self._report_open:
+            self._pending.append((EV_SYN, SYN_REPORT, 0))
+            self._report_open = False
+
+    def _flush(self):
+        self._close_report()
+        if not self._pending:
+            return
+        data = b"".join(
+            struct.pack(EVENT_FORMAT, 0, 0, type_, code, value)
+            for type_, code, value in self._pending
+        )
+        self.stats["events"] += len(self._pending)
+        self._pending = []
+        os.write(self.device.fd, data)
+        self.stats["writes"] += 1
+
+
+class _DeviceBatch:
+    def __init__(self, device):
+        self.device = device
+
+    def __enter__(self):
+        self.device._lock.acquire()
+        self.device._depth += 1
+        return self.device
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self.device._depth -= 1
+            if not self.device._depth:
+                self.device._flush()
+        finally:
+            self.device._lock.release()
+        return False
+
+
+class UinputMouseController:
+    """uinput 鼠标控制器
+
+    内核虚拟设备只能发送相对位移，position 是控制器自己累计的虚拟坐标，
+    写入新位置时换算为相对上次位置的位移；不读取、也不限制在屏幕范围内。
+    """
+
+    def __init__(self, device):
+        self.device = device
+        self._position = (0, 0)
+        # 高精度滚轮累计到一整格时补发传统滚轮事件
+        self._wheel_units = 0
+        self._hwheel_units = 0
+
+    @property
+    def position(self):
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        x, y = round(value[0]), round(value[1])
+        self.move(x - self._position[0], y - self._position[1])
+
+    def move(self, dx, dy):
+        """
+        相对移动光标
+
+        Args:
+            dx: 水平位移（像素）
+            dy: 垂直位移（像素）
+        """
+        dx, dy = round(dx), round(dy)
+        self._position = (self._position[0] + dx, self._position[1] + dy)
+        events = []
+        if dx:
+            events.append((REL_X, dx))
+        if dy:
+            events.append((REL_Y, dy))
+        if events:
+            self.device.emit_relative(events)
+
+    def scroll(self, dx, dy):
+        """
+        滚动，单位为格，支持 1/120 格的高精度滚动
+
+        Args:
+            dx: 水平滚动量，正值向右
+            dy: 垂直滚动量，正值向上
+        """
+        events = []
+        units = math.trunc(dy * WHEEL_DELTA)
+        if units:
+            self._wheel_units, detents = self._split(self._wheel_units + units)
+            events.append((REL_WHEEL_HI_RES, units))
+            if detents:
+                events.append((REL_WHEEL, detents))
+        units = math.trunc(dx * WHEEL_DELTA)
+        if units:
+            self._hwheel_units, detents = self._split(self._hwheel_units + units)
+            events.append((REL_HWHEEL_HI_RES, units))
+            if detents:
+                events.append((REL_HWHEEL, detents))
+        if events:
+            self.device.emit_relative(events)
+
+    def press(self, button):
+        self.device.emit_keys([(_button_code(button), 1)])
+
+    def release(self, button):
+        self.device.emit_keys([(_button_code(button), 0)])
+
+    def click(self, button, count=1):
+        code = _button_code(button)
+        self.device.emit_keys([(code, value) for _ in range(count) for value in (1, 0)])
+
+    @staticmethod
+    def _split(units):
+        detents = math.trunc(units / WHEEL_DELTA)
+        return units - detents * WHEEL_DELTA, detents
+
+
+class UinputKeyboardController:
+    """uinput 键盘控制器，字符按美式键盘布局换算为键码"""
+
+    def __init__(self, device):
+        self.device = device
+
+    def press(self, key):
+        code, shift = _key_code(key)
+        self.device.emit_keys([(KEY_LEFTSHIFT, 1), (code, 1)] if shift else [(code, 1)])
+
+    def release(self, key):
+        code, shift = _key_code(key)
+        self.device.emit_keys([(code, 0), (KEY_LEFTSHIFT, 0)] if shift else [(code, 0)])
+
+    def type(self, text):
+        """
+        输入文本，布局中不存在的字符（如中文）被跳过
+
+        Args:
+            text: 要输入的文本
+        """
+        events = []
+        skipped = 0
+        for char in text:
+            entry = CHAR_CODES.get(char)
+            if entry is None:
+                skipped += 1
+                continue
+            code, shift = entry
+            if shift:
+                events.append((KEY_LEFTSHIFT, 1))
+            events.extend(((code, 1), (code, 0)))
+            if shift:
+                events.append((KEY_LEFTSHIFT, 0))
+        if events:
+            self.device.emit_keys(events)
+        if skipped:
+            logger.warning(f"uinput 后端无法输入 {skipped} 个字符，已跳过")
+
+
+def _button_code(button):
+    code = BUTTON_CODES.get(getattr(button, "name", button))
+    if code is None:
+        raise ValueError(f"不支持的鼠标按键: {button}")
+    return code
+
+
+def _key_code(key):
+    """
+    把 pynput 按键或字符换算为 (键码, 是否需要Shift)
+
+    Raises:
+        ValueError: 无法换算的按键
+    """
+    char = key if isinstance(key, str) else getattr(key, "char", None)
+    if char is not None:
+        entry = CHAR_CODES.get(char)
+    else:
+        code = SPECIAL_KEY_CODES.get(getattr(key, "name", None))
+        entry = (code, False) if code is not None else None
+    if entry is None:
+        raise ValueError(f"uinput 后端不支持的按键: {key}")
+    return entry
+
+
+def _open_device(name):
+    try:
+        from evdev import UInput
+    except ImportError as e:
+        raise RuntimeError(
+            "uinput后端需要安装可选依赖: pip install remote-controller[uinput]"
+        ) from e
+
+    keys = set(SPECIAL_KEY_CODES.values())
+    keys.update(code for code, _ in CHAR_CODES.values())
+    keys.update(BUTTON_CODES.values())
+    capabilities = {EV_KEY: sorted(keys), EV_REL: list(REL_AXES)}
+    return UInput(capabilities, name=name)
+
+
+class UinputBackend(InputBackend):
+    """uinput 后端
+
+    鼠标和键盘共用一个虚拟设备，需要 /dev/uinput 的写权限（通常加入 input 组或配置 udev 规则）。
+    """
+
+    name = "uinput"
+
+    def __init__(self, device=None):
+        """
+        Args:
+            device: 已创建的 uinput 设备，默认通过 evdev 创建
+        """
+        self.device = UinputDevice(device or _open_device(DEVICE_NAME))
+        super().__init__(
+            UinputMouseController(self.device), UinputKeyboardController(self.device)
+        )
+
+    def batch(self):
+        return self.device.batch()
+
+    def close(self):
+        self.device.close()
+
+    def get_status(self):
+        status = super().get_status()
+        status.update(self.device.stats)
+        return status
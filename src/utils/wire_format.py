@@ -0,0 +1,286 @@
+"""
+二进制输入协议模块
+定义触摸、滚动和键盘事件的紧凑二进制编码
+
+数据包格式（小端序）::
+
+    包头 (14字节): 版本(B) 标志(B) 事件数(H) 包序号(H) 基准时间戳毫秒(d)
+    触摸/滚动事件 (10字节): 类型(B) 触摸点数(B) 触摸ID(H) 时间偏移毫秒(H) x(h) y(h)
+    键盘事件 (6字节 + 负载): 类型(B) 保留(B) 时间偏移毫秒(H) 负载长度(H) UTF-8负载
+    附加触摸点 (1字节 + 每点4字节): 附加点数(B) 各点相对第一个触摸点的 x(h) y(h)
+
+同一数据包内触摸坐标相对上一个触摸事件差分编码，第一个触摸事件相对 (0, 0)。
+包头带 FLAG_MULTI_POINT 标志时，每个触摸开始和触摸移动事件之后紧跟附加触摸点，
+解码后触摸点的 id 为其在事件中的序号。
+滚动事件的 x/y 为滚轮增量，不参与差分。快捷键负载使用 0x1F 分隔各按键。
+"""
+
+import struct
+
+PROTOCOL_VERSION = 1
+
+# 包头标志位：请求服务端回包
+FLAG_ACK = 0x01
+# 包头标志位：触摸开始和触摸移动事件携带全部触摸点
+FLAG_MULTI_POINT = 0x02
+
+# 消息类型
+MSG_TOUCH_START = 0x01
+MSG_TOUCH_MOVE = 0x02
+MSG_TOUCH_END = 0x03
+MSG_SCROLL = 0x04
+MSG_KEY_PRESS = 0x10
+MSG_KEY_RELEASE = 0x11
+MSG_KEY_TYPE = 0x12
+MSG_HOTKEY = 0x13
+
+# 消息类型到现有操作的映射
+TOUCH_ACTIONS = {
+    MSG_TOUCH_START: "touch_start",
+    MSG_TOUCH_MOVE: "touch_move",
+    MSG_TOUCH_END: "touch_end",
+}
+KEYBOARD_ACTIONS = {
+    MSG_KEY_PRESS: "press",
+    MSG_KEY_RELEASE: "release",
+    MSG_KEY_TYPE: "type",
+    MSG_HOTKEY: "hotkey",
+}
+
+TOUCH_TYPES = {action: msg_type for msg_type, action in TOUCH_ACTIONS.items()}
+KEYBOARD_TYPES = {action: msg_type for msg_type, action in KEYBOARD_ACTIONS.items()}
+
+HOTKEY_SEPARATOR = "\x1f"
+
+HEADER = struct.Struct("<BBHHd")
+POINTER_EVENT = struct.Struct("<BBHHhh")
+KEY_EVENT = struct.Struct("<BxHH")
+POINT_COUNT = struct.Struct("<B")
+POINT_OFFSET = struct.Struct("<hh")
+
+INT16_MIN = -32768
+INT16_MAX = 32767
+
+
+class WireFormatError(ValueError):
+    """二进制数据包格式错误"""
+
+
+def _clamp_int16(value):
+    return max(INT16_MIN, min(INT16_MAX, int(round(value))))
+
+
+def decode_packet(data):
+    """
+    解码二进制数据包
+
+    Args:
+        data: 数据包字节
+
+    Returns:
+        tuple: (包头信息字典, 事件列表)，事件结构与REST接口请求数据一致
+    """
+    if len(data) < HEADER.size:
+        raise WireFormatError("数据包长度不足")
+
+    version, flags, count, seq, base_time = HEADER.unpack_from(data, 0)
+    if version != PROTOCOL_VERSION:
+        raise WireFormatError(f"不支持的协议版本: {version}")
+
+    events = []
+    offset = HEADER.size
+    x = y = 0
+    size = len(data)
+    multi_point = flags & FLAG_MULTI_POINT
+
+    for _ in range(count):
+        if offset >= size:
+            raise WireFormatError("数据包被截断")
+
+        msg_type = data[offset]
+
+        if msg_type in TOUCH_ACTIONS or msg_type == MSG_SCROLL:
+            if offset + POINTER_EVENT.size > size:
+                raise WireFormatError("数据包被截断")
+            _, touch_count, touch_id, dt, ex, ey = POINTER_EVENT.unpack_from(
+                data, offset
+            )
+            offset += POINTER_EVENT.size
+
+            if msg_type == MSG_SCROLL:
+                events.append(
+                    {
+                        "channel": "touchpad",
+                        "action": "scroll",
+                        "dx": ex,
+                        "dy": ey,
+                        "timestamp": base_time + dt,
+                    }
+                )
+                continue
+
+            x += ex
+            y += ey
+            event = {
+                "channel": "touchpad",
+                "action": TOUCH_ACTIONS[msg_type],
+                "touch_id": f"touch_{touch_id}",
+                "touch_count": touch_count,
+                "timestamp": base_time + dt,
+            }
+            if msg_type == MSG_TOUCH_END:
+                event["position"] = {"x": x, "y": y}
+            else:
+                event["touches"] = [{"id": 0, "x": x, "y": y}]
+                if multi_point:
+                    offset = _decode_points(data, offset, event["touches"])
+            events.append(event)
+
+        elif msg_type in KEYBOARD_ACTIONS:
+            if offset + KEY_EVENT.size > size:
+                raise WireFormatError("数据包被截断")
+            _, dt, length = KEY_EVENT.unpack_from(data, offset)
+            offset += KEY_EVENT.size
+            if offset + length > size:
+                raise WireFormatError("数据包被截断")
+            try:
+                payload = bytes(data[offset : offset + length]).decode("utf-8")
+            except UnicodeDecodeError as e:
+                raise WireFormatError(f"无效的键盘负载: {e}") from e
+            offset += length
+
+            action = KEYBOARD_ACTIONS[msg_type]
+            event = {
+                "channel": "keyboard",
+                "action": action,
+                "timestamp": base_time + dt,
+            }
+            if action == "type":
+                event["text"] = payload
+            elif action == "hotkey":
+                event["keys"] = payload.split(HOTKEY_SEPARATOR)
+            else:
+                event["key"] = payload
+            events.append(event)
+
+        else:
+            raise WireFormatError(f"未知的消息类型: {msg_type:#04x}")
+
+    header = {"version": version, "flags": flags, "seq": seq, "timestamp": base_time}
+    return header, events
+
+
+def _touch_number(touch_id):
+    """触摸ID末尾的数字部分，如 "touch_42" 为 42；没有数字部分时为 0"""
+    suffix = str(touch_id).rsplit("_", 1)[-1]
+    return int(suffix) & 0xFFFF if suffix.isascii() and suffix.isdigit() else 0
+
+
+def _decode_points(data, offset, touches):
+    """解码附加触摸点并追加到 touches，返回新的偏移"""
+    if offset + POINT_COUNT.size > len(data):
+        raise WireFormatError("数据包被截断")
+    (count,) = POINT_COUNT.unpack_from(data, offset)
+    offset += POINT_COUNT.size
+    if offset + count * POINT_OFFSET.size > len(data):
+        raise WireFormatError("数据包被截断")
+
+    first = touches[0]
+    for index, (ox, oy) in enumerate(
+        POINT_OFFSET.iter_unpack(data[offset : offset + count * POINT_OFFSET.size]),
+        start=1,
+    ):
+        touches.append({"id": index, "x": first["x"] + ox, "y": first["y"] + oy})
+    return offset + count * POINT_OFFSET.size
+
+
+def _encode_points(touches, first):
+    """编码第一个触摸点之外的触摸点"""
+    extra = touches[1 : 1 + 0xFF]
+    return POINT_COUNT.pack(len(extra)) + b"".join(
+        POINT_OFFSET.pack(
+            _clamp_int16(point["x"] - first["x"]), _clamp_int16(point["y"] - first["y"])
+        )
+        for point in extra
+    )
+
+
+def encode_packet(events, seq=0, flags=0, base_time=None):
+    """
+    编码二进制数据包，与 decode_packet 互逆
+
+    有事件携带多个触摸点时自动设置 FLAG_MULTI_POINT 标志。
+
+    Args:
+        events: 事件列表，结构与 decode_packet 的输出一致
+        seq: 包序号
+        flags: 包头标志位
+        base_time: 基准时间戳（毫秒），默认取第一个事件的时间戳
+
+    Returns:
+        bytes: 数据包字节
+    """
+    if base_time is None:
+        base_time = events[0].get("timestamp", 0) if events else 0
+
+    if any(len(event.get("touches") or ()) > 1 for event in events):
+        flags |= FLAG_MULTI_POINT
+    multi_point = flags & FLAG_MULTI_POINT
+
+    parts = [HEADER.pack(PROTOCOL_VERSION, flags, len(events), seq, base_time)]
+    prev_x = prev_y = 0
+
+    for event in events:
+        action = event["action"]
+        dt = max(0, min(0xFFFF, int(event.get("timestamp", base_time) - base_time)))
+
+        if action == "scroll":
+            parts.append(
+                POINTER_EVENT.pack(
+                    MSG_SCROLL,
+                    0,
+                    0,
+                    dt,
+                    _clamp_int16(event.get("dx", 0)),
+                    _clamp_int16(event.get("dy", 0)),
+                )
+            )
+
+        elif event.get("channel", "touchpad") == "touchpad":
+            if action == "touch_end":
+                point = event.get("position") or {"x": prev_x, "y": prev_y}
+            else:
+                point = event["touches"][0]
+            dx = _clamp_int16(point["x"] - prev_x)
+            dy = _clamp_int16(point["y"] - prev_y)
+            touch_id = _touch_number(event.get("touch_id", "0"))
+            parts.append(
+                POINTER_EVENT.pack(
+                    TOUCH_TYPES[action],
+                    min(0xFF, event.get("touch_count", 1)),
+                    touch_id,
+                    dt,
+                    dx,
+                    dy,
+                )
+            )
+            # 以解码端能还原的坐标为基准，避免截断误差累积
+            prev_x += dx
+            prev_y += dy
+            if multi_point and action != "touch_end":
+                parts.append(
+                    _encode_points(event["touches"], {"x": prev_x, "y": prev_y})
+                )
+
+        else:
+            if action == "type":
+                payload = event["text"]
+            elif action == "hotkey":
+                payload = HOTKEY_SEPARATOR.join(event["keys"])
+            else:
+                payload = event["key"]
+            encoded = payload.encode("utf-8")
+            parts.append(KEY_EVENT.pack(KEYBOARD_TYPES[action], dt, len(encoded)))
+            parts.append(encoded)
+
+    return b"".join(parts)
@@ -0,0 +1,137 @@
+"""
+ASGI服务模块测试
+"""
+
+import sys
+import os
+import json
+import asyncio
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+pytest.importorskip("a2wsgi")
+
+from flask import Flask
+
+from core.asgi import create_asgi_app
+from core.config import Config
+from handlers.stream import STREAM_DISPATCHERS
+
+
+def run_app(app, scope, messages):
+    """按顺序投递消息运行ASGI应用，返回应用发送的全部消息"""
+    incoming = list(messages)
+    sent = []
+
+    async def receive():
+        if incoming:
+            return incoming.pop(0)
+        await asyncio.sleep(3600)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    return sent
+
+
+class TestCreateAsgiApp:
+    """测试ASGI应用包装"""
+
+    def setup_method(self):
+        flask_app = Flask(__name__)
+
+        @flask_app.route("/ping")
+        def ping():
+            return {"status": "success"}
+
+        self.app = create_asgi_app(flask_app)
+
+    def test_http_request_handled_by_flask(self):
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/ping",
+            "raw_path": b"/ping",
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"host", b"localhost")],
+            "client": ("127.0.0.1", 50000),
+            "server": ("127.0.0.1", 8088),
+        }
+
+        sent = run_app(
+            self.app, scope, [{"type": "http.request", "body": b"", "more_body": False}]
+        )
+
+        assert sent[0]["type"] == "http.response.start"
+        assert sent[0]["status"] == 200
+        body = b"".join(m.get("body", b"") for m in sent[1:])
+        assert json.loads(body) == {"status": "success"}
+
+    def test_input_stream_dispatches_events(self):
+        dispatcher = Mock(return_value=({"status": "success"}, 200))
+        scope = {"type": "websocket", "path": "/ws/input"}
+        messages = [
+            {"type": "websocket.connect"},
+            {"type": "websocket.receive", "text": json.dumps({"action": "touch_move"})},
+            {"type": "websocket.receive", "text": json.dumps({"action": "touch_end", "seq": 3})},
+            {"type": "websocket.disconnect", "code": 1000},
+        ]
+
+        with patch.dict(STREAM_DISPATCHERS, {"touchpad": dispatcher}):
+            sent = run_app(self.app, scope, messages)
+
+        assert sent[0] == {"type": "websocket.accept"}
+        # 只有携带 seq 的事件产生回包
+        assert len(sent) == 2
+        assert json.loads(sent[1]["text"])["results"][0]["seq"] == 3
+        assert dispatcher.call_count == 2
+
+    @pytest.mark.parametrize("mode", ["thread", "process"])
+    def test_stream_dispatches_off_the_event_loop(self, mode):
+        threads = []
+        dispatcher = Mock(
+            side_effect=lambda event: threads.append(threading.current_thread())
+            or ({"status": "success"}, 200)
+        )
+        with patch.object(Config, "INJECTION_MODE", mode):
+            app = create_asgi_app(Flask(__name__))
+        messages = [
+            {"type": "websocket.connect"},
+            {"type": "websocket.receive", "text": json.dumps({"action": "touch_move"})},
+            {"type": "websocket.disconnect", "code": 1000},
+        ]
+
+        with patch.dict(STREAM_DISPATCHERS, {"touchpad": dispatcher}):
+            run_app(app, {"type": "websocket", "path": "/ws/input"}, messages)
+
+        assert threads and threads[0] is not threading.main_thread()
+
+    def test_unknown_websocket_path_closed(self):
+        sent = run_app(
+            self.app,
+            {"type": "websocket", "path": "/ws/other"},
+            [{"type": "websocket.connect"}],
+        )
+
+        assert sent == [{"type": "websocket.close", "code": 1000}]
+
+    def test_lifespan(self):
+        sent = run_app(
+            self.app,
+            {"type": "lifespan"},
+            [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}],
+        )
+
+        assert sent == [
+            {"type": "lifespan.startup.complete"},
+            {"type": "lifespan.shutdown.complete"},
+        ]
@@ -0,0 +1,116 @@
+"""
+批量事件处理器模块测试
+"""
+
+import sys
+import os
+from unittest.mock import Mock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from core.app import create_app
+from core.config import Config
+from handlers.batch import BATCH_DISPATCHERS, process_batch
+
+
+class TestProcessBatch:
+    """测试批量事件处理"""
+
+    def test_events_applied_in_order(self):
+        calls = []
+        touchpad = Mock(
+            side_effect=lambda e: calls.append(("touchpad", e["action"]))
+            or ({"status": "success"}, 200)
+        )
+        keyboard = Mock(
+            side_effect=lambda e: calls.append(("keyboard", e["action"]))
+            or ({"status": "success"}, 200)
+        )
+        events = [
+            {"action": "touch_start", "timestamp": 1},
+            {"channel": "keyboard", "action": "press", "key": "a", "timestamp": 2},
+            {"channel": "touchpad", "action": "touch_end", "timestamp": 3},
+        ]
+
+        with patch.dict(
+            BATCH_DISPATCHERS, {"touchpad": touchpad, "keyboard": keyboard}
+        ):
+            response = process_batch(events)
+
+        assert calls == [
+            ("touchpad", "touch_start"),
+            ("keyboard", "press"),
+            ("touchpad", "touch_end"),
+        ]
+        assert response == {"status": "success", "processed": 3, "failed": 0}
+        # 客户端时间戳原样传给处理函数
+        assert touchpad.call_args_list[0][0][0]["timestamp"] == 1
+
+    def test_only_seq_events_have_results(self):
+        dispatcher = Mock(return_value=({"status": "success", "action": "left_click"}, 200))
+
+        with patch.dict(BATCH_DISPATCHERS, {"touchpad": dispatcher}):
+            response = process_batch(
+                [{"action": "touch_move"}, {"action": "touch_end", "seq": 4}]
+            )
+
+        assert response["results"] == [
+            {"seq": 4, "status": "success", "action": "left_click"}
+        ]
+
+    def test_failures_do_not_stop_batch(self):
+        dispatcher = Mock(
+            side_effect=[
+                ({"status": "error", "message": "不支持的操作: bad"}, 400),
+                RuntimeError("boom"),
+                ({"status": "success"}, 200),
+            ]
+        )
+
+        with patch.dict(BATCH_DISPATCHERS, {"touchpad": dispatcher}):
+            response = process_batch(
+                [
+                    {"action": "bad"},
+                    {"action": "touch_move"},
+                    "not an event",
+                    {"channel": "mouse"},
+                    {"action": "touch_end"},
+                ]
+            )
+
+        assert response["status"] == "partial"
+        assert response["processed"] == 1
+        assert response["failed"] == 4
+        assert [e["index"] for e in response["errors"]] == [0, 1, 2, 3]
+
+
+class TestBatchEndpoint:
+    """测试 /api/batch 接口"""
+
+    def setup_method(self):
+        self.client = create_app().test_client()
+
+    def test_batch_request(self):
+        dispatcher = Mock(return_value=({"status": "success"}, 200))
+
+        with patch.dict(BATCH_DISPATCHERS, {"touchpad": dispatcher}):
+            response = self.client.post(
+                "/api/batch",
+                json={"events": [{"action": "touch_move"}, {"action": "touch_move"}]},
+            )
+
+        assert response.status_code == 200
+        assert response.get_json()["processed"] == 2
+        assert dispatcher.call_count == 2
+
+    def test_invalid_request(self):
+        response = self.client.post("/api/batch", json={"events": []})
+
+        assert response.status_code == 400
+
+    def test_too_many_events(self):
+        events = [{"action": "touch_move"}] * (Config.MAX_BATCH_EVENTS + 1)
+
+        response = self.client.post("/api/batch", json={"events": events})
+
+        assert response.status_code == 400
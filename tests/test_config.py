@@ -7,7 +7,13 @@ import os
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from core.config import Config, TOUCHPAD_CONFIG, KEYBOARD_CONFIG, WINDOWS_KEY_MAP
+from core.config import (
+    KEYBOARD_CONFIG,
+    SWIPE_HOTKEYS_BY_PLATFORM,
+    TOUCHPAD_CONFIG,
+    WINDOWS_KEY_MAP,
+    Config,
+)
 
 
 class TestConfig:
@@ -25,19 +31,28 @@ class TestTouchpadConfig:
     """测试触摸板配置"""
 
     def test_touchpad_config_keys(self):
-        assert "CLICK_DELAY" in TOUCHPAD_CONFIG
-        assert "DOUBLE_CLICK_TIME" in TOUCHPAD_CONFIG
+        assert "TAP_MAX_DURATION" in TOUCHPAD_CONFIG
+        assert "TAP_DRAG_WINDOW" in TOUCHPAD_CONFIG
         assert "MOVE_THRESHOLD" in TOUCHPAD_CONFIG
         assert "CURSOR_SENSITIVITY" in TOUCHPAD_CONFIG
         assert "SCROLL_SENSITIVITY" in TOUCHPAD_CONFIG
 
     def test_touchpad_config_values(self):
-        assert TOUCHPAD_CONFIG["CLICK_DELAY"] > 0
-        assert TOUCHPAD_CONFIG["DOUBLE_CLICK_TIME"] > 0
+        assert TOUCHPAD_CONFIG["TAP_MAX_DURATION"] > 0
+        assert TOUCHPAD_CONFIG["TAP_DRAG_WINDOW"] >= 0
         assert TOUCHPAD_CONFIG["MOVE_THRESHOLD"] >= 0
         assert TOUCHPAD_CONFIG["CURSOR_SENSITIVITY"] > 0
         assert TOUCHPAD_CONFIG["SCROLL_SENSITIVITY"] > 0
 
+    def test_three_finger_drag_is_default(self):
+        assert TOUCHPAD_CONFIG["THREE_FINGER_GESTURE"] == "drag"
+
+    def test_swipe_hotkeys_use_known_keys(self):
+        for bindings in SWIPE_HOTKEYS_BY_PLATFORM.values():
+            for keys in bindings.values():
+                # 单个字符按原字符输入，其余按键名必须在键位映射中
+                assert all(key in WINDOWS_KEY_MAP or len(key) == 1 for key in keys)
+
 
 class TestKeyboardConfig:
     """测试键盘配置"""
@@ -0,0 +1,72 @@
+"""
+光标状态模块测试
+"""
+
+import sys
+import os
+from unittest.mock import Mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.cursor_state import CursorState
+
+
+def make_mouse(position=(100, 100)):
+    mock_mouse = Mock()
+    mock_mouse.position = position
+    return mock_mouse
+
+
+class TestCursorState:
+    """测试虚拟光标状态"""
+
+    def test_moves_do_not_read_system_position(self):
+        mock_mouse = make_mouse()
+        state = CursorState(mock_mouse, resync_interval=60)
+
+        for _ in range(5):
+            state.move_by(2, 1)
+
+        assert mock_mouse.position == (110, 105)
+        assert state.get_stats()["reads"] == 1
+        assert state.get_stats()["writes"] == 5
+
+    def test_fractional_deltas_accumulate(self):
+        mock_mouse = make_mouse()
+        state = CursorState(mock_mouse, resync_interval=60)
+
+        for _ in range(10):
+            state.move_by(0.3, -0.3)
+
+        assert mock_mouse.position == (103, 97)
+        # 不足一个像素的移动不会产生写入
+        assert state.get_stats()["writes"] < 10
+
+    def test_drift_is_corrected_on_resync(self):
+        mock_mouse = make_mouse()
+        state = CursorState(mock_mouse, resync_interval=60)
+        state.move_by(5, 5)
+
+        # 用户操作了实体鼠标
+        mock_mouse.position = (500, 500)
+        state.invalidate()
+        state.move_by(1, 0)
+
+        assert mock_mouse.position == (501, 500)
+        assert state.get_stats()["drift_corrections"] == 1
+
+    def test_position_uses_cache(self):
+        mock_mouse = make_mouse((7, 8))
+        state = CursorState(mock_mouse, resync_interval=60)
+
+        assert state.position == (7, 8)
+        assert state.position == (7, 8)
+        assert state.get_stats()["reads"] == 1
+
+    def test_move_to(self):
+        mock_mouse = make_mouse()
+        state = CursorState(mock_mouse, resync_interval=60)
+
+        assert state.move_to(20, 30) is True
+        assert mock_mouse.position == (20, 30)
+        assert state.move_to(20, 30) is False
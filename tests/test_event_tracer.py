@@ -0,0 +1,77 @@
+"""
+事件追踪模块测试
+"""
+
+import sys
+import os
+import logging
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pytest
+
+from utils.event_tracer import EventTracer, read_trace
+
+
+class TestEventTracer:
+    """测试事件追踪器"""
+
+    def test_level_gating(self):
+        tracer = EventTracer(level=logging.INFO, sample_rate=1.0, capacity=16)
+        debug_event = tracer.register("debug_event")
+        info_event = tracer.register("info_event", level=logging.INFO)
+
+        tracer.record(debug_event)
+        tracer.record(info_event)
+
+        assert not tracer.is_enabled(debug_event)
+        assert tracer.is_enabled(info_event)
+        assert tracer.get_stats()["written"] == 1
+
+    def test_sampling_only_applies_to_sampled_events(self):
+        tracer = EventTracer(level=logging.DEBUG, sample_rate=0.25, capacity=64)
+        move = tracer.register("move", sampled=True)
+        click = tracer.register("click")
+
+        for _ in range(8):
+            tracer.record(move)
+        for _ in range(3):
+            tracer.record(click)
+
+        assert tracer.get_stats()["written"] == 2 + 3
+
+    def test_dump_and_read(self, tmp_path):
+        tracer = EventTracer(level=logging.DEBUG, sample_rate=1.0, capacity=16)
+        move = tracer.register("move", ("touch_count", "dx", "dy", "distance"))
+        press = tracer.register("press", ("key",))
+
+        tracer.record(move, 1, 2.5, -3.0, 4.0)
+        tracer.record(press, tracer.intern("ctrl"))
+        path = tmp_path / "trace.bin"
+
+        assert tracer.dump(str(path)) == 2
+
+        records = read_trace(str(path))
+        assert records[0]["event"] == "move"
+        assert records[0]["touch_count"] == 1
+        assert records[0]["dx"] == 2.5
+        assert records[0]["dy"] == -3.0
+        assert records[1] == {"t": records[1]["t"], "event": "press", "key": "ctrl"}
+        assert records[0]["t"] <= records[1]["t"]
+
+    def test_ring_buffer_keeps_newest_in_order(self, tmp_path):
+        tracer = EventTracer(level=logging.DEBUG, sample_rate=1.0, capacity=4)
+        event = tracer.register("value", ("n",))
+
+        for n in range(10):
+            tracer.record(event, n)
+        path = tmp_path / "trace.bin"
+        tracer.dump(str(path))
+
+        assert [r["n"] for r in read_trace(str(path))] == [6, 7, 8, 9]
+
+    def test_dump_without_path(self):
+        tracer = EventTracer(capacity=4)
+
+        with pytest.raises(ValueError):
+            tracer.dump()
@@ -0,0 +1,130 @@
+"""
+多点触控手势模块测试
+"""
+
+import math
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from services.gesture_engine import (
+    GESTURE_PINCH,
+    GESTURE_SCROLL,
+    GESTURE_SWIPE,
+    GestureTracker,
+    frame_features,
+)
+
+
+def frame(*points, ids=None):
+    ids = ids or range(len(points))
+    return [{"id": i, "x": x, "y": y} for i, (x, y) in zip(ids, points)]
+
+
+def make_tracker():
+    return GestureTracker(scroll_threshold=5, pinch_threshold=12, swipe_distance=60)
+
+
+class TestFrameFeatures:
+    """测试帧几何特征"""
+
+    def test_centroid_spread_and_angles(self):
+        (ids, cx, cy, spread, angles), single = frame_features(
+            [frame((0, 0), (20, 0)), frame((5, 7))]
+        )
+
+        assert ids == (0, 1)
+        assert (cx, cy) == (10, 0)
+        assert spread == 10
+        assert angles == pytest.approx((math.pi, 0.0))
+        assert single[1:4] == (5, 7, 0)
+
+
+class TestGestureTracker:
+    """测试手势识别"""
+
+    def test_small_motion_is_not_locked(self):
+        tracker = make_tracker()
+        tracker.update([frame((0, 0), (20, 0))])
+
+        result = tracker.update([frame((2, 1), (22, 1))])
+
+        assert result["gesture"] is None
+        assert result["dx"] == 0
+
+    def test_two_finger_scroll_emits_pending_motion_on_lock(self):
+        tracker = make_tracker()
+        tracker.update([frame((0, 0), (20, 0))])
+        tracker.update([frame((0, 3), (20, 3))])
+
+        result = tracker.update([frame((0, 8), (20, 8))])
+
+        assert result["gesture"] == GESTURE_SCROLL
+        assert result["dy"] == pytest.approx(8)
+        assert tracker.update([frame((0, 10), (20, 10))])["dy"] == pytest.approx(2)
+
+    def test_pinch_reports_log_zoom(self):
+        tracker = make_tracker()
+        tracker.update([frame((90, 0), (110, 0))])
+
+        result = tracker.update([frame((80, 0), (120, 0)), frame((70, 0), (130, 0))])
+
+        assert result["gesture"] == GESTURE_PINCH
+        assert result["zoom"] == pytest.approx(math.log(3))
+        assert result["dx"] == 0
+
+    def test_rotation(self):
+        tracker = make_tracker()
+        tracker.update([frame((-20, 0), (20, 0))])
+
+        result = tracker.update([frame((0, -20), (0, 20)), frame((0, -40), (0, 40))])
+
+        assert result["gesture"] == GESTURE_PINCH
+        assert result["rotation"] == pytest.approx(math.pi / 2)
+
+    def test_three_finger_swipe_direction_reported_once(self):
+        tracker = make_tracker()
+        points = [(0, 100), (20, 100), (40, 100)]
+        tracker.update([frame(*points)])
+
+        result = tracker.update([frame(*[(x, y - 70) for x, y in points])])
+
+        assert result["gesture"] == GESTURE_SWIPE
+        assert result["swipe"] == "up"
+        later = tracker.update([frame(*[(x, y - 140) for x, y in points])])
+        assert later["gesture"] == GESTURE_SWIPE
+        assert later["swipe"] is None
+
+    def test_finger_change_uses_common_points(self):
+        tracker = make_tracker()
+        tracker.update([frame((0, 0))])
+
+        # 第二根手指落下，只有共有的第一个触摸点的位移计入
+        result = tracker.update([frame((0, 10), (100, 100))])
+
+        assert tracker.fingers == 2
+        assert result["gesture"] == GESTURE_SCROLL
+        assert (result["dx"], result["dy"]) == (0, 10)
+
+    def test_batch_matches_frame_by_frame(self):
+        frames = [frame((90 - i, 5), (110 + i, 5)) for i in range(0, 30, 3)]
+        batch, single = make_tracker(), make_tracker()
+        batch.update(frames[:1])
+        single.update(frames[:1])
+
+        batched = batch.update(frames[1:])
+        zoom = math.fsum(single.update([f])["zoom"] for f in frames[1:])
+
+        assert batched["gesture"] == single.gesture == GESTURE_PINCH
+        assert batched["zoom"] == pytest.approx(zoom)
+
+    def test_fingers_argument_overrides_point_count(self):
+        tracker = make_tracker()
+        tracker.update([frame((0, 0))], fingers=2)
+
+        result = tracker.update([frame((0, 30))], fingers=2)
+
+        assert result["gesture"] == GESTURE_SCROLL
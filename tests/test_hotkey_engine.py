@@ -0,0 +1,88 @@
+"""
+快捷键引擎模块测试
+"""
+
+import sys
+import os
+import time
+from unittest.mock import Mock
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from core.config import HOTKEY_PROFILES, WINDOWS_KEY_MAP
+from services.hotkey_engine import HotkeyEngine
+from utils.input_worker import InputWorker
+from utils.timer_scheduler import TimerScheduler
+
+
+class TestHotkeyEngine:
+    """测试快捷键引擎"""
+
+    def setup_method(self):
+        self.keyboard = Mock()
+        self.timer_scheduler = TimerScheduler()
+        self.injector = InputWorker()
+        self.engine = HotkeyEngine(
+            self.keyboard, timer_scheduler=self.timer_scheduler, injector=self.injector
+        )
+
+    def teardown_method(self):
+        self.timer_scheduler.stop()
+        self.injector.stop()
+
+    def test_execute_does_not_block(self):
+        start = time.perf_counter()
+        job = self.engine.execute(["ctrl", "shift", "escape"])
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.05
+        assert not job.done()
+        assert job.wait(2)
+        assert job.status == "done"
+
+    def test_press_and_release_order(self):
+        job = self.engine.execute(["ctrl", "a"], "fast")
+
+        assert job.wait(2)
+        assert [c.args[0] for c in self.keyboard.press.call_args_list] == [
+            WINDOWS_KEY_MAP["ctrl"],
+            "a",
+        ]
+        assert [c.args[0] for c in self.keyboard.release.call_args_list] == [
+            "a",
+            WINDOWS_KEY_MAP["ctrl"],
+        ]
+
+    def test_instant_profile_skips_timer(self):
+        self.engine.timer_scheduler = Mock()
+
+        job = self.engine.execute(["ctrl", "c"], "instant")
+
+        assert job.wait(2)
+        self.engine.timer_scheduler.call_later.assert_not_called()
+
+    def test_custom_timing(self):
+        timing = self.engine.resolve_timing({"press_interval": 0})
+
+        assert timing["press_interval"] == 0
+        assert timing["release_interval"] == HOTKEY_PROFILES["default"]["release_interval"]
+
+    def test_invalid_profile(self):
+        with pytest.raises(ValueError):
+            self.engine.execute(["ctrl"], "missing")
+
+        with pytest.raises(ValueError):
+            self.engine.resolve_timing({"press_interval": -1})
+
+    def test_bool_timing_is_rejected(self):
+        with pytest.raises(ValueError):
+            self.engine.resolve_timing({"release_interval": True})
+
+    def test_job_lookup(self):
+        job = self.engine.execute(["a"], "instant")
+        job.wait(2)
+
+        assert self.engine.get_job(job.job_id) is job
+        assert self.engine.get_job(job.job_id).to_dict()["status"] == "done"
@@ -0,0 +1,155 @@
+"""
+注入进程服务模块测试
+"""
+
+import os
+import sys
+from unittest.mock import Mock
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from services.injector_process import (
+    InjectorProcess,
+    RemoteCallError,
+    RemoteKeyboardService,
+    RemoteTouchpadService,
+)
+
+
+class TestRemoteServices:
+    """测试转发到注入进程的服务"""
+
+    def test_touchpad_events_are_forwarded(self):
+        injector = Mock()
+        injector.submit.return_value = True
+        service = RemoteTouchpadService(injector)
+        data = {"touch_id": "t", "touches": [{"id": 0, "x": 1, "y": 2}]}
+
+        result = service.handle_touch_move(data)
+
+        assert result["status"] == "success"
+        injector.submit.assert_called_once_with("touchpad", "handle_touch_move", data)
+
+    def test_touchpad_reports_full_queue(self):
+        injector = Mock()
+        injector.submit.return_value = False
+        service = RemoteTouchpadService(injector)
+
+        assert service.handle_scroll({"dx": 0, "dy": 1})["status"] == "error"
+
+    def test_touch_end_returns_injector_result(self):
+        injector = Mock()
+        result = {"status": "success", "action": "left_click"}
+        injector.call.return_value = (True, True, result)
+        service = RemoteTouchpadService(injector)
+
+        result = service.handle_touch_end({"touch_id": "t"})
+
+        assert result["action"] == "left_click"
+        injector.call.assert_called_once_with(
+            "touchpad", "handle_touch_end", {"touch_id": "t"}
+        )
+
+    def test_touch_end_without_reply_is_still_accepted(self):
+        injector = Mock()
+        injector.call.return_value = (True, False, None)
+        service = RemoteTouchpadService(injector)
+
+        assert service.handle_touch_end({"touch_id": "t"}) == {"status": "success"}
+
+    def test_keyboard_events_are_forwarded(self):
+        injector = Mock()
+        injector.call.side_effect = [(True, True, 5), (True, True, {"job_id": 5})]
+        service = RemoteKeyboardService(injector)
+
+        job = service.execute_hotkey(("ctrl", "c"))
+
+        assert job.job_id == 5
+        assert service.get_hotkey_status(job.job_id) == {"job_id": 5}
+        assert injector.call.call_args_list[0].args == (
+            "keyboard", "execute_hotkey", ["ctrl", "c"], None
+        )
+
+    def test_invalid_hotkey_raises_value_error(self):
+        injector = Mock()
+        injector.call.side_effect = RemoteCallError("不支持的按键: nope")
+        service = RemoteKeyboardService(injector)
+
+        with pytest.raises(ValueError):
+            service.execute_hotkey(["nope"])
+
+    def test_keyboard_raises_when_queue_full(self):
+        injector = Mock()
+        injector.submit.return_value = False
+        service = RemoteKeyboardService(injector)
+
+        try:
+            service.press_key("a")
+            raised = False
+        except RuntimeError:
+            raised = True
+        assert raised
+
+
+class TestInjectorProcess:
+    """测试注入进程"""
+
+    def test_events_are_injected_in_child_process(self):
+        process = InjectorProcess(
+            ring_size=4096, input_backend="null", report_call_times=True
+        )
+        process.start()
+        try:
+            touch = {"touch_id": "t", "touch_count": 1, "client_id": "c"}
+            assert process.submit(
+                "touchpad",
+                "handle_touch_start",
+                {**touch, "touches": [{"id": 0, "x": 0, "y": 0}]},
+            )
+            for i in range(1, 6):
+                process.submit(
+                    "touchpad",
+                    "handle_touch_move",
+                    {**touch, "touches": [{"id": 0, "x": i * 10, "y": 0}]},
+                )
+            process.submit("keyboard", "type_text", "hi")
+        finally:
+            report = process.stop(timeout=30)
+
+        assert report["processed"] == 7
+        assert report["errors"] == 0
+        assert report["input_backend"]["name"] == "null"
+        assert report["call_times"]["mouse"]
+        assert len(report["call_times"]["keyboard"]) == 1
+        assert not process.alive
+
+    def test_calls_return_results_from_child_process(self):
+        process = InjectorProcess(
+            ring_size=4096, input_backend="null", reply_timeout=30
+        )
+        process.start()
+        try:
+            touch = {"touch_id": "t", "touch_count": 1, "client_id": "c"}
+            process.submit(
+                "touchpad",
+                "handle_touch_start",
+                {**touch, "touches": [{"id": 0, "x": 0, "y": 0}]},
+            )
+            submitted, replied, result = process.call(
+                "touchpad", "handle_touch_end", touch
+            )
+            _, _, job_id = process.call(
+                "keyboard", "execute_hotkey", ["ctrl", "c"], None
+            )
+            _, _, status = process.call("keyboard", "get_hotkey_status", job_id)
+            with pytest.raises(RemoteCallError):
+                process.call("keyboard", "execute_hotkey", ["ctrl"], "no-such-profile")
+        finally:
+            process.stop(timeout=30)
+
+        assert submitted and replied
+        assert result["action"] == "left_click"
+        assert job_id is not None
+        assert status["job_id"] == job_id
@@ -0,0 +1,273 @@
+"""
+输入后端模块测试
+"""
+
+import os
+import struct
+import sys
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from pynput.mouse import Button
+
+from services.input_scheduler import InputScheduler
+from utils.input_backend import (
+    NullBackend,
+    RecordingBackend,
+    create_input_backend,
+)
+from utils.null_controller import NullMouseController
+from utils.scroll_accumulator import ScrollAccumulator, detect_scroll_resolution
+from utils.uinput_backend import (
+    BUTTON_CODES,
+    EV_KEY,
+    EV_REL,
+    EV_SYN,
+    EVENT_FORMAT,
+    EVENT_SIZE,
+    KEY_LEFTSHIFT,
+    REL_WHEEL,
+    REL_WHEEL_HI_RES,
+    REL_X,
+    REL_Y,
+    UinputBackend,
+)
+
+
+class FakeUinputDevice:
+    """用管道代替 /dev/uinput，读端可取回写入的事件"""
+
+    def __init__(self):
+        self.read_fd, self.fd = os.pipe()
+        os.set_blocking(self.read_fd, False)
+
+    def close(self):
+        os.close(self.fd)
+
+    def read_writes(self):
+        """
+        Returns:
+            list: 每次 write 解析出的 (type, code, value) 列表
+        """
+        data = os.read(self.read_fd, 65536)
+        events = [
+            struct.unpack(EVENT_FORMAT, data[i : i + EVENT_SIZE])[2:]
+            for i in range(0, len(data), EVENT_SIZE)
+        ]
+        return events
+
+
+SYN = (EV_SYN, 0, 0)
+
+
+@pytest.fixture
+def uinput():
+    device = FakeUinputDevice()
+    backend = UinputBackend(device)
+    yield backend, device
+    os.close(device.read_fd)
+    backend.close()
+
+
+class TestCreateInputBackend:
+    """测试后端选择"""
+
+    def test_create_by_name(self):
+        assert isinstance(create_input_backend("null"), NullBackend)
+        assert isinstance(create_input_backend("recording"), RecordingBackend)
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            create_input_backend("unknown")
+
+    def test_default_from_config(self):
+        with patch("utils.input_backend.Config.INPUT_BACKEND", "null"):
+            assert create_input_backend().name == "null"
+
+    def test_uinput_requires_evdev(self):
+        with patch.dict(sys.modules, {"evdev": None}):
+            with pytest.raises(RuntimeError):
+                create_input_backend("uinput")
+
+    def test_install_input_backend(self):
+        import utils.security as security
+
+        original = security.get_input_backend()
+        try:
+            backend = security.install_input_backend(NullBackend())
+            assert security.get_input_backend() is backend
+            assert security.get_controllers() == (backend.mouse, backend.keyboard)
+        finally:
+            security.install_input_backend(original)
+
+
+class TestRecordingBackend:
+    """测试录制后端"""
+
+    def test_records_calls_in_order(self):
+        backend = RecordingBackend()
+
+        backend.mouse.position = (10, 20)
+        backend.keyboard.type("hi")
+        backend.mouse.click(Button.left, 2)
+
+        events = [(device, method, args) for _, device, method, args in backend.events]
+        assert events == [
+            ("mouse", "position", ((10, 20),)),
+            ("keyboard", "type", ("hi",)),
+            ("mouse", "click", (Button.left, 2)),
+        ]
+        assert backend.mouse.calls == 2
+
+    def test_null_backend_does_not_record_arguments(self):
+        backend = NullBackend()
+
+        backend.mouse.scroll(0, 1)
+
+        assert backend.mouse.calls == 1
+        assert backend.mouse.events is None
+
+    def test_null_controller_keeps_bounded_call_history(self):
+        with patch("utils.null_controller.CALL_HISTORY", 3):
+            controller = NullMouseController()
+
+        for _ in range(5):
+            controller.scroll(0, 1)
+
+        assert controller.calls == 5
+        assert len(controller.call_times) == 3
+
+
+class TestUinputBackend:
+    """测试 uinput 后端写入的事件"""
+
+    def test_position_becomes_relative_motion(self, uinput):
+        backend, device = uinput
+
+        backend.mouse.position = (5, -3)
+        backend.mouse.position = (5, 2)
+
+        assert device.read_writes() == [
+            (EV_REL, REL_X, 5),
+            (EV_REL, REL_Y, -3),
+            SYN,
+            (EV_REL, REL_Y, 5),
+            SYN,
+        ]
+        assert backend.mouse.position == (5, 2)
+        assert backend.device.stats["writes"] == 2
+
+    def test_batch_merges_motion_and_scroll(self, uinput):
+        backend, device = uinput
+
+        with backend.batch():
+            backend.mouse.move(1, 1)
+            backend.mouse.move(2, 0)
+            backend.mouse.scroll(0, 1)
+
+        assert device.read_writes() == [
+            (EV_REL, REL_X, 1),
+            (EV_REL, REL_Y, 1),
+            (EV_REL, REL_X, 2),
+            (EV_REL, REL_WHEEL_HI_RES, 120),
+            (EV_REL, REL_WHEEL, 1),
+            SYN,
+        ]
+        assert backend.device.stats["writes"] == 1
+
+    def test_click_reports_press_and_release_separately(self, uinput):
+        backend, device = uinput
+
+        backend.mouse.click(Button.right)
+
+        code = BUTTON_CODES["right"]
+        assert device.read_writes() == [(EV_KEY, code, 1), SYN, (EV_KEY, code, 0), SYN]
+
+    def test_high_resolution_scroll_emits_detent_when_accumulated(self, uinput):
+        backend, device = uinput
+
+        for _ in range(4):
+            backend.mouse.scroll(0, -0.25)
+
+        events = device.read_writes()
+        assert events.count((EV_REL, REL_WHEEL_HI_RES, -30)) == 4
+        assert events[-2:] == [(EV_REL, REL_WHEEL, -1), SYN]
+        assert (EV_REL, REL_WHEEL, -1) not in events[:-2]
+
+    def test_scroll_resolution_detected(self, uinput):
+        backend, _ = uinput
+
+        accumulator = ScrollAccumulator(detect_scroll_resolution(backend.mouse))
+
+        assert accumulator.resolution == 120
+
+    def test_keys_and_shifted_characters(self, uinput):
+        backend, device = uinput
+
+        # 测试使用的 dummy 后端里所有 Key 成员互为别名，按名称构造按键
+        ctrl = SimpleNamespace(name="ctrl_l")
+        backend.keyboard.press(ctrl)
+        backend.keyboard.release(ctrl)
+        backend.keyboard.type("A!")
+
+        assert device.read_writes() == [
+            (EV_KEY, 29, 1),
+            SYN,
+            (EV_KEY, 29, 0),
+            SYN,
+            (EV_KEY, KEY_LEFTSHIFT, 1),
+            SYN,
+            (EV_KEY, 30, 1),
+            SYN,
+            (EV_KEY, 30, 0),
+            SYN,
+            (EV_KEY, KEY_LEFTSHIFT, 0),
+            SYN,
+            (EV_KEY, KEY_LEFTSHIFT, 1),
+            SYN,
+            (EV_KEY, 2, 1),
+            SYN,
+            (EV_KEY, 2, 0),
+            SYN,
+            (EV_KEY, KEY_LEFTSHIFT, 0),
+            SYN,
+        ]
+
+    def test_unsupported_characters_are_skipped(self, uinput):
+        backend, device = uinput
+
+        backend.keyboard.type("中a")
+
+        assert device.read_writes() == [(EV_KEY, 30, 1), SYN, (EV_KEY, 30, 0), SYN]
+
+    def test_unsupported_key_raises(self, uinput):
+        backend, _ = uinput
+
+        with pytest.raises(ValueError):
+            backend.keyboard.press("中")
+
+
+class TestInputSchedulerBatch:
+    """测试输入调度器按帧批量提交"""
+
+    def test_flush_uses_backend_batch(self, uinput):
+        backend, device = uinput
+        scheduler = InputScheduler(
+            backend.mouse,
+            timer_scheduler=Mock(),
+            injector=Mock(),
+            batch=backend.batch,
+        )
+
+        scheduler.add_move(3, 4)
+        scheduler.add_scroll(0, 2)
+        scheduler.flush()
+
+        events = device.read_writes()
+        assert events[-1] == SYN
+        assert events.count(SYN) == 1
+        assert backend.device.stats["writes"] == 1
@@ -0,0 +1,126 @@
+"""
+输入调度服务模块测试
+"""
+
+import sys
+import os
+import threading
+import time
+from unittest.mock import Mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from services.input_scheduler import InputScheduler
+from utils.input_worker import InputWorker
+from utils.null_controller import NullMouseController
+from utils.timer_scheduler import TimerScheduler
+
+
+def make_mouse(position=(100, 100)):
+    mock_mouse = Mock()
+    mock_mouse.position = position
+    return mock_mouse
+
+
+class TestInputScheduler:
+    """测试输入调度器"""
+
+    def test_moves_are_coalesced(self):
+        mock_mouse = make_mouse()
+        # 使用假的定时器调度器，只手动刷新
+        scheduler = InputScheduler(mock_mouse, frame_rate=120, timer_scheduler=Mock())
+
+        for _ in range(10):
+            scheduler.add_move(1.5, -1)
+        scheduler.flush()
+
+        assert mock_mouse.position == (115.0, 90)
+        stats = scheduler.get_stats()
+        assert stats["moves_received"] == 10
+        assert stats["move_injections"] == 1
+        assert stats["injections_saved"] == 9
+
+    def test_scrolls_are_coalesced(self):
+        mock_mouse = make_mouse()
+        scheduler = InputScheduler(mock_mouse, frame_rate=120, timer_scheduler=Mock())
+
+        scheduler.add_scroll(0, 0.5)
+        scheduler.add_scroll(0, 0.5)
+        scheduler.flush()
+
+        mock_mouse.scroll.assert_called_once_with(0, 1.0)
+
+    def test_small_scrolls_are_not_truncated(self):
+        mock_mouse = make_mouse()
+        scheduler = InputScheduler(mock_mouse, frame_rate=120, timer_scheduler=Mock())
+
+        for _ in range(4):
+            scheduler.add_scroll(0, 0.3)
+            scheduler.flush()
+
+        mock_mouse.scroll.assert_called_once_with(0, 1)
+        stats = scheduler.get_stats()
+        assert stats["scroll_injections"] == 1
+        assert stats["scroll"]["deferred"] == 3
+
+    def test_flush_without_pending_is_noop(self):
+        mock_mouse = make_mouse()
+        scheduler = InputScheduler(mock_mouse)
+
+        scheduler.flush()
+
+        mock_mouse.scroll.assert_not_called()
+        assert scheduler.get_stats()["move_injections"] == 0
+
+    def test_frame_is_scheduled_once_per_flush(self):
+        mock_timer_scheduler = Mock()
+        scheduler = InputScheduler(make_mouse(), timer_scheduler=mock_timer_scheduler)
+
+        scheduler.add_move(1, 1)
+        scheduler.add_move(1, 1)
+        scheduler.add_scroll(0, 1)
+
+        assert mock_timer_scheduler.call_later.call_count == 1
+
+    def test_background_thread_flushes(self):
+        mock_mouse = make_mouse((0, 0))
+        scheduler = InputScheduler(mock_mouse, frame_rate=200, timer_scheduler=TimerScheduler())
+
+        scheduler.add_move(3, 4)
+        deadline = time.time() + 1.0
+        while scheduler.get_stats()["move_injections"] == 0 and time.time() < deadline:
+            time.sleep(0.005)
+        scheduler.stop()
+        scheduler.timer_scheduler.stop()
+
+        assert mock_mouse.position == (3, 4)
+        assert scheduler.get_stats()["avg_latency_ms"] >= 0
+
+    def test_flush_only_injects_moves_requested_before_it(self):
+        mouse = NullMouseController(record=True)
+        worker = InputWorker()
+        timers = TimerScheduler()
+        scheduler = InputScheduler(
+            mouse, frame_rate=200, timer_scheduler=timers, injector=worker
+        )
+        # 工作线程忙时排队：按下之后才到达的移动不能并入按下之前的刷新
+        gate = threading.Event()
+        worker.submit(gate.wait)
+        scheduler.add_move(5, 0)
+        scheduler.request_flush()
+        worker.submit(mouse.press, "left")
+        scheduler.add_move(7, 0)
+        gate.set()
+
+        deadline = time.time() + 1.0
+        while len(mouse.events) < 3 and time.time() < deadline:
+            time.sleep(0.005)
+        worker.stop()
+        timers.stop()
+
+        events = [(method, args) for _, method, args in mouse.events]
+        assert events == [
+            ("position", ((5, 0),)),
+            ("press", ("left",)),
+            ("position", ((12, 0),)),
+        ]
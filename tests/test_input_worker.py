@@ -0,0 +1,117 @@
+"""
+输入注入工作线程模块测试
+"""
+
+import sys
+import os
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.input_worker import InputWorker, get_input_worker
+
+
+class TestInputWorker:
+    """测试输入注入工作线程"""
+
+    def setup_method(self):
+        self.worker = InputWorker(max_queue_size=4)
+
+    def teardown_method(self):
+        self.worker.stop()
+
+    def test_tasks_run_in_order_on_worker_thread(self):
+        calls = []
+
+        for i in range(3):
+            self.worker.submit(lambda i=i: calls.append((i, threading.current_thread().name)))
+
+        assert self.worker.wait_idle()
+        assert [c[0] for c in calls] == [0, 1, 2]
+        assert {c[1] for c in calls} == {"input-worker"}
+
+    def test_coalesced_tasks_are_merged(self):
+        gate = threading.Event()
+        calls = []
+        self.worker.submit(gate.wait)
+
+        for _ in range(5):
+            self.worker.submit(calls.append, "move", coalesce_key="move")
+        gate.set()
+
+        assert self.worker.wait_idle()
+        assert calls == ["move"]
+        assert self.worker.get_stats()["merged"] == 4
+
+    def test_merge_keeps_latest_arguments(self):
+        gate = threading.Event()
+        calls = []
+        self.worker.submit(gate.wait)
+
+        self.worker.submit(calls.append, "first", coalesce_key="move")
+        self.worker.submit(calls.append, "second", coalesce_key="move")
+        gate.set()
+
+        assert self.worker.wait_idle()
+        assert calls == ["second"]
+
+    def test_coalesced_task_does_not_jump_over_later_tasks(self):
+        gate = threading.Event()
+        calls = []
+        self.worker.submit(gate.wait)
+
+        self.worker.submit(calls.append, "move", coalesce_key="move")
+        self.worker.submit(calls.append, "press")
+        self.worker.submit(calls.append, "move", coalesce_key="move")
+        gate.set()
+
+        assert self.worker.wait_idle()
+        assert calls == ["move", "press", "move"]
+        assert self.worker.get_stats()["merged"] == 0
+
+    def test_full_queue_drops_only_coalesced_tasks(self):
+        gate = threading.Event()
+        started = threading.Event()
+        self.worker.submit(lambda: (started.set(), gate.wait()))
+        started.wait(1.0)
+
+        results = [self.worker.submit(lambda: None) for _ in range(4)]
+        results.append(self.worker.submit(lambda: None, coalesce_key="move"))
+        gate.set()
+
+        assert results == [True] * 4 + [False]
+        assert self.worker.wait_idle()
+        stats = self.worker.get_stats()
+        assert stats["dropped"] == 1
+        assert stats["max_depth"] == 4
+        assert stats["depth"] == 0
+
+    def test_release_runs_when_queue_is_full(self):
+        gate = threading.Event()
+        started = threading.Event()
+        calls = []
+        self.worker.submit(lambda: (started.set(), gate.wait()))
+        started.wait(1.0)
+
+        for _ in range(4):
+            self.worker.submit(calls.append, "press")
+        assert self.worker.submit(calls.append, "release")
+        gate.set()
+
+        assert self.worker.wait_idle()
+        assert calls[-1] == "release"
+        stats = self.worker.get_stats()
+        assert stats["overflow"] == 1
+        assert stats["dropped"] == 0
+
+    def test_task_errors_are_counted(self):
+        self.worker.submit(lambda: 1 / 0)
+        self.worker.submit(lambda: None)
+
+        assert self.worker.wait_idle()
+        stats = self.worker.get_stats()
+        assert stats["errors"] == 1
+        assert stats["executed"] == 2
+
+    def test_global_worker_is_shared(self):
+        assert get_input_worker() is get_input_worker()
@@ -9,7 +9,6 @@ from unittest.mock import Mock, patch, MagicMock
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from services.keyboard_service import KeyboardService
-from core.config import KEYBOARD_CONFIG
 
 
 class TestKeyboardService:
@@ -35,6 +34,7 @@ class TestKeyboardService:
 
         service = KeyboardService()
         service.press_key("ctrl")
+        service.injector.wait_idle()
 
         mock_keyboard.press.assert_called()
 
@@ -46,6 +46,7 @@ class TestKeyboardService:
 
         service = KeyboardService()
         service.press_key("a")
+        service.injector.wait_idle()
 
         mock_keyboard.press.assert_called_with("a")
 
@@ -57,6 +58,7 @@ class TestKeyboardService:
 
         service = KeyboardService()
         service.release_key("ctrl")
+        service.injector.wait_idle()
 
         mock_keyboard.release.assert_called()
 
@@ -68,18 +70,33 @@ class TestKeyboardService:
 
         service = KeyboardService()
         service.type_text("hello")
+        service.injector.wait_idle()
 
         mock_keyboard.type.assert_called_with("hello")
 
     @patch("services.keyboard_service.get_controllers")
-    @patch("services.keyboard_service.time.sleep")
-    def test_execute_hotkey(self, mock_sleep, mock_get_controllers):
+    def test_execute_hotkey(self, mock_get_controllers):
         mock_mouse = Mock()
         mock_keyboard = Mock()
         mock_get_controllers.return_value = (mock_mouse, mock_keyboard)
 
         service = KeyboardService()
-        service.execute_hotkey(["ctrl", "a"])
+        job = service.execute_hotkey(["ctrl", "a"])
 
+        assert job.wait(2)
+        assert job.status == "done"
         assert mock_keyboard.press.call_count == 2
         assert mock_keyboard.release.call_count == 2
+
+    @patch("services.keyboard_service.get_controllers")
+    def test_get_hotkey_status(self, mock_get_controllers):
+        mock_get_controllers.return_value = (Mock(), Mock())
+
+        service = KeyboardService()
+        job = service.execute_hotkey(["ctrl", "c"], "instant")
+        job.wait(2)
+
+        status = service.get_hotkey_status(job.job_id)
+        assert status["status"] == "done"
+        assert status["keys"] == ["ctrl", "c"]
+        assert service.get_hotkey_status(-1) is None
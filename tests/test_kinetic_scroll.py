@@ -0,0 +1,155 @@
+"""
+惯性滚动模块测试
+"""
+
+import os
+import sys
+import time
+from unittest.mock import Mock
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from services.kinetic_scroll import KineticScroller
+from utils.timer_scheduler import TimerScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_scroller(**kwargs):
+    clock = FakeClock()
+    timer_scheduler = Mock()
+    input_scheduler = Mock()
+    options = {
+        "tick_rate": 100,
+        "time_constant": 0.5,
+        "start_velocity": 5.0,
+        "stop_velocity": 0.5,
+        "velocity_window": 0.1,
+    }
+    options.update(kwargs)
+    scroller = KineticScroller(
+        input_scheduler, timer_scheduler=timer_scheduler, clock=clock, **options
+    )
+    return scroller, input_scheduler, timer_scheduler, clock
+
+
+def fling(scroller, dy=1.0, interval=0.01, count=10):
+    for i in range(count):
+        scroller.track(0.0, dy, i * interval)
+    return scroller.release((count - 1) * interval)
+
+
+def run_ticks(scroller, timer_scheduler, clock, limit=1000):
+    """依次执行已调度的节拍，返回节拍数"""
+    ticks = 0
+    while ticks < limit and timer_scheduler.call_later.call_count > ticks:
+        delay, callback, *args = timer_scheduler.call_later.call_args_list[ticks].args
+        clock.now += delay
+        callback(*args)
+        ticks += 1
+    return ticks
+
+
+class TestKineticScroller:
+    """测试惯性滚动"""
+
+    def test_release_estimates_velocity(self):
+        scroller, _, timer_scheduler, _ = make_scroller()
+
+        velocity = fling(scroller, dy=1.0, interval=0.01)
+
+        assert velocity[0] == pytest.approx(0.0)
+        assert velocity[1] == pytest.approx(100.0)
+        assert scroller.active
+        timer_scheduler.call_later.assert_called_once()
+
+    def test_slow_release_does_not_fling(self):
+        scroller, _, timer_scheduler, _ = make_scroller()
+
+        assert fling(scroller, dy=0.01, interval=0.01) is None
+        assert not scroller.active
+        timer_scheduler.call_later.assert_not_called()
+
+    def test_pause_before_release_does_not_fling(self):
+        scroller, _, _, _ = make_scroller()
+        for i in range(10):
+            scroller.track(0.0, 1.0, i * 0.01)
+
+        assert scroller.release(0.5) is None
+
+    def test_single_sample_does_not_fling(self):
+        scroller, _, _, _ = make_scroller()
+        scroller.track(0.0, 10.0, 0.0)
+
+        assert scroller.release(0.0) is None
+
+    def test_ticks_decay_until_stop(self):
+        scroller, input_scheduler, timer_scheduler, clock = make_scroller()
+        vy = fling(scroller, dy=1.0, interval=0.01)[1]
+
+        ticks = run_ticks(scroller, timer_scheduler, clock)
+
+        steps = [call.args[1] for call in input_scheduler.add_scroll.call_args_list]
+        assert len(steps) == ticks
+        assert steps == sorted(steps, reverse=True)
+        # 总位移接近 v0 * τ
+        assert sum(steps) == pytest.approx(vy * 0.5, rel=0.01)
+        assert not scroller.active
+        assert scroller.get_stats()["ticks"] == ticks
+
+    def test_cancel_stops_ticks(self):
+        scroller, input_scheduler, timer_scheduler, clock = make_scroller()
+        fling(scroller)
+        delay, callback, *args = timer_scheduler.call_later.call_args.args
+
+        scroller.cancel()
+        clock.now += delay
+        callback(*args)
+
+        input_scheduler.add_scroll.assert_not_called()
+        assert not scroller.active
+        assert scroller.get_stats()["cancelled"] == 1
+
+    def test_stale_tick_after_new_fling_is_ignored(self):
+        scroller, input_scheduler, timer_scheduler, clock = make_scroller()
+        fling(scroller)
+        _, stale_callback, *stale_args = timer_scheduler.call_later.call_args.args
+
+        scroller.cancel()
+        fling(scroller)
+        stale_callback(*stale_args)
+
+        input_scheduler.add_scroll.assert_not_called()
+        assert scroller.active
+
+    def test_runs_on_timer_scheduler(self):
+        timer_scheduler = TimerScheduler(name="test-kinetic")
+        input_scheduler = Mock()
+        scroller = KineticScroller(
+            input_scheduler,
+            timer_scheduler=timer_scheduler,
+            tick_rate=200,
+            time_constant=0.05,
+            start_velocity=1.0,
+            stop_velocity=1.0,
+            velocity_window=0.1,
+        )
+        try:
+            fling(scroller, dy=1.0, interval=0.01)
+
+            deadline = time.monotonic() + 2.0
+            while scroller.active and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert not scroller.active
+            assert input_scheduler.add_scroll.call_count > 1
+        finally:
+            timer_scheduler.stop()
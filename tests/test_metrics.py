@@ -0,0 +1,151 @@
+"""
+运行指标模块测试
+"""
+
+import sys
+import os
+from unittest.mock import Mock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from core.app import create_app
+from utils.metrics import (
+    BUCKET_COUNT,
+    MAX_MICROSECONDS,
+    Histogram,
+    Metrics,
+    _bucket_index,
+    _bucket_upper,
+    instrument_dispatch,
+    metrics,
+)
+
+
+class TestHistogram:
+    """测试对数分桶直方图"""
+
+    def test_bucket_bounds_contain_value(self):
+        for value in list(range(0, 200)) + [1000, 12345, 10**6, MAX_MICROSECONDS]:
+            index = _bucket_index(value)
+            assert index < BUCKET_COUNT
+            assert value < _bucket_upper(index)
+            if index > 0:
+                assert value >= _bucket_upper(index - 1)
+
+    def test_percentile_relative_error(self):
+        histogram = Histogram()
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000)
+
+        p50 = histogram.percentile(0.5)
+        p99 = histogram.percentile(0.99)
+
+        assert abs(p50 - 0.5) / 0.5 <= 1 / 16
+        assert abs(p99 - 0.99) / 0.99 <= 1 / 16
+        assert histogram.count == 1000
+
+    def test_percentile_empty(self):
+        assert Histogram().percentile(0.99) == 0.0
+
+    def test_cumulative(self):
+        histogram = Histogram()
+        for seconds in (0.0001, 0.002, 0.003, 0.5):
+            histogram.record(seconds)
+
+        assert histogram.cumulative([0.001, 0.01, 1.0]) == [1, 3, 4]
+
+
+class TestMetrics:
+    """测试指标注册表"""
+
+    def test_counter_and_render(self):
+        registry = Metrics(enabled=True)
+        registry.describe("test_total", "测试计数")
+        registry.inc("test_total", action="a")
+        registry.inc("test_total", 2, action="a")
+
+        text = registry.render()
+
+        assert registry.get_counter("test_total", action="a") == 3
+        assert "# TYPE test_total counter" in text
+        assert 'test_total{action="a"} 3' in text
+
+    def test_histogram_render(self):
+        registry = Metrics(enabled=True)
+        registry.observe("latency_seconds", 0.002, stage="x")
+
+        text = registry.render()
+
+        assert "# TYPE latency_seconds histogram" in text
+        assert 'latency_seconds_bucket{stage="x",le="0.001"} 0' in text
+        assert 'latency_seconds_bucket{stage="x",le="+Inf"} 1' in text
+        assert 'latency_seconds_count{stage="x"} 1' in text
+
+    def test_collector_gauges(self):
+        registry = Metrics(enabled=True)
+        registry.register_collector(lambda: [("queue_depth", {}, 5)])
+
+        assert "queue_depth 5" in registry.render()
+
+
+class TestInstrumentDispatch:
+    """测试操作分发统计"""
+
+    def setup_method(self):
+        metrics.reset()
+
+    def teardown_method(self):
+        metrics.reset()
+
+    def test_disabled_does_not_record(self):
+        dispatch = instrument_dispatch("test", ("run",))(
+            Mock(return_value=({"status": "success"}, 200))
+        )
+
+        with patch.object(metrics, "enabled", False):
+            result = dispatch({"action": "run"})
+
+        assert result == ({"status": "success"}, 200)
+        assert metrics.get_counter(
+            "remote_actions_total", channel="test", action="run", code="200"
+        ) == 0
+
+    def test_enabled_records_action(self):
+        dispatch = instrument_dispatch("test", ("run",))(
+            Mock(return_value=({"status": "success"}, 200))
+        )
+
+        with patch.object(metrics, "enabled", True):
+            dispatch({"action": "run"})
+            dispatch({"action": "unknown-action"})
+
+        assert metrics.get_counter(
+            "remote_actions_total", channel="test", action="run", code="200"
+        ) == 1
+        assert metrics.get_counter(
+            "remote_actions_total", channel="test", action="other", code="200"
+        ) == 1
+        histogram = metrics.get_histogram(
+            "remote_action_duration_seconds", channel="test", action="run"
+        )
+        assert histogram.count == 1
+
+
+class TestMetricsEndpoint:
+    """测试 /metrics 接口"""
+
+    def test_metrics_endpoint(self):
+        client = create_app().test_client()
+
+        with patch.object(metrics, "enabled", True):
+            client.post("/api/touchpad", json={"action": "status"})
+            response = client.get("/metrics")
+
+        text = response.get_data(as_text=True)
+        assert response.status_code == 200
+        assert response.mimetype == "text/plain"
+        assert "remote_injection_queue_depth" in text
+        assert (
+            'remote_actions_total{action="status",channel="touchpad",code="200"}'
+            in text
+        )
@@ -0,0 +1,204 @@
+"""
+运动插值模块测试
+"""
+
+import os
+import sys
+from unittest.mock import Mock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from services.motion_upsampler import MotionUpsampler, OneEuroFilter
+from services.touchpad_service import TouchpadService
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_upsampler(**kwargs):
+    clock = FakeClock()
+    timer_scheduler = Mock()
+    input_scheduler = Mock()
+    options = {
+        "tick_rate": 120,
+        "passthrough_interval": 0.02,
+        "max_interval": 0.1,
+        "min_cutoff": 5.0,
+        "beta": 0.0,
+    }
+    options.update(kwargs)
+    upsampler = MotionUpsampler(
+        input_scheduler, timer_scheduler=timer_scheduler, clock=clock, **options
+    )
+    return upsampler, input_scheduler, timer_scheduler, clock
+
+
+def run_ticks(timer_scheduler, clock, start, until):
+    """执行从第 start 个开始、时钟不超过 until 的节拍，返回下一个未执行节拍的序号"""
+    index = start
+    while timer_scheduler.call_later.call_count > index:
+        delay, callback, *args = timer_scheduler.call_later.call_args_list[index].args
+        if clock.now + delay > until + 1e-9:
+            break
+        clock.now += delay
+        callback(*args)
+        index += 1
+    return index
+
+
+def moved(input_scheduler):
+    """累计注入的位移"""
+    calls = input_scheduler.add_move.call_args_list
+    return sum(c.args[0] for c in calls), sum(c.args[1] for c in calls)
+
+
+def stream(upsampler, timer_scheduler, clock, samples, interval):
+    """按固定间隔发送采样，采样之间执行到期的节拍"""
+    upsampler.begin()
+    index = 0
+    for i, (dx, dy) in enumerate(samples):
+        clock.now = i * interval
+        upsampler.add(dx, dy, i * interval)
+        index = run_ticks(timer_scheduler, clock, index, (i + 1) * interval)
+    return index
+
+
+class TestOneEuroFilter:
+    """测试 One Euro 滤波"""
+
+    def test_first_sample_passes_through(self):
+        f = OneEuroFilter(min_cutoff=1.0)
+
+        assert f(10.0, 0.01) == 10.0
+
+    def test_smooths_jitter(self):
+        f = OneEuroFilter(min_cutoff=1.0, beta=0.0)
+        values = [f(v, 0.01) for v in (0.0, 10.0, 0.0, 10.0)]
+
+        assert all(0.0 <= v < 5.0 for v in values)
+
+    def test_beta_reduces_lag(self):
+        slow = OneEuroFilter(min_cutoff=1.0, beta=0.0)
+        fast = OneEuroFilter(min_cutoff=1.0, beta=1.0)
+        for f in (slow, fast):
+            f(0.0, 0.01)
+
+        assert fast(100.0, 0.01) > slow(100.0, 0.01)
+
+    def test_reset_discards_history(self):
+        f = OneEuroFilter(min_cutoff=1.0)
+        f(0.0, 0.01)
+        f.reset()
+
+        assert f(7.0, 0.01) == 7.0
+
+
+class TestMotionUpsampler:
+    """测试运动插值"""
+
+    def test_high_rate_passes_through(self):
+        upsampler, input_scheduler, timer_scheduler, clock = make_upsampler()
+
+        stream(upsampler, timer_scheduler, clock, [(2, 1)] * 5, 0.008)
+
+        assert input_scheduler.add_move.call_count == 5
+        timer_scheduler.call_later.assert_not_called()
+        assert upsampler.get_stats()["passthrough"] == 5
+
+    def test_low_rate_spreads_motion_over_frames(self):
+        upsampler, input_scheduler, timer_scheduler, clock = make_upsampler()
+
+        stream(upsampler, timer_scheduler, clock, [(12, -6)] * 6, 1 / 30)
+
+        steps = [c.args for c in input_scheduler.add_move.call_args_list]
+        # 第一个采样只确定间隔起点，直接注入；之后每个采样分摊到约4个帧
+        assert len(steps) > 12
+        assert max(abs(dx) for dx, _ in steps[1:]) < 12
+        assert all(dx >= 0 and dy <= 0 for dx, dy in steps)
+        input_scheduler.request_flush.assert_called()
+
+    def test_never_overshoots_client_motion(self):
+        upsampler, input_scheduler, timer_scheduler, clock = make_upsampler()
+        samples = [(12, 0)] * 5 + [(1, 0)] * 3
+
+        stream(upsampler, timer_scheduler, clock, samples, 1 / 30)
+
+        total_x, _ = moved(input_scheduler)
+        pending_x, _ = upsampler.get_stats()["pending"]
+        assert total_x + pending_x == pytest.approx(sum(dx for dx, _ in samples))
+        assert pending_x >= 0
+
+    def test_stall_releases_remaining_motion(self):
+        upsampler, input_scheduler, timer_scheduler, clock = make_upsampler()
+        index = stream(upsampler, timer_scheduler, clock, [(12, 6)] * 4, 1 / 30)
+
+        run_ticks(timer_scheduler, clock, index, clock.now + 0.2)
+
+        assert moved(input_scheduler) == pytest.approx((48, 24))
+        assert not upsampler.active
+        assert upsampler.get_stats()["stalls"] == 1
+
+    def test_flush_injects_pending_motion(self):
+        upsampler, input_scheduler, timer_scheduler, clock = make_upsampler()
+        stream(upsampler, timer_scheduler, clock, [(12, 6)] * 3, 1 / 30)
+
+        upsampler.flush()
+
+        assert moved(input_scheduler) == pytest.approx((36, 18))
+        assert not upsampler.active
+        assert upsampler.get_stats()["pending"] == (0.0, 0.0)
+
+    def test_cancel_discards_pending_motion(self):
+        upsampler, input_scheduler, timer_scheduler, clock = make_upsampler()
+        stream(upsampler, timer_scheduler, clock, [(12, 6)] * 3, 1 / 30)
+        injected = moved(input_scheduler)
+
+        upsampler.cancel()
+        run_ticks(timer_scheduler, clock, 0, clock.now + 1)
+
+        assert moved(input_scheduler) == injected
+
+    def test_pause_between_touches_is_not_an_interval(self):
+        upsampler, input_scheduler, timer_scheduler, clock = make_upsampler()
+        stream(upsampler, timer_scheduler, clock, [(1, 0)] * 4, 0.008)
+
+        upsampler.begin()
+        upsampler.add(5, 0, 0.09)
+
+        assert upsampler.sample_interval == pytest.approx(0.008)
+        assert input_scheduler.add_move.call_args.args == (5, 0)
+
+
+class TestTouchpadServiceUpsampling:
+    """测试触摸板服务接入运动插值"""
+
+    @patch("services.touchpad_service.get_controllers")
+    def test_drag_release_flushes_interpolated_motion(self, mock_get_controllers):
+        mock_get_controllers.return_value = (Mock(), Mock())
+
+        service = TouchpadService()
+        # 节拍不执行，插值中的位移只能由松手时的 flush 注入
+        service.timer_scheduler = Mock()
+        service.input_scheduler = Mock()
+        touch = {"touch_id": "drag", "touch_count": 3}
+        service.handle_touch_start({**touch, "touches": [{"x": 0, "y": 0}]})
+        for i in range(1, 5):
+            service.handle_touch_move(
+                {**touch, "touches": [{"x": 10 * i, "y": 0}], "timestamp": 50 * i}
+            )
+        upsampler = service.get_session().motion_upsampler
+        assert upsampler.active
+
+        service.handle_touch_end(touch)
+
+        assert not upsampler.active
+        assert upsampler.get_stats()["pending"] == (0.0, 0.0)
+        assert service.input_scheduler.add_move.call_count == 2
+        service.shutdown()
@@ -0,0 +1,162 @@
+"""
+指针加速模块测试
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from core.config import POINTER_ACCELERATION_PROFILES, TOUCHPAD_CONFIG
+from services.pointer_acceleration import (
+    AdaptiveCurve,
+    FlatCurve,
+    PointerAccelerator,
+    TableCurve,
+    create_curve,
+)
+
+
+class TestCurves:
+    """测试加速曲线"""
+
+    def test_flat_curve(self):
+        curve = FlatCurve(2.0)
+
+        assert curve.gain(0) == 2.0
+        assert curve.gain(5000) == 2.0
+
+    def test_adaptive_curve(self):
+        curve = AdaptiveCurve(base_gain=1.0, max_gain=3.0, threshold=100, accel=0.01)
+
+        assert curve.gain(50) == 1.0
+        assert curve.gain(100) == 1.0
+        assert curve.gain(200) == pytest.approx(2.0)
+        assert curve.gain(10000) == 3.0
+
+    def test_adaptive_curve_rejects_inverted_gains(self):
+        with pytest.raises(ValueError):
+            AdaptiveCurve(base_gain=3.0, max_gain=1.0, threshold=0, accel=1)
+
+    def test_table_curve_interpolates(self):
+        curve = TableCurve([(100, 2.0), (0, 1.0), (300, 4.0)])
+
+        assert curve.gain(50) == pytest.approx(1.5)
+        assert curve.gain(200) == pytest.approx(3.0)
+
+    def test_table_curve_clamps_to_ends(self):
+        curve = TableCurve([(10, 1.0), (100, 4.0)])
+
+        assert curve.gain(0) == 1.0
+        assert curve.gain(1000) == 4.0
+
+    def test_builtin_profiles_are_monotonic(self):
+        for name in POINTER_ACCELERATION_PROFILES:
+            curve = create_curve(name)
+            gains = [curve.gain(speed) for speed in range(0, 5000, 50)]
+            assert gains == sorted(gains), name
+
+
+class TestCreateCurve:
+    """测试曲线配置解析"""
+
+    def test_default_profile(self):
+        curve = create_curve()
+
+        assert curve.gain(1000) == create_curve(
+            TOUCHPAD_CONFIG["ACCELERATION_PROFILE"]
+        ).gain(1000)
+
+    def test_linear_profile_matches_sensitivity(self):
+        curve = create_curve("linear")
+
+        assert curve.gain(1000) == TOUCHPAD_CONFIG["CURSOR_SENSITIVITY"]
+
+    def test_dict_profile(self):
+        curve = create_curve({"type": "table", "points": [(0, 1), (10, 2)]})
+
+        assert isinstance(curve, TableCurve)
+
+    def test_unknown_profile(self):
+        with pytest.raises(ValueError):
+            create_curve("missing")
+
+    def test_unknown_type(self):
+        with pytest.raises(ValueError):
+            create_curve({"type": "cubic"})
+
+    def test_invalid_params(self):
+        with pytest.raises(ValueError):
+            create_curve({"type": "flat", "factor": 2})
+
+
+class TestPointerAccelerator:
+    """测试速度估计和位移换算"""
+
+    def setup_method(self):
+        self.curve = TableCurve([(0, 1.0), (1000, 3.0)])
+
+    def test_first_move_uses_base_gain(self):
+        accelerator = PointerAccelerator(self.curve)
+
+        assert accelerator.apply(10, 0, 1.0) == (10.0, 0.0)
+
+    def test_speed_from_timestamps(self):
+        accelerator = PointerAccelerator(self.curve, smoothing=1.0)
+        accelerator.reset(0.0)
+
+        dx, dy = accelerator.apply(6, 8, 0.01)
+
+        assert accelerator.speed == pytest.approx(1000)
+        assert (dx, dy) == (pytest.approx(18), pytest.approx(24))
+
+    def test_speed_is_smoothed(self):
+        accelerator = PointerAccelerator(self.curve, smoothing=0.5)
+        accelerator.reset(0.0)
+
+        accelerator.apply(10, 0, 0.01)
+
+        assert accelerator.speed == pytest.approx(500)
+
+    def test_same_timestamp_keeps_speed(self):
+        accelerator = PointerAccelerator(self.curve, smoothing=1.0)
+        accelerator.reset(0.0)
+        accelerator.apply(5, 0, 0.01)
+
+        accelerator.apply(5, 0, 0.01)
+
+        assert accelerator.speed == pytest.approx(500)
+
+    def test_pause_resets_speed(self):
+        accelerator = PointerAccelerator(self.curve, smoothing=1.0, max_interval=0.1)
+        accelerator.reset(0.0)
+        accelerator.apply(10, 0, 0.01)
+
+        assert accelerator.apply(10, 0, 1.0) == (10.0, 0.0)
+        assert accelerator.speed == 0.0
+
+    def test_falls_back_to_clock(self):
+        times = iter([0.0, 0.01])
+        accelerator = PointerAccelerator(
+            self.curve, smoothing=1.0, clock=lambda: next(times)
+        )
+
+        accelerator.apply(0, 0)
+        accelerator.apply(10, 0)
+
+        assert accelerator.speed == pytest.approx(1000)
+
+    def test_fast_motion_covers_more_distance(self):
+        """同样的手指总位移，快速滑动产生更大的光标位移"""
+        curve = create_curve("adaptive")
+
+        def travel(interval):
+            accelerator = PointerAccelerator(curve)
+            accelerator.reset(0.0)
+            return sum(
+                accelerator.apply(10, 0, (i + 1) * interval)[0] for i in range(20)
+            )
+
+        assert travel(0.004) > travel(0.05) * 2
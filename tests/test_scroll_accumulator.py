@@ -0,0 +1,98 @@
+"""
+滚动累加模块测试
+"""
+
+import math
+import os
+import sys
+from unittest.mock import Mock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.scroll_accumulator import (
+    WHEEL_DELTA,
+    ScrollAccumulator,
+    detect_scroll_resolution,
+)
+
+
+class TestScrollAccumulator:
+    """测试滚动累加器"""
+
+    def test_fractions_are_carried(self):
+        accumulator = ScrollAccumulator()
+
+        results = [accumulator.add(0, 0.25) for _ in range(8)]
+
+        assert [dy for _, dy in results] == [0, 0, 0, 1, 0, 0, 0, 1]
+        assert all(isinstance(dy, int) for _, dy in results)
+        stats = accumulator.get_stats()
+        assert stats["emitted"] == 2
+        assert stats["deferred"] == 6
+
+    def test_negative_fractions_are_carried(self):
+        accumulator = ScrollAccumulator()
+
+        assert accumulator.add(-0.6, 0) == (0, 0)
+        assert accumulator.add(-0.6, 0) == (-1, 0)
+
+    def test_large_delta_keeps_remainder(self):
+        accumulator = ScrollAccumulator()
+
+        assert accumulator.add(0, 2.5) == (0, 2)
+        assert accumulator.add(0, 0.5) == (0, 1)
+
+    def test_direction_change_drops_remainder(self):
+        accumulator = ScrollAccumulator()
+        accumulator.add(0, 0.9)
+
+        assert accumulator.add(0, -0.5) == (0, 0)
+        assert accumulator.add(0, -0.5) == (0, -1)
+        assert accumulator.get_stats()["remainders_dropped"] == 1
+
+    def test_reset_drops_remainder(self):
+        accumulator = ScrollAccumulator()
+        accumulator.add(0.5, 0)
+
+        accumulator.reset()
+
+        assert accumulator.add(0.5, 0) == (0, 0)
+        assert accumulator.get_stats()["remainders_dropped"] == 1
+
+    def test_high_resolution_survives_backend_truncation(self):
+        accumulator = ScrollAccumulator(WHEEL_DELTA)
+
+        # 模拟 Windows 后端：int(dy * WHEEL_DELTA)
+        sent = []
+        for _ in range(200):
+            _, dy = accumulator.add(0, -0.0583)
+            if dy:
+                sent.append(int(dy * WHEEL_DELTA))
+
+        assert sum(sent) == int(-0.0583 * 200 * WHEEL_DELTA)
+        assert all(value == -7 or value == -6 for value in sent)
+
+    def test_high_resolution_exact_steps(self):
+        for steps in range(-2000, 2000):
+            accumulator = ScrollAccumulator(WHEEL_DELTA)
+            # 输入落在单位中间，截断结果不受浮点误差影响
+            _, dy = accumulator.add(0, (steps + math.copysign(0.5, steps)) / WHEEL_DELTA)
+            assert int(dy * WHEEL_DELTA) == steps
+
+
+class TestDetectScrollResolution:
+    """测试后端分辨率检测"""
+
+    def test_default_is_whole_notches(self):
+        assert detect_scroll_resolution(Mock()) == 1
+
+    def test_windows_backend(self):
+        controller_class = type("Controller", (), {"__module__": "pynput.mouse._win32"})
+
+        assert detect_scroll_resolution(controller_class()) == WHEEL_DELTA
+
+    def test_configured_resolution(self):
+        with patch.dict(
+            "utils.scroll_accumulator.TOUCHPAD_CONFIG", {"SCROLL_RESOLUTION": 8}
+        ):
+            assert detect_scroll_resolution(Mock()) == 8
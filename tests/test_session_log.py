@@ -0,0 +1,256 @@
+"""
+输入会话录制模块测试
+"""
+
+import sys
+import os
+import threading
+import time
+from unittest.mock import Mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pytest
+
+from utils.session_log import (
+    SessionLogError,
+    SessionReader,
+    SessionRecorder,
+    decode_event,
+    encode_event,
+    record_events,
+    replay_session,
+)
+import utils.session_log as session_log
+
+
+class TestEventCodec:
+    """测试事件负载编解码"""
+
+    def test_touch_event_roundtrip(self):
+        event = {
+            "action": "touch_move",
+            "touch_id": "touch_1700000000000",
+            "touch_count": 2,
+            "touches": [{"id": 0, "x": 10.5, "y": 20.0}, {"id": 1, "x": 30, "y": 40}],
+            "timestamp": 1700000000123,
+        }
+
+        payload = encode_event(event)
+
+        assert payload[0] != 0xFF
+        assert decode_event(payload) == {
+            "action": "touch_move",
+            "touch_id": "touch_1700000000000",
+            "touch_count": 2,
+            "touches": [{"id": 0, "x": 10.5, "y": 20.0}, {"id": 1, "x": 30.0, "y": 40.0}],
+            "timestamp": 1700000000123,
+        }
+
+    def test_scroll_roundtrip_without_timestamp(self):
+        decoded = decode_event(encode_event({"action": "scroll", "dx": 1.5, "dy": -2}))
+
+        assert decoded == {"action": "scroll", "dx": 1.5, "dy": -2.0}
+
+    def test_fields_outside_fixed_record_roundtrip(self):
+        frames = [
+            [{"id": 0, "x": 10, "y": 10}, {"id": 1, "x": 40, "y": 10}],
+            [{"id": 0, "x": 8, "y": 10}, {"id": 1, "x": 42, "y": 10}],
+        ]
+        events = [
+            {
+                "channel": "touchpad",
+                "action": "touch_move",
+                "touch_id": "touch_1",
+                "touch_count": 2,
+                "touches": [{"id": 0, "x": 6, "y": 10}, {"id": 1, "x": 44, "y": 10}],
+                "frames": frames,
+                "client_id": client_id,
+                "timestamp": 1000,
+            }
+            for client_id in ("phone", "tablet")
+        ]
+        events.append(
+            {
+                "action": "touch_start",
+                "client_id": "phone",
+                "touch_id": "touch_2",
+                "touches": [{"id": 7, "x": 1, "y": 2}],
+                "acceleration": {"curve": "linear", "gain": 2},
+            }
+        )
+
+        for event in events:
+            payload = encode_event(event)
+
+            assert payload[0] != 0xFF
+            assert decode_event(payload) == {"touch_count": 1, **event}
+
+    def test_event_without_touch_id_keeps_default(self):
+        decoded = decode_event(
+            encode_event({"action": "touch_end", "touch_count": 1})
+        )
+
+        assert "touch_id" not in decoded
+
+    def test_keyboard_event_uses_json(self):
+        event = {"action": "hotkey", "keys": ["ctrl", "c"], "profile": "fast"}
+
+        payload = encode_event(event)
+
+        assert payload[0] == 0xFF
+        assert decode_event(payload) == event
+
+    def test_invalid_payload(self):
+        with pytest.raises(SessionLogError):
+            decode_event(b"\x09")
+
+
+class TestSessionLog:
+    """测试会话录制和读取"""
+
+    def write_session(self, path, events):
+        recorder = SessionRecorder(str(path))
+        for channel, event in events:
+            recorder.record(channel, event)
+        recorder.close()
+
+    def test_record_and_read(self, tmp_path):
+        path = tmp_path / "session.rcs"
+        events = [
+            ("touchpad", {"action": "touch_start", "touch_id": "t", "touches": [{"x": 1, "y": 2}]}),
+            ("keyboard", {"action": "press", "key": "a"}),
+        ]
+        self.write_session(path, events)
+
+        with SessionReader(str(path)) as reader:
+            records = list(reader)
+
+        assert [channel for _, channel, _ in records] == ["touchpad", "keyboard"]
+        assert records[0][2]["touches"][0]["x"] == 1.0
+        assert records[1][2] == {"action": "press", "key": "a"}
+        assert records[0][0] <= records[1][0]
+
+    def test_truncated_tail_ignored(self, tmp_path):
+        path = tmp_path / "session.rcs"
+        self.write_session(
+            path,
+            [("keyboard", {"action": "press", "key": "a"})] * 3,
+        )
+        with open(path, "r+b") as f:
+            f.truncate(os.path.getsize(path) - 2)
+
+        with SessionReader(str(path)) as reader:
+            assert len(list(reader)) == 2
+
+    def test_concurrent_records_are_in_time_order(self, tmp_path, monkeypatch):
+        monotonic = time.monotonic
+
+        def clock():
+            # 取得时间后让出线程，放大取时间与写入之间的竞争窗口
+            now = monotonic()
+            time.sleep(0.0001)
+            return now
+
+        monkeypatch.setattr(
+            session_log, "time", Mock(monotonic=clock, time=time.time)
+        )
+        path = tmp_path / "session.rcs"
+        recorder = SessionRecorder(str(path))
+        event = {"action": "press", "key": "a"}
+
+        def write():
+            for _ in range(200):
+                recorder.record("keyboard", event)
+
+        threads = [threading.Thread(target=write) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        recorder.close()
+
+        with SessionReader(str(path)) as reader:
+            times = [t for t, _, _ in reader]
+        assert len(times) == 800
+        assert times == sorted(times)
+
+    def test_existing_file_rejected(self, tmp_path):
+        path = tmp_path / "session.rcs"
+        self.write_session(path, [])
+
+        with pytest.raises(SessionLogError):
+            SessionRecorder(str(path))
+
+    def test_reads_version_1_file(self, tmp_path):
+        path = tmp_path / "session.rcs"
+        payload = encode_event({"action": "scroll", "dx": 1, "dy": 2})
+        path.write_bytes(
+            session_log.FILE_HEADER.pack(b"RCSL", 1, 0, 0.0)
+            + session_log.RECORD_HEADER.pack(0, 1, len(payload))
+            + payload
+        )
+
+        with SessionReader(str(path)) as reader:
+            assert [event for _, _, event in reader] == [
+                {"action": "scroll", "dx": 1.0, "dy": 2.0}
+            ]
+
+    def test_invalid_file(self, tmp_path):
+        path = tmp_path / "session.rcs"
+        path.write_bytes(b"not a session log")
+
+        with pytest.raises(SessionLogError):
+            SessionReader(str(path))
+
+
+class TestReplaySession:
+    """测试会话回放"""
+
+    def test_replay_as_fast_as_possible(self):
+        touchpad = Mock(return_value=({"status": "success"}, 200))
+        keyboard = Mock(return_value=({"status": "error"}, 400))
+        sleep = Mock()
+        records = [
+            (0.0, "touchpad", {"action": "touch_start"}),
+            (0.5, "keyboard", {"action": "press", "key": "a"}),
+        ]
+
+        result = replay_session(
+            records, {"touchpad": touchpad, "keyboard": keyboard}, speed=0, sleep=sleep
+        )
+
+        assert result["events"] == 2
+        assert result["failed"] == 1
+        sleep.assert_not_called()
+
+    def test_replay_accelerated(self):
+        now = [100.0]
+        sleep = Mock(side_effect=lambda seconds: now.__setitem__(0, now[0] + seconds))
+        dispatch = Mock(return_value=({"status": "success"}, 200))
+        records = [(0.0, "touchpad", {}), (1.0, "touchpad", {}), (3.0, "touchpad", {})]
+
+        replay_session(
+            records, {"touchpad": dispatch}, speed=2, sleep=sleep, clock=lambda: now[0]
+        )
+
+        assert [c.args[0] for c in sleep.call_args_list] == [0.5, 1.0]
+
+
+class TestRecordEvents:
+    """测试分发函数录制装饰器"""
+
+    def test_records_only_when_recording(self, tmp_path):
+        dispatch = record_events("touchpad")(Mock(return_value=({}, 200)))
+        dispatch({"action": "touch_move"})
+
+        recorder = SessionRecorder(str(tmp_path / "session.rcs"))
+        session_log._session_recorder = recorder
+        try:
+            dispatch({"action": "touch_move", "touches": []})
+            dispatch({"action": "status"})
+        finally:
+            session_log._session_recorder = None
+            recorder.close()
+
+        assert recorder.records == 1
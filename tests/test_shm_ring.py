@@ -0,0 +1,101 @@
+"""
+共享内存环形缓冲区模块测试
+"""
+
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.shm_ring import ShmRingBuffer
+
+
+@pytest.fixture
+def ring():
+    ring = ShmRingBuffer.create(256)
+    yield ring
+    ring.close()
+
+
+class TestShmRingBuffer:
+    """测试共享内存环形缓冲区"""
+
+    def test_capacity_rounded_to_power_of_two(self):
+        ring = ShmRingBuffer.create(1000)
+        try:
+            assert ring.capacity == 1024
+        finally:
+            ring.close()
+
+    def test_records_are_fifo(self, ring):
+        assert ring.get() is None
+
+        assert ring.put(b"first")
+        assert ring.put(b"")
+        assert ring.put(b"third")
+
+        assert ring.get() == b"first"
+        assert ring.get() == b""
+        assert ring.get() == b"third"
+        assert ring.get() is None
+        assert ring.empty()
+
+    def test_wraps_around(self, ring):
+        # 每条记录占 48 字节，256 字节的缓冲区需要多次回绕
+        payloads = [bytes([i]) * 40 for i in range(50)]
+
+        received = []
+        for payload in payloads:
+            assert ring.put(payload)
+            received.append(ring.get())
+
+        assert received == payloads
+        assert ring.get_stats()["used"] == 0
+
+    def test_put_fails_when_full(self, ring):
+        count = 0
+        while ring.put(b"x" * 40):
+            count += 1
+
+        assert count == ring.capacity // 48
+        assert ring.get_stats()["full"] == 1
+
+        ring.get()
+        assert ring.put(b"x" * 40)
+
+    def test_oversized_record_rejected(self, ring):
+        with pytest.raises(ValueError):
+            ring.put(b"x" * ring.capacity)
+
+    def test_attach_by_name_shares_memory(self, ring):
+        # 子进程按 __getstate__ 传递的名称重新映射共享内存
+        consumer = ShmRingBuffer.__new__(ShmRingBuffer)
+        consumer.__setstate__(ring.__getstate__())
+        try:
+            ring.put(b"shared")
+
+            assert consumer.name == ring.name
+            assert consumer.get() == b"shared"
+            assert ring.empty()
+        finally:
+            consumer.close()
+
+    def test_wait_wakes_on_put(self, ring):
+        result = []
+        waiter = threading.Thread(target=lambda: result.append(ring.wait(5.0)))
+        waiter.start()
+
+        # 等消费者置上等待标志后再写入
+        while not ring.get_stats()["used"] and not ring._buf[128]:
+            pass
+        ring.put(b"wake")
+        waiter.join(5.0)
+
+        assert result == [True]
+        assert ring.get_stats()["wakeups"] == 1
+
+    def test_wait_times_out(self, ring):
+        assert ring.wait(0.01) is False
@@ -0,0 +1,144 @@
+"""
+输入流处理器模块测试
+"""
+
+import sys
+import os
+import json
+from unittest.mock import Mock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from handlers.stream import STREAM_DISPATCHERS, process_stream_message, resolve_client_id
+from utils.wire_format import FLAG_ACK, encode_packet
+
+
+class TestProcessStreamMessage:
+    """测试输入流消息处理"""
+
+    def test_invalid_json(self):
+        response = process_stream_message("not json")
+
+        assert response["status"] == "error"
+
+    def test_event_without_seq_has_no_response(self):
+        dispatcher = Mock(return_value=({"status": "success"}, 200))
+
+        with patch.dict(STREAM_DISPATCHERS, {"touchpad": dispatcher}):
+            response = process_stream_message(
+                json.dumps({"action": "touch_move", "touch_id": "t"})
+            )
+
+        assert response is None
+        dispatcher.assert_called_once()
+
+    def test_event_with_seq_has_response(self):
+        dispatcher = Mock(return_value=({"status": "success", "mode": "single"}, 200))
+
+        with patch.dict(STREAM_DISPATCHERS, {"touchpad": dispatcher}):
+            response = process_stream_message(
+                json.dumps({"action": "touch_end", "touch_id": "t", "seq": 7})
+            )
+
+        assert response["status"] == "success"
+        assert response["results"] == [{"seq": 7, "status": "success", "mode": "single"}]
+
+    def test_batch_is_dispatched_in_order(self):
+        calls = []
+        touchpad = Mock(side_effect=lambda e: (calls.append(e["action"]) or ({"status": "success"}, 200)))
+        keyboard = Mock(side_effect=lambda e: (calls.append(e["action"]) or ({"status": "success"}, 200)))
+
+        with patch.dict(STREAM_DISPATCHERS, {"touchpad": touchpad, "keyboard": keyboard}):
+            response = process_stream_message(
+                json.dumps(
+                    [
+                        {"action": "touch_start"},
+                        {"channel": "keyboard", "action": "press", "seq": 1},
+                        {"action": "touch_end", "seq": 2},
+                    ]
+                )
+            )
+
+        assert calls == ["touch_start", "press", "touch_end"]
+        assert [r["seq"] for r in response["results"]] == [1, 2]
+
+    def test_unknown_channel(self):
+        response = process_stream_message(json.dumps({"channel": "mouse", "seq": 1}))
+
+        assert response["results"][0]["status"] == "error"
+
+    def test_dispatcher_exception_is_reported(self):
+        dispatcher = Mock(side_effect=RuntimeError("boom"))
+
+        with patch.dict(STREAM_DISPATCHERS, {"touchpad": dispatcher}):
+            response = process_stream_message(json.dumps({"action": "touch_move", "seq": 3}))
+
+        assert response["results"][0]["status"] == "error"
+        assert "boom" in response["results"][0]["message"]
+
+    def test_binary_packet_without_ack(self):
+        dispatcher = Mock(return_value=({"status": "success"}, 200))
+        packet = encode_packet([{"action": "scroll", "dx": 1, "dy": 2, "timestamp": 0}])
+
+        with patch.dict(STREAM_DISPATCHERS, {"touchpad": dispatcher}):
+            response = process_stream_message(packet)
+
+        assert response is None
+        assert dispatcher.call_args[0][0]["action"] == "scroll"
+
+    def test_binary_packet_with_ack(self):
+        dispatcher = Mock(return_value=({"status": "success"}, 200))
+        packet = encode_packet(
+            [{"action": "scroll", "dx": 1, "dy": 2, "timestamp": 0}], seq=4, flags=FLAG_ACK
+        )
+
+        with patch.dict(STREAM_DISPATCHERS, {"touchpad": dispatcher}):
+            response = process_stream_message(packet)
+
+        assert response["seq"] == 4
+        assert response["results"] == [{"status": "success"}]
+
+    def test_invalid_binary_packet(self):
+        response = process_stream_message(b"\x00")
+
+        assert response["status"] == "error"
+
+
+class TestClientId:
+    """测试连接的客户端标识"""
+
+    def test_connection_client_id_is_applied(self):
+        dispatcher = Mock(return_value=({"status": "success"}, 200))
+
+        with patch.dict(STREAM_DISPATCHERS, {"touchpad": dispatcher}):
+            process_stream_message(json.dumps({"action": "touch_move"}), "phone")
+            process_stream_message(
+                json.dumps({"action": "touch_move", "client_id": "tablet"}), "phone"
+            )
+
+        assert dispatcher.call_args_list[0].args[0]["client_id"] == "phone"
+        assert dispatcher.call_args_list[1].args[0]["client_id"] == "tablet"
+
+    def test_binary_packet_with_invalid_utf8_is_rejected(self):
+        packet = encode_packet(
+            [{"channel": "keyboard", "action": "type", "text": "ab", "timestamp": 0}]
+        )
+        packet = packet[:-2] + b"\xff\xfe"
+
+        response = process_stream_message(packet)
+
+        assert response["status"] == "error"
+
+    def test_binary_events_get_connection_client_id(self):
+        dispatcher = Mock(return_value=({"status": "success"}, 200))
+        packet = encode_packet([{"action": "scroll", "dx": 0, "dy": 3}])
+
+        with patch.dict(STREAM_DISPATCHERS, {"touchpad": dispatcher}):
+            process_stream_message(packet, "phone")
+
+        assert dispatcher.call_args.args[0]["client_id"] == "phone"
+
+    def test_resolve_client_id(self):
+        assert resolve_client_id("phone") == "phone"
+        assert resolve_client_id(None).startswith("ws-")
+        assert resolve_client_id("x" * 100) != "x" * 100
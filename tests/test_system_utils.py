@@ -5,10 +5,16 @@
 import sys
 import os
 import socket
+from unittest.mock import Mock
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from utils.system_utils import get_local_ip, get_system_info, get_screen_size
+from utils.system_utils import (
+    ScreenGeometry,
+    get_local_ip,
+    get_screen_size,
+    get_system_info,
+)
 
 
 class TestGetLocalIP:
@@ -58,3 +64,42 @@ class TestGetScreenSize:
         size = get_screen_size()
         assert size["width"] > 0
         assert size["height"] > 0
+
+
+class TestScreenGeometry:
+    """测试屏幕尺寸缓存"""
+
+    def test_detects_once_within_ttl(self):
+        detector = Mock(return_value={"width": 2560, "height": 1440})
+        geometry = ScreenGeometry(ttl=60, detector=detector)
+
+        assert geometry.get() == {"width": 2560, "height": 1440}
+        assert geometry.get() == {"width": 2560, "height": 1440}
+        detector.assert_called_once()
+
+    def test_refreshes_after_ttl(self):
+        detector = Mock(return_value={"width": 2560, "height": 1440})
+        geometry = ScreenGeometry(ttl=0, detector=detector)
+
+        geometry.get()
+        geometry.get()
+
+        assert detector.call_count == 2
+
+    def test_invalidate(self):
+        detector = Mock(
+            side_effect=[{"width": 1920, "height": 1080}, {"width": 3840, "height": 2160}]
+        )
+        geometry = ScreenGeometry(ttl=60, detector=detector)
+
+        geometry.get()
+        geometry.invalidate()
+
+        assert geometry.get() == {"width": 3840, "height": 2160}
+
+    def test_returns_copy(self):
+        geometry = ScreenGeometry(ttl=60, detector=lambda: {"width": 1, "height": 1})
+
+        geometry.get()["width"] = 100
+
+        assert geometry.get()["width"] == 1
@@ -0,0 +1,86 @@
+"""
+点击识别模块测试
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from services.tap_recognizer import TAP_LEFT_CLICK, TAP_RIGHT_CLICK, TapRecognizer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def recognizer():
+    return TapRecognizer(
+        max_duration=0.3, move_threshold=5, drag_window=0.2, clock=FakeClock()
+    )
+
+
+def make_session():
+    return SimpleNamespace(last_tap_time=None)
+
+
+class TestTapRecognizer:
+    """测试点击识别"""
+
+    def test_classify_by_fingers(self, recognizer):
+        assert recognizer.classify(1, 0.1, 2) == TAP_LEFT_CLICK
+        assert recognizer.classify(2, 0.1, 2) == TAP_RIGHT_CLICK
+        assert recognizer.classify(3, 0.1, 2) is None
+
+    def test_moved_or_held_touch_is_not_a_tap(self, recognizer):
+        assert recognizer.classify(1, 0.1, 6) is None
+        assert recognizer.classify(1, 0.5, 0) is None
+        assert recognizer.get_stats()["too_long"] == 1
+
+    def test_drag_window_after_left_click(self, recognizer):
+        session = make_session()
+        recognizer.commit(session, TAP_LEFT_CLICK)
+
+        recognizer.clock.now = 0.15
+        assert recognizer.arm_drag(session) is True
+        # 窗口只能使用一次
+        assert recognizer.arm_drag(session) is False
+
+    def test_drag_window_expires(self, recognizer):
+        session = make_session()
+        recognizer.commit(session, TAP_LEFT_CLICK)
+
+        recognizer.clock.now = 0.25
+        assert recognizer.arm_drag(session) is False
+
+    def test_right_click_does_not_open_drag_window(self, recognizer):
+        session = make_session()
+        recognizer.commit(session, TAP_RIGHT_CLICK)
+
+        assert recognizer.arm_drag(session) is False
+
+    def test_drag_window_disabled(self):
+        recognizer = TapRecognizer(drag_window=0, clock=FakeClock())
+        session = make_session()
+        recognizer.commit(session, TAP_LEFT_CLICK)
+        recognizer.clock.now = 0.01
+
+        assert recognizer.arm_drag(session) is False
+
+    def test_latency_distribution(self, recognizer):
+        for ms in (1, 2, 3, 40):
+            recognizer.record_latency(TAP_LEFT_CLICK, ms / 1000)
+
+        latency = recognizer.get_stats()["latency_ms"]
+        assert latency["count"] == 4
+        assert latency["p50"] == pytest.approx(2, rel=0.1)
+        assert latency["max"] == pytest.approx(40)
+        assert latency["avg"] == pytest.approx(11.5)
@@ -0,0 +1,81 @@
+"""
+定时器调度模块测试
+"""
+
+import sys
+import os
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.timer_scheduler import TimerScheduler, get_timer_scheduler
+
+
+def wait_for(condition, timeout=1.0):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.002)
+    return condition()
+
+
+class TestTimerScheduler:
+    """测试定时器调度器"""
+
+    def setup_method(self):
+        self.scheduler = TimerScheduler()
+
+    def teardown_method(self):
+        self.scheduler.stop()
+
+    def test_timers_fire_in_order(self):
+        fired = []
+        self.scheduler.call_later(0.03, fired.append, "b")
+        self.scheduler.call_later(0.01, fired.append, "a")
+
+        assert wait_for(lambda: len(fired) == 2)
+        assert fired == ["a", "b"]
+        assert self.scheduler.get_stats()["fired"] == 2
+
+    def test_cancelled_timer_does_not_fire(self):
+        fired = []
+        handle = self.scheduler.call_later(0.02, fired.append, "x")
+        handle.cancel()
+        handle.cancel()
+
+        time.sleep(0.05)
+        stats = self.scheduler.get_stats()
+        assert fired == []
+        assert stats["cancelled"] == 1
+        assert stats["pending"] == 0
+
+    def test_single_thread_for_many_timers(self):
+        threads_before = threading.active_count()
+        handles = [self.scheduler.call_later(10, lambda: None) for _ in range(200)]
+        for handle in handles:
+            handle.cancel()
+
+        assert threading.active_count() <= threads_before + 1
+        stats = self.scheduler.get_stats()
+        assert stats["scheduled"] == 200
+        assert stats["cancelled"] == 200
+        assert stats["pending"] == 0
+
+    def test_cancel_after_fire_is_ignored(self):
+        fired = []
+        handle = self.scheduler.call_later(0, fired.append, 1)
+
+        assert wait_for(lambda: fired == [1])
+        handle.cancel()
+        assert self.scheduler.get_stats()["cancelled"] == 0
+
+    def test_callback_error_is_counted(self):
+        def fail():
+            raise RuntimeError("boom")
+
+        self.scheduler.call_later(0, fail)
+
+        assert wait_for(lambda: self.scheduler.get_stats()["errors"] == 1)
+
+    def test_global_scheduler_is_shared(self):
+        assert get_timer_scheduler() is get_timer_scheduler()
@@ -0,0 +1,156 @@
+"""
+触摸会话模块测试
+"""
+
+import os
+import sys
+from unittest.mock import Mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from services.touch_session import (
+    DEFAULT_CLIENT_ID,
+    ButtonArbiter,
+    TouchSession,
+    TouchSessionRegistry,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_registry(**kwargs):
+    clock = FakeClock()
+    evicted = []
+    registry = TouchSessionRegistry(
+        TouchSession, on_evict=evicted.append, clock=clock, **kwargs
+    )
+    return registry, evicted, clock
+
+
+class TestTouchSessionRegistry:
+    """测试会话表"""
+
+    def test_sessions_are_isolated(self):
+        registry, _, _ = make_registry()
+
+        phone = registry.get("phone")
+        tablet = registry.get("tablet")
+        phone.active_touches["t"] = object()
+
+        assert registry.get("phone") is phone
+        assert tablet.active_touches == {}
+        assert registry.get_stats()["active"] == 2
+
+    def test_default_session(self):
+        registry, _, _ = make_registry()
+
+        assert registry.get() is registry.get(DEFAULT_CLIENT_ID)
+
+    def test_session_is_slotted(self):
+        session = TouchSession("phone")
+
+        assert not hasattr(session, "__dict__")
+
+    def test_idle_sessions_are_evicted(self):
+        registry, evicted, clock = make_registry(idle_timeout=10)
+        old = registry.get("old")
+        clock.now += 5
+        recent = registry.get("recent")
+
+        clock.now += 6
+        registry.get("recent")
+
+        assert evicted == [old]
+        assert registry.sessions() == [recent]
+        assert registry.get_stats()["evicted"] == 1
+
+    def test_least_recently_used_is_evicted_over_limit(self):
+        registry, evicted, _ = make_registry(max_sessions=2)
+        first = registry.get("first")
+        registry.get("second")
+        registry.get("first")
+
+        registry.get("third")
+
+        assert [s.client_id for s in evicted] == ["second"]
+        assert first in registry.sessions()
+
+    def test_evict_idle_now(self):
+        registry, evicted, clock = make_registry(idle_timeout=10)
+        registry.get("a")
+        clock.now += 20
+
+        assert registry.evict_idle() == 1
+        assert len(registry) == 0
+
+    def test_clear_evicts_all(self):
+        registry, evicted, _ = make_registry()
+        registry.get("a")
+        registry.get("b")
+
+        registry.clear()
+
+        assert len(evicted) == 2
+        assert len(registry) == 0
+
+
+class TestButtonArbiter:
+    """测试按键仲裁"""
+
+    def setup_method(self):
+        self.mouse = Mock()
+        self.keyboard = Mock()
+        self.input_scheduler = Mock()
+        self.arbiter = ButtonArbiter(self.mouse, self.input_scheduler, self.keyboard)
+
+    def submitted(self):
+        # 按下和释放都与尚未注入的移动一起提交
+        calls = self.input_scheduler.submit_after_flush.call_args_list
+        return [call.args for call in calls]
+
+    def test_first_press_and_last_release_are_injected(self):
+        self.arbiter.press("a", "left")
+        self.arbiter.press("b", "left")
+        self.arbiter.release("a", "left")
+
+        assert self.submitted() == [(self.mouse.press, "left")]
+        assert self.arbiter.holders("left") == 1
+
+        self.arbiter.release("b", "left")
+
+        assert self.submitted()[-1] == (self.mouse.release, "left")
+        assert self.arbiter.holders("left") == 0
+
+    def test_release_by_non_owner_is_ignored(self):
+        self.arbiter.press("a", "left")
+
+        self.arbiter.release("b", "left")
+
+        assert self.submitted() == [(self.mouse.press, "left")]
+
+    def test_release_all(self):
+        self.arbiter.press("a", "left")
+        self.arbiter.press("a", "right")
+
+        self.arbiter.release_all("a")
+
+        assert (self.mouse.release, "left") in self.submitted()
+        assert (self.mouse.release, "right") in self.submitted()
+
+    def test_keys_are_reference_counted(self):
+        self.arbiter.press_key("a", "ctrl")
+        self.arbiter.press_key("b", "ctrl")
+        self.arbiter.release("a", "ctrl")
+
+        assert self.submitted() == [(self.keyboard.press, "ctrl")]
+        assert self.arbiter.holders("ctrl") == 1
+
+        self.arbiter.release_all("b")
+
+        assert self.submitted()[-1] == (self.keyboard.release, "ctrl")
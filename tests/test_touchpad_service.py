@@ -2,14 +2,39 @@
 触摸板服务模块测试
 """
 
+import math
 import sys
 import os
+import time
 from unittest.mock import Mock, patch, MagicMock
 
+import pytest
+
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
+from services.touch_session import (
+    PHASE_DRAGGING,
+    PHASE_MOVING,
+    PHASE_PENDING_TAP,
+    PHASE_PINCHING,
+    PHASE_SCROLLING,
+    PHASE_SWIPING,
+    InvalidTransition,
+    TouchState,
+)
 from services.touchpad_service import TouchpadService
+from core.app import create_app
 from core.config import TOUCHPAD_CONFIG
+from utils.null_controller import NullMouseController
+from pynput import mouse
+from pynput.keyboard import Key
+
+
+# 三指轻扫为可选功能，测试使用固定的快捷键绑定
+SWIPE_CONFIG = {
+    "THREE_FINGER_GESTURE": "swipe",
+    "SWIPE_HOTKEYS": {"left": ["ctrl", "alt", "right"], "down": ["win", "d"]},
+}
 
 
 class TestTouchpadService:
@@ -26,8 +51,8 @@ class TestTouchpadService:
         assert service.mouse_controller == mock_mouse
         assert service.keyboard_controller == mock_keyboard
         assert service.config == TOUCHPAD_CONFIG
-        assert service.touchpad_state["active_touches"] == {}
-        assert service.touchpad_state["is_dragging"] is False
+        assert service.get_session().active_touches == {}
+        assert service.get_session().is_dragging is False
 
     @patch("services.touchpad_service.get_controllers")
     def test_detect_touch_mode_single(self, mock_get_controllers):
@@ -62,6 +87,16 @@ class TestTouchpadService:
 
         assert result == "dragging"
 
+    @patch.dict(TOUCHPAD_CONFIG, SWIPE_CONFIG)
+    @patch("services.touchpad_service.get_controllers")
+    def test_detect_touch_mode_swipe(self, mock_get_controllers):
+        mock_get_controllers.return_value = (Mock(), Mock())
+
+        service = TouchpadService()
+        result = service.detect_touch_mode({"touch_count": 3})
+
+        assert result == "swipe"
+
     @patch("services.touchpad_service.get_controllers")
     def test_handle_touch_start_invalid_data(self, mock_get_controllers):
         mock_mouse = Mock()
@@ -86,7 +121,7 @@ class TestTouchpadService:
         })
 
         assert result["status"] == "success"
-        assert "test" in service.touchpad_state["active_touches"]
+        assert "test" in service.get_session().active_touches
 
     @patch("services.touchpad_service.get_controllers")
     def test_handle_touch_end(self, mock_get_controllers):
@@ -95,13 +130,7 @@ class TestTouchpadService:
         mock_get_controllers.return_value = (mock_mouse, mock_keyboard)
 
         service = TouchpadService()
-        service.touchpad_state["active_touches"]["test"] = {
-            "start_x": 100,
-            "start_y": 200,
-            "current_x": 100,
-            "current_y": 200,
-            "start_time": 0
-        }
+        service.get_session().active_touches["test"] = TouchState("test", 100, 200, 0)
 
         result = service.handle_touch_end({
             "touch_id": "test",
@@ -109,7 +138,7 @@ class TestTouchpadService:
         })
 
         assert result["status"] == "success"
-        assert "test" not in service.touchpad_state["active_touches"]
+        assert "test" not in service.get_session().active_touches
 
     @patch("services.touchpad_service.get_controllers")
     def test_get_touchpad_status(self, mock_get_controllers):
@@ -122,7 +151,7 @@ class TestTouchpadService:
 
         assert "active_touches_count" in status
         assert "is_dragging" in status
-        assert "has_pending_click" in status
+        assert "tap_stats" in status
 
     @patch("services.touchpad_service.get_controllers")
     def test_shutdown_cleans_resources(self, mock_get_controllers):
@@ -131,9 +160,523 @@ class TestTouchpadService:
         mock_get_controllers.return_value = (mock_mouse, mock_keyboard)
 
         service = TouchpadService()
-        service.touchpad_state["active_touches"]["test"] = {"x": 100, "y": 200}
+        service.get_session().active_touches["test"] = {"x": 100, "y": 200}
+
+        service.shutdown()
+
+        assert len(service.get_session().active_touches) == 0
+        assert service.get_session().is_dragging is False
+
+    @patch("services.touchpad_service.get_controllers")
+    def test_handle_scroll(self, mock_get_controllers):
+        mock_mouse = Mock()
+        mock_keyboard = Mock()
+        mock_get_controllers.return_value = (mock_mouse, mock_keyboard)
+
+        service = TouchpadService()
+        result = service.handle_scroll({"dx": 0, "dy": 100})
+        service.input_scheduler.flush()
+
+        assert result["status"] == "success"
+        mock_mouse.scroll.assert_called_once()
+        assert mock_mouse.scroll.call_args[0][1] < 0
 
+    @patch("services.touchpad_service.get_controllers")
+    def test_tap_clicks_on_release_without_delay(self, mock_get_controllers):
+        mock_mouse = Mock()
+        mock_keyboard = Mock()
+        mock_get_controllers.return_value = (mock_mouse, mock_keyboard)
+
+        service = TouchpadService()
+        service.timer_scheduler = Mock()
+        service.injector = Mock()
+        service.handle_touch_start({"touch_id": "t", "touches": [{"x": 1, "y": 1}]})
+        service.timer_scheduler.call_later.assert_not_called()
+
+        result = service.handle_touch_end({"touch_id": "t"})
+
+        assert result["action"] == "left_click"
+        service.timer_scheduler.call_later.assert_not_called()
+        inject, *args = service.injector.submit.call_args.args
+        inject(*args)
+        mock_mouse.click.assert_called_once_with(mouse.Button.left)
+        assert service.tap_recognizer.get_stats()["latency_ms"]["count"] == 1
+
+    @patch("services.touchpad_service.get_controllers")
+    def test_touch_move_applies_acceleration(self, mock_get_controllers):
+        mock_get_controllers.return_value = (Mock(), Mock())
+
+        service = TouchpadService()
+        service.input_scheduler = Mock()
+        profile = {"type": "table", "points": [(0, 1.0), (1000, 3.0)]}
+        service.handle_touch_start({
+            "touch_id": "test",
+            "touch_count": 1,
+            "touches": [{"x": 100, "y": 100}],
+            "timestamp": 0,
+            "acceleration": profile,
+        })
+
+        slow = service.handle_touch_move({
+            "touch_id": "test",
+            "touch_count": 1,
+            "touches": [{"x": 101, "y": 100}],
+            "timestamp": 90,
+        })
+        service.handle_touch_move({
+            "touch_id": "test",
+            "touch_count": 1,
+            "touches": [{"x": 111, "y": 100}],
+            "timestamp": 95,
+        })
+
+        assert slow["status"] == "success"
+        first, second = service.input_scheduler.add_move.call_args_list
+        assert first.args[0] < 1.1
+        assert second.args[0] > 10 * 1.5
+        service.shutdown()
+
+    @patch("services.touchpad_service.get_controllers")
+    def test_touch_start_rejects_unknown_acceleration(self, mock_get_controllers):
+        mock_get_controllers.return_value = (Mock(), Mock())
+
+        service = TouchpadService()
+        result = service.handle_touch_start({
+            "touch_id": "test",
+            "touches": [{"x": 100, "y": 200}],
+            "acceleration": "missing",
+        })
+
+        assert result["status"] == "error"
+        assert "test" not in service.get_session().active_touches
+        service.shutdown()
+
+    @patch("services.touchpad_service.get_controllers")
+    def test_non_numeric_coordinates_are_rejected(self, mock_get_controllers):
+        mock_get_controllers.return_value = (Mock(), Mock())
+
+        service = TouchpadService()
+        with pytest.raises(ValueError):
+            service.handle_touch_start(touch("touch_start", x="100"))
+        assert service.get_session().active_touches == {}
+
+        service.handle_touch_start(touch("touch_start"))
+        with pytest.raises(ValueError):
+            service.handle_touch_move(touch("touch_move", frames=[[{"x": None}]]))
+        with pytest.raises(ValueError):
+            service.handle_touch_move(touch("touch_move", y=True))
+        service.shutdown()
+
+    @patch("services.touchpad_service.get_controllers")
+    def test_invalid_touch_start_keeps_kinetic_scroll(self, mock_get_controllers):
+        mock_get_controllers.return_value = (Mock(), Mock())
+
+        service = TouchpadService()
+        session = service.get_session()
+        session.kinetic_scroller = Mock()
+        session.motion_upsampler = Mock()
+        result = service.handle_touch_start({
+            "touch_id": "test",
+            "touches": [{"x": 100, "y": 200}],
+            "acceleration": "missing",
+        })
+
+        assert result["status"] == "error"
+        session.kinetic_scroller.cancel.assert_not_called()
+        session.motion_upsampler.begin.assert_not_called()
         service.shutdown()
 
-        assert len(service.touchpad_state["active_touches"]) == 0
-        assert service.touchpad_state["is_dragging"] is False
+    @patch("services.touchpad_service.get_controllers")
+    def test_two_finger_fling_starts_kinetic_scroll(self, mock_get_controllers):
+        mock_get_controllers.return_value = (Mock(), Mock())
+
+        service = TouchpadService()
+        service.input_scheduler = Mock()
+        kinetic_scroller = service.get_session().kinetic_scroller = Mock()
+        kinetic_scroller.release.return_value = (0.0, 50.0)
+        service.handle_touch_start({
+            "touch_id": "test",
+            "touch_count": 2,
+            "touches": [{"x": 100, "y": 100}, {"x": 150, "y": 100}],
+            "timestamp": 0,
+        })
+        service.handle_touch_move({
+            "touch_id": "test",
+            "touch_count": 2,
+            "touches": [{"x": 100, "y": 80}, {"x": 150, "y": 80}],
+            "timestamp": 10,
+        })
+        service.handle_touch_end({
+            "touch_id": "test",
+            "touch_count": 2,
+            "timestamp": 400,
+        })
+
+        kinetic_scroller.cancel.assert_called_once()
+        kinetic_scroller.track.assert_called_once_with(
+            0.0, 20 * TOUCHPAD_CONFIG["SCROLL_SENSITIVITY"], 0.01
+        )
+        kinetic_scroller.release.assert_called_once_with(0.4)
+
+    @patch("services.touchpad_service.get_controllers")
+    def test_wheel_cancels_kinetic_scroll(self, mock_get_controllers):
+        mock_get_controllers.return_value = (Mock(), Mock())
+
+        service = TouchpadService()
+        kinetic_scroller = service.get_session().kinetic_scroller = Mock()
+        service.handle_scroll({"dx": 0, "dy": 100})
+
+        kinetic_scroller.cancel.assert_called_once()
+        service.shutdown()
+
+    @patch("services.touchpad_service.get_controllers")
+    def test_clients_do_not_share_touch_state(self, mock_get_controllers):
+        mock_get_controllers.return_value = (Mock(), Mock())
+
+        service = TouchpadService()
+        service.timer_scheduler = Mock()
+        service.handle_touch_start({
+            "client_id": "phone",
+            "touch_id": "t",
+            "touch_count": 1,
+            "touches": [{"x": 10, "y": 10}],
+        })
+        service.handle_touch_start({
+            "client_id": "tablet",
+            "touch_id": "t",
+            "touch_count": 2,
+            "touches": [{"x": 50, "y": 50}, {"x": 80, "y": 50}],
+        })
+
+        # 平板的双指触摸不会把手机的单指触摸变成滚动
+        assert service.get_session("phone").active_touches["t"].phase == (
+            PHASE_PENDING_TAP
+        )
+        assert service.get_session("tablet").active_touches["t"].phase == (
+            PHASE_SCROLLING
+        )
+
+        result = service.handle_touch_end({"client_id": "tablet", "touch_id": "t"})
+        assert result["status"] == "success"
+        assert "t" in service.get_session("phone").active_touches
+        service.shutdown()
+
+    @patch("services.touchpad_service.get_controllers")
+    def test_concurrent_drags_share_one_button_press(self, mock_get_controllers):
+        mock_mouse = Mock()
+        mock_get_controllers.return_value = (mock_mouse, Mock())
+
+        service = TouchpadService()
+        service.button_arbiter.input_scheduler = Mock()
+        for client_id in ("phone", "tablet"):
+            service.handle_touch_start({
+                "client_id": client_id,
+                "touch_id": "t",
+                "touch_count": 3,
+                "touches": [{"x": 1, "y": 1}] * 3,
+            })
+        service.handle_touch_end({"client_id": "phone", "touch_id": "t", "touch_count": 3})
+
+        submit = service.button_arbiter.input_scheduler.submit_after_flush
+        submitted = [call.args[0] for call in submit.call_args_list]
+        assert submitted == [mock_mouse.press]
+
+        # 会话关闭时释放仍被按住的按键
+        service.shutdown()
+        submitted = [call.args[0] for call in submit.call_args_list]
+        assert submitted.count(mock_mouse.release) == 1
+
+    @patch("services.touchpad_service.get_controllers")
+    def test_tap_drag_presses_before_moving(self, mock_get_controllers):
+        recorder = NullMouseController(record=True)
+        mock_get_controllers.return_value = (recorder, Mock())
+
+        service = TouchpadService()
+        handlers = {
+            "touch_start": service.handle_touch_start,
+            "touch_move": service.handle_touch_move,
+            "touch_end": service.handle_touch_end,
+        }
+        # 按真实客户端的节奏每 16ms 发送一个事件：点击，然后按下并拖动
+        for action, x in (
+            ("touch_start", 100),
+            ("touch_end", 100),
+            ("touch_start", 100),
+            ("touch_move", 150),
+            ("touch_end", 150),
+        ):
+            handlers[action](touch(action, x=x))
+            time.sleep(0.016)
+        assert service.injector.wait_idle()
+        service.shutdown()
+
+        # 拖拽的第一段位移必须在按下之后注入，否则选择从错误的位置开始
+        methods = [method for _, method, _ in recorder.events]
+        ordered = [m for i, m in enumerate(methods) if i == 0 or m != methods[i - 1]]
+        assert ordered == ["click", "press", "position", "release"]
+
+
+class TestTouchpadEndpoint:
+    """测试 /api/touchpad 接口"""
+
+    def test_invalid_coordinates_are_rejected(self):
+        client = create_app().test_client()
+
+        response = client.post("/api/touchpad", json=touch("touch_start", x="left"))
+
+        assert response.status_code == 400
+        assert "x='left'" in response.get_json()["message"]
+
+
+def touch(action, count=1, x=100, y=100, **extra):
+    data = {
+        "action": action,
+        "touch_id": "t",
+        "touch_count": count,
+        "touches": [{"x": x, "y": y}] * count,
+    }
+    data.update(extra)
+    return data
+
+
+def fingers(action, *points):
+    """带触摸点 id 的多指事件"""
+    return {
+        "action": action,
+        "touch_id": "t",
+        "touch_count": len(points),
+        "touches": [{"id": i, "x": x, "y": y} for i, (x, y) in enumerate(points)],
+    }
+
+
+class TestTouchPhases:
+    """测试触摸阶段转换"""
+
+    def setup_method(self):
+        self.patcher = patch("services.touchpad_service.get_controllers")
+        self.patcher.start().return_value = (Mock(), Mock())
+        self.service = TouchpadService()
+        self.service.timer_scheduler = Mock()
+        self.service.input_scheduler = Mock()
+        self.service.button_arbiter.input_scheduler = self.service.input_scheduler
+
+    def teardown_method(self):
+        self.service.shutdown()
+        self.patcher.stop()
+
+    def phase(self):
+        return self.service.get_session().active_touches["t"].phase
+
+    def test_single_tap(self):
+        self.service.handle_touch_start(touch("touch_start"))
+        assert self.phase() == PHASE_PENDING_TAP
+
+        self.service.handle_touch_move(touch("touch_move", x=102))
+        assert self.phase() == PHASE_PENDING_TAP
+
+        result = self.service.handle_touch_end(touch("touch_end"))
+        assert result["action"] == "left_click"
+
+    def test_move_beyond_threshold_cancels_tap(self):
+        self.service.handle_touch_start(touch("touch_start"))
+        self.service.handle_touch_move(touch("touch_move", x=150))
+
+        assert self.phase() == PHASE_MOVING
+
+        result = self.service.handle_touch_end(touch("touch_end"))
+        assert "action" not in result
+        assert self.service.tap_recognizer.get_stats()["left_click"] == 0
+
+    def test_second_finger_switches_to_scrolling(self):
+        self.service.handle_touch_start(touch("touch_start"))
+        self.service.handle_touch_move(touch("touch_move", count=2, y=120))
+
+        assert self.phase() == PHASE_SCROLLING
+        self.service.input_scheduler.add_scroll.assert_called_once()
+
+    def test_drag_is_held_until_release(self):
+        service = self.service
+        service.handle_touch_start(touch("touch_start"))
+        service.handle_touch_move(touch("touch_move", count=3, x=150))
+        service.handle_touch_move(touch("touch_move", count=1, x=160))
+
+        assert self.phase() == PHASE_DRAGGING
+        assert service.get_session().is_dragging
+
+        result = service.handle_touch_end(touch("touch_end", count=1))
+
+        assert "action" not in result
+        released = service.input_scheduler.submit_after_flush.call_args.args
+        assert released == (service.mouse_controller.release, mouse.Button.left)
+        assert not service.get_session().is_dragging
+
+    def test_tap_then_press_and_move_drags(self):
+        service = self.service
+        service.handle_touch_start(touch("touch_start"))
+        service.handle_touch_end(touch("touch_end"))
+
+        service.handle_touch_start(touch("touch_start"))
+        service.handle_touch_move(touch("touch_move", x=150))
+
+        assert self.phase() == PHASE_DRAGGING
+        pressed = service.input_scheduler.submit_after_flush.call_args.args
+        assert pressed == (service.mouse_controller.press, mouse.Button.left)
+        assert service.tap_recognizer.get_stats()["tap_drags"] == 1
+
+        result = service.handle_touch_end(touch("touch_end"))
+        assert "action" not in result
+        assert not service.get_session().is_dragging
+
+    def test_move_after_drag_window_is_not_a_drag(self):
+        service = self.service
+        now = [0.0]
+        service.tap_recognizer.clock = lambda: now[0]
+        service.handle_touch_start(touch("touch_start"))
+        service.handle_touch_end(touch("touch_end"))
+
+        now[0] += TOUCHPAD_CONFIG["TAP_DRAG_WINDOW"] + 0.01
+        service.handle_touch_start(touch("touch_start"))
+        service.handle_touch_move(touch("touch_move", x=150))
+
+        assert self.phase() == PHASE_MOVING
+
+    def test_double_tap_clicks_twice(self):
+        service = self.service
+        service.injector = Mock()
+        for _ in range(2):
+            service.handle_touch_start(touch("touch_start"))
+            result = service.handle_touch_end(touch("touch_end"))
+            assert result["action"] == "left_click"
+
+        buttons = [call.args[1] for call in service.injector.submit.call_args_list]
+        assert buttons == [mouse.Button.left, mouse.Button.left]
+
+    def test_two_finger_tap_right_clicks(self):
+        service = self.service
+        service.injector = Mock()
+        service.handle_touch_start(touch("touch_start"))
+        service.handle_touch_start(touch("touch_start", count=2))
+
+        result = service.handle_touch_end(touch("touch_end", count=2))
+
+        assert result["action"] == "right_click"
+        assert service.injector.submit.call_args.args[1] == mouse.Button.right
+
+    def test_long_press_is_not_a_click(self):
+        service = self.service
+        service.injector = Mock()
+        service.handle_touch_start(touch("touch_start"))
+        service.get_session().active_touches["t"].start_time -= 1.0
+
+        result = service.handle_touch_end(touch("touch_end"))
+
+        assert "action" not in result
+        service.injector.submit.assert_not_called()
+        assert service.tap_recognizer.get_stats()["too_long"] == 1
+
+    def test_pinch_zooms_with_ctrl_wheel(self):
+        service = self.service
+        service.handle_touch_start(fingers("touch_start", (100, 100), (120, 100)))
+
+        result = service.handle_touch_move(
+            fingers("touch_move", (80, 100), (140, 100))
+        )
+
+        assert self.phase() == PHASE_PINCHING
+        assert result["gesture"] == "pinch"
+        pressed = service.input_scheduler.submit_after_flush.call_args.args
+        assert pressed == (service.keyboard_controller.press, Key.ctrl_l)
+        # 张开3倍，每1.2倍一格，向上滚动放大
+        _, steps = service.input_scheduler.add_scroll.call_args.args
+        assert steps == pytest.approx(math.log(3) / math.log(1.2))
+
+        service.handle_touch_end(fingers("touch_end", (80, 100), (140, 100)))
+
+        released = service.input_scheduler.submit_after_flush.call_args.args
+        assert released == (service.keyboard_controller.release, Key.ctrl_l)
+        assert not service.get_session().zoom_modifier_held
+        assert service.gesture_stats["pinches"] == 1
+
+    def test_overlapping_pinches_share_one_zoom_modifier(self):
+        service = self.service
+        for client_id in ("phone", "tablet"):
+            start = fingers("touch_start", (100, 100), (120, 100))
+            service.handle_touch_start(dict(start, client_id=client_id))
+            move = fingers("touch_move", (80, 100), (140, 100))
+            service.handle_touch_move(dict(move, client_id=client_id))
+
+        # 另一台设备的滚轮在 Ctrl 按住期间会变成缩放，不注入
+        service.input_scheduler.add_scroll.reset_mock()
+        service.handle_scroll({"client_id": "laptop", "dx": 0, "dy": 10})
+        service.input_scheduler.add_scroll.assert_not_called()
+        assert service.gesture_stats["scrolls_suppressed"] == 1
+
+        end = fingers("touch_end", (80, 100), (140, 100))
+        service.handle_touch_end(dict(end, client_id="phone"))
+
+        submit = service.input_scheduler.submit_after_flush
+        submitted = [call.args for call in submit.call_args_list]
+        assert submitted == [(service.keyboard_controller.press, Key.ctrl_l)]
+
+        service.handle_touch_end(dict(end, client_id="tablet"))
+
+        assert submit.call_args.args == (service.keyboard_controller.release, Key.ctrl_l)
+
+    def test_two_finger_scroll_follows_centroid(self):
+        service = self.service
+        service.handle_touch_start(fingers("touch_start", (100, 100), (140, 100)))
+
+        service.handle_touch_move(fingers("touch_move", (100, 130), (140, 130)))
+
+        assert self.phase() == PHASE_SCROLLING
+        scroll_dx, scroll_dy = service.input_scheduler.add_scroll.call_args.args
+        assert scroll_dx == 0
+        assert scroll_dy == -30 * TOUCHPAD_CONFIG["SCROLL_SENSITIVITY"]
+
+    @patch.dict(TOUCHPAD_CONFIG, SWIPE_CONFIG)
+    def test_three_finger_swipe_runs_hotkey_once(self):
+        service = self.service
+        service.hotkey_engine = Mock()
+        points = [(100, 100), (120, 100), (140, 100)]
+        service.handle_touch_start(fingers("touch_start", *points))
+
+        for step in (40, 80, 120):
+            service.handle_touch_move(
+                fingers("touch_move", *[(x - step, y) for x, y in points])
+            )
+
+        assert self.phase() == PHASE_SWIPING
+        service.hotkey_engine.execute.assert_called_once_with(
+            ["ctrl", "alt", "right"], "fast"
+        )
+        result = service.handle_touch_end(fingers("touch_end", *points))
+        assert "action" not in result
+        assert service.gesture_stats["swipes"] == 1
+
+    @patch.dict(TOUCHPAD_CONFIG, SWIPE_CONFIG)
+    def test_coalesced_frames_are_classified_together(self):
+        service = self.service
+        service.hotkey_engine = Mock()
+        points = [(100, 100), (120, 100), (140, 100)]
+        service.handle_touch_start(fingers("touch_start", *points))
+
+        event = fingers("touch_move", *[(x, y + 90) for x, y in points])
+        event["frames"] = [
+            fingers("touch_move", *[(x, y + step) for x, y in points])["touches"]
+            for step in (30, 60)
+        ]
+        service.handle_touch_move(event)
+
+        service.hotkey_engine.execute.assert_called_once_with(
+            ["win", "d"], "fast"
+        )
+
+    def test_invalid_transition(self):
+        state = TouchState("t", 0, 0, 0)
+        state.transition(PHASE_DRAGGING)
+
+        with pytest.raises(InvalidTransition):
+            state.transition(PHASE_MOVING)
+
+    def test_touch_state_is_slotted(self):
+        assert not hasattr(TouchState("t", 0, 0, 0), "__dict__")
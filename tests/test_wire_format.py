@@ -0,0 +1,123 @@
+"""
+二进制输入协议模块测试
+"""
+
+import sys
+import os
+import struct
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.wire_format import (
+    FLAG_ACK,
+    FLAG_MULTI_POINT,
+    HEADER,
+    WireFormatError,
+    decode_packet,
+    encode_packet,
+)
+
+
+def touch_event(action, x, y, timestamp, touch_count=1):
+    event = {
+        "channel": "touchpad",
+        "action": action,
+        "touch_id": "touch_42",
+        "touch_count": touch_count,
+        "timestamp": timestamp,
+    }
+    if action == "touch_end":
+        event["position"] = {"x": x, "y": y}
+    else:
+        event["touches"] = [{"id": 0, "x": x, "y": y}]
+    return event
+
+
+class TestWireFormat:
+    """测试二进制协议编解码"""
+
+    def test_round_trip_mixed_events(self):
+        events = [
+            touch_event("touch_start", 100, 200, 1000.0),
+            touch_event("touch_move", 95, 230, 1016.0, touch_count=2),
+            {"channel": "touchpad", "action": "scroll", "dx": -4, "dy": 120, "timestamp": 1020.0},
+            {"channel": "keyboard", "action": "press", "key": "ctrl", "timestamp": 1030.0},
+            {"channel": "keyboard", "action": "type", "text": "你好", "timestamp": 1040.0},
+            {"channel": "keyboard", "action": "hotkey", "keys": ["ctrl", "+"], "timestamp": 1050.0},
+            touch_event("touch_end", 90, 231, 1060.0),
+        ]
+
+        header, decoded = decode_packet(encode_packet(events, seq=9, flags=FLAG_ACK))
+
+        assert header["seq"] == 9
+        assert header["flags"] & FLAG_ACK
+        assert decoded == events
+
+    def test_invalid_utf8_payload(self):
+        packet = HEADER.pack(1, 0, 1, 0, 0.0) + struct.pack("<BxHH", 0x12, 0, 2)
+
+        with pytest.raises(WireFormatError):
+            decode_packet(packet + b"\xff\xfe")
+
+    def test_non_numeric_touch_id_encodes_as_zero(self):
+        event = touch_event("touch_move", 1, 2, 0.0)
+        event["touch_id"] = "t-a"
+
+        _, decoded = decode_packet(encode_packet([event]))
+
+        assert decoded[0]["touch_id"] == "touch_0"
+
+    def test_round_trip_multi_point(self):
+        start = touch_event("touch_start", 100, 200, 1000.0, touch_count=2)
+        start["touches"].append({"id": 1, "x": 160, "y": 180})
+        move = touch_event("touch_move", 90, 210, 1008.0, touch_count=3)
+        move["touches"] += [{"id": 1, "x": 170, "y": 170}, {"id": 2, "x": 0, "y": 0}]
+        events = [start, move, touch_event("touch_end", 90, 210, 1016.0)]
+
+        packet = encode_packet(events)
+        header, decoded = decode_packet(packet)
+
+        assert header["flags"] & FLAG_MULTI_POINT
+        assert decoded == events
+        # 每个开始、移动事件多1字节点数和每个附加点4字节
+        assert len(packet) == HEADER.size + 3 * 10 + 2 + 3 * 4
+
+    def test_single_point_packet_has_no_multi_point_flag(self):
+        header, _ = decode_packet(encode_packet([touch_event("touch_move", 1, 2, 0.0)]))
+
+        assert not header["flags"] & FLAG_MULTI_POINT
+
+    def test_touch_event_is_compact(self):
+        packet = encode_packet([touch_event("touch_move", 10, 10, 0.0)])
+
+        assert len(packet) == HEADER.size + 10
+
+    def test_coordinates_are_delta_encoded(self):
+        packet = encode_packet(
+            [touch_event("touch_move", 1000, 1000, 0.0), touch_event("touch_move", 1003, 998, 0.0)]
+        )
+
+        second_dx, second_dy = struct.unpack_from("<hh", packet, HEADER.size + 10 + 6)
+        assert (second_dx, second_dy) == (3, -2)
+
+    def test_unsupported_version(self):
+        packet = bytearray(encode_packet([]))
+        packet[0] = 99
+
+        with pytest.raises(WireFormatError):
+            decode_packet(bytes(packet))
+
+    def test_truncated_packet(self):
+        packet = encode_packet([touch_event("touch_move", 10, 10, 0.0)])
+
+        with pytest.raises(WireFormatError):
+            decode_packet(packet[:-3])
+
+    def test_unknown_message_type(self):
+        packet = bytearray(encode_packet([touch_event("touch_move", 10, 10, 0.0)]))
+        packet[HEADER.size] = 0x7F
+
+        with pytest.raises(WireFormatError):
+            decode_packet(bytes(packet))